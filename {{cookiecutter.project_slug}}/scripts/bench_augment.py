@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Benchmark batched vs per-sample augmentation for {{cookiecutter.project_name}}.
+
+Runs the same crop/flip/noise/normalize pipeline (BatchAugment) once per
+sample, as a Dataset ``__getitem__`` transform would, and once over the whole
+batch, as BaseDataModule's ``batch_transform`` does, and reports samples/s.
+
+Usage:
+    # CPU and, if available, CUDA with CIFAR-sized images
+    python scripts/bench_augment.py
+
+    # ImageNet-sized crops, larger batch
+    python scripts/bench_augment.py --image-size 256 --crop-size 224 --batch-size 256
+
+    # Machine-readable results
+    python scripts/bench_augment.py --json results.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.data.transforms import BatchAugment
+
+
+def sync(device: torch.device) -> None:
+    """Wait for queued kernels so timings cover the actual work."""
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def time_per_sample(augment: BatchAugment, batch: torch.Tensor, repeats: int) -> float:
+    """Seconds per batch when each sample is augmented on its own."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        torch.cat([augment(sample[None]) for sample in batch])
+    sync(batch.device)
+    return (time.perf_counter() - start) / repeats
+
+
+def time_batched(augment: BatchAugment, batch: torch.Tensor, repeats: int) -> float:
+    """Seconds per batch when the whole batch is augmented at once."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        augment(batch)
+    sync(batch.device)
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched vs per-sample augmentation")
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--channels", type=int, default=3)
+    parser.add_argument("--image-size", type=int, default=32)
+    parser.add_argument("--crop-size", type=int, default=32)
+    parser.add_argument("--padding", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=20, help="Timed batches per mode")
+    parser.add_argument("--devices", nargs="+", help="Devices to test (default: cpu and cuda)")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    devices = args.devices or ["cpu"] + (["cuda"] if torch.cuda.is_available() else [])
+    augment = BatchAugment(
+        crop_size=args.crop_size,
+        padding=args.padding,
+        hflip_p=0.5,
+        noise_std=0.01,
+        mean=[0.5] * args.channels,
+        std=[0.25] * args.channels,
+        seed=0,
+    )
+    shape = (args.batch_size, args.channels, args.image_size, args.image_size)
+
+    results = []
+    print(f"Batch {tuple(shape)}, crop {args.crop_size} (padding {args.padding})")
+    print(f"{'device':<8} {'per-sample':>14} {'batched':>14} {'speedup':>9}")
+    for name in devices:
+        device = torch.device(name)
+        batch = torch.randint(0, 256, shape, dtype=torch.uint8, device=device)
+
+        # Warm up kernels and allocator before timing
+        time_per_sample(augment, batch, 1)
+        time_batched(augment, batch, 2)
+
+        per_sample = time_per_sample(augment, batch, args.repeats)
+        batched = time_batched(augment, batch, args.repeats)
+        result = {
+            "device": name,
+            "per_sample_samples_per_s": args.batch_size / per_sample,
+            "batched_samples_per_s": args.batch_size / batched,
+            "speedup": per_sample / batched,
+        }
+        results.append(result)
+        print(
+            f"{name:<8} {result['per_sample_samples_per_s']:>12.0f}/s "
+            f"{result['batched_samples_per_s']:>12.0f}/s {result['speedup']:>8.1f}x"
+        )
+
+    if args.json:
+        report = {"config": vars(args), "results": results}
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
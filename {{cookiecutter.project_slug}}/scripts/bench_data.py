@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+"""
+Benchmark the input pipeline of {{cookiecutter.project_name}} without a model.
+
+Builds the datamodule from the same YAML config as the train script, iterates
+its train/val loaders and reports samples/s, batches/s, time to first batch,
+per-worker batch latency percentiles and RSS growth (main process and
+workers). Results can be written as JSON and compared against an earlier run
+to catch input-pipeline regressions.
+
+Usage:
+    # One pass over the train and val loaders
+    python scripts/bench_data.py --config configs/{{cookiecutter.model_name}}.yaml
+
+    # Three epochs of at most 200 batches, train loader only
+    python scripts/bench_data.py --config configs/{{cookiecutter.model_name}}.yaml --splits train --epochs 3 --max-batches 200
+
+    # Track over time: save results, later compare against them
+    python scripts/bench_data.py --config configs/{{cookiecutter.model_name}}.yaml --json bench/baseline.json
+    python scripts/bench_data.py --config configs/{{cookiecutter.model_name}}.yaml --baseline bench/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import torch
+from torch.utils.data import DataLoader, IterableDataset
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.data import BaseDataModule
+from {{cookiecutter.package_name}}.data.profiling import (
+    WorkerLatencyRecorder,
+    measure_loader,
+    rss_bytes,
+    worker_rss_bytes,
+)
+from {{cookiecutter.package_name}}.utils import instantiate, load_config
+
+MB = 1024 * 1024
+
+
+class MemorySampler:
+    """Tracks peak RSS of the main process and of the loader workers."""
+
+    def __init__(self, interval_s: float = 0.5):
+        self.interval_s = interval_s
+        self.start = rss_bytes() or 0
+        self.peak = self.start
+        self.peak_workers = 0
+        self._last = 0.0
+
+    def __call__(self, batches: int) -> None:
+        now = time.perf_counter()
+        if batches > 1 and now - self._last < self.interval_s:
+            return
+        self._last = now
+        self.peak = max(self.peak, rss_bytes() or 0)
+        self.peak_workers = max(self.peak_workers, worker_rss_bytes())
+
+    def summary(self) -> Dict[str, float]:
+        end = rss_bytes() or 0
+        return {
+            "main_start_mb": self.start / MB,
+            "main_end_mb": end / MB,
+            "main_peak_mb": max(self.peak, end) / MB,
+            "main_growth_mb": (end - self.start) / MB,
+            "workers_peak_mb": self.peak_workers / MB,
+        }
+
+
+def bench_split(
+    datamodule: BaseDataModule, split: str, epochs: int, max_batches: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    """Measure one split's loader over ``epochs`` passes (None if the split has no dataset)."""
+    attr = f"{split}_dataset"
+    dataset = getattr(datamodule, attr)
+    if dataset is None:
+        return None
+
+    # Per-worker latency needs a map-style dataset; streaming loaders report none
+    recorder = WorkerLatencyRecorder()
+    if not isinstance(dataset, IterableDataset):
+        setattr(datamodule, attr, recorder.wrap_dataset(dataset))
+    try:
+        loader = getattr(datamodule, f"{split}_dataloader")()
+    finally:
+        setattr(datamodule, attr, dataset)
+    torch_loader = getattr(loader, "loader", loader)  # unwrap DevicePrefetcher
+    if isinstance(torch_loader, DataLoader):
+        torch_loader.collate_fn = recorder.wrap_collate(torch_loader.collate_fn)
+
+    memory = MemorySampler()
+    results = []
+    for epoch in range(epochs):
+        stats = measure_loader(loader, max_batches=max_batches, on_batch=memory)
+        results.append({"epoch": epoch, **stats})
+
+    return {
+        "loader": type(loader).__name__,
+        "epochs": results,
+        "worker_latency": recorder.summary(),
+        "rss": memory.summary(),
+    }
+
+
+def print_split(split: str, result: Dict[str, Any]) -> None:
+    print(f"\n{split} ({result['loader']})")
+    for stats in result["epochs"]:
+        print(
+            f"  epoch {stats['epoch']}: {stats['samples_per_s']:>10.1f} samples/s "
+            f"{stats['batches_per_s']:>8.1f} batches/s  "
+            f"first batch {stats['time_to_first_batch_s']:.2f}s  ({stats['batches']} batches)"
+        )
+    for worker, stats in result["worker_latency"].items():
+        print(
+            f"  {worker:<10} p50 {stats['p50_ms']:>7.2f}ms  p90 {stats['p90_ms']:>7.2f}ms  "
+            f"p99 {stats['p99_ms']:>7.2f}ms  ({stats['batches']} batches)"
+        )
+    rss = result["rss"]
+    print(
+        f"  RSS main {rss['main_start_mb']:.0f} -> {rss['main_end_mb']:.0f} MB "
+        f"(peak {rss['main_peak_mb']:.0f}, growth {rss['main_growth_mb']:+.1f}), "
+        f"workers peak {rss['workers_peak_mb']:.0f} MB"
+    )
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print the last-epoch throughput change relative to a saved report."""
+    print("\nChange vs baseline (last epoch):")
+    for split, result in report["splits"].items():
+        old = baseline.get("splits", {}).get(split)
+        if result is None or old is None:
+            continue
+        new_rate = result["epochs"][-1]["samples_per_s"]
+        old_rate = old["epochs"][-1]["samples_per_s"]
+        change = (new_rate / old_rate - 1) * 100 if old_rate else float("nan")
+        print(f"  {split}: {old_rate:.1f} -> {new_rate:.1f} samples/s ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataLoader throughput without a model")
+    parser.add_argument("--config", required=True, help="Training config YAML")
+    parser.add_argument(
+        "--splits", nargs="+", default=["train", "val"], choices=["train", "val"],
+        help="Loaders to benchmark",
+    )
+    parser.add_argument("--epochs", type=int, default=1, help="Passes per loader")
+    parser.add_argument("--max-batches", type=int, help="Stop each pass after this many batches")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Earlier --json output to compare against")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    datamodule = instantiate(config["data"], BaseDataModule)
+    datamodule.prepare_data()
+    datamodule.setup("fit")
+
+    print(
+        f"Benchmarking {type(datamodule).__name__} (batch_size={datamodule.batch_size}, "
+        f"num_workers={datamodule.num_workers})"
+    )
+    splits = {}
+    for split in args.splits:
+        splits[split] = bench_split(datamodule, split, args.epochs, args.max_batches)
+        if splits[split] is None:
+            print(f"\n{split}: no dataset, skipped")
+        else:
+            print_split(split, splits[split])
+
+    report = {
+        "timestamp": time.time(),
+        "config": args.config,
+        "data": config["data"],
+        "epochs": args.epochs,
+        "max_batches": args.max_batches,
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "splits": splits,
+    }
+    if args.baseline:
+        compare(report, json.loads(args.baseline.read_text()))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Benchmark the optimizer step of {{cookiecutter.project_name}}.
+
+Times ``optimizer.step()`` for each AdamW implementation (for-loop, foreach
+and, on CUDA, fused) over the same parameters, with random gradients and no
+forward/backward, so the numbers isolate the optimizer. Parameters come from
+the model in the YAML config or, if it defines none, from a synthetic MLP
+with an embedding table. Use the result to pick ``model.init_args.optimizer_impl``.
+
+Usage:
+    # Optimizer of the configured model
+    python scripts/bench_optimizer.py --config configs/{{cookiecutter.model_name}}.yaml
+
+    # Synthetic 24 x 1024 MLP on the GPU, 200 timed steps
+    python scripts/bench_optimizer.py --width 1024 --depth 24 --device cuda --steps 200
+
+    # Save results for later comparison
+    python scripts/bench_optimizer.py --config configs/{{cookiecutter.model_name}}.yaml --json bench/optimizer.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import torch
+import torch.nn as nn
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.models.optim import build_optimizer
+from {{cookiecutter.package_name}}.utils import instantiate, load_config
+
+
+def synthetic_model(width: int, depth: int, vocab: int) -> nn.Module:
+    """MLP of ``depth`` Linear+LayerNorm blocks behind an embedding table."""
+    layers: List[nn.Module] = [nn.Embedding(vocab, width)]
+    for _ in range(depth):
+        layers += [nn.Linear(width, width), nn.LayerNorm(width)]
+    return nn.Sequential(*layers)
+
+
+def time_step(
+    model: nn.Module, implementation: str, warmup: int, steps: int, device: torch.device
+) -> Dict[str, float]:
+    """Mean and best time of one optimizer step, in ms."""
+    optimizer = build_optimizer(model, lr=1e-4, weight_decay=1e-2, implementation=implementation)
+    for param in model.parameters():
+        param.grad = torch.randn_like(param)
+
+    times = []
+    for i in range(warmup + steps):
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        optimizer.step()
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+        if i >= warmup:
+            times.append((time.perf_counter() - start) * 1e3)
+    return {"mean_ms": sum(times) / len(times), "min_ms": min(times)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AdamW implementations")
+    parser.add_argument("--config", help="Training config YAML (benchmarks its model)")
+    parser.add_argument("--width", type=int, default=512, help="Synthetic model width")
+    parser.add_argument("--depth", type=int, default=12, help="Synthetic model blocks")
+    parser.add_argument("--vocab", type=int, default=32000, help="Synthetic embedding rows")
+    parser.add_argument(
+        "--device", default="cuda" if torch.cuda.is_available() else "cpu", help="Device"
+    )
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed steps per variant")
+    parser.add_argument("--steps", type=int, default=50, help="Timed steps per variant")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    device = torch.device(args.device)
+    model = None
+    if args.config:
+        model = instantiate(load_config(args.config)["model"], BaseModel)
+        model.configure_model()
+        if not any(True for _ in model.parameters()):
+            print(f"{type(model).__name__} has no parameters, using the synthetic model")
+            model = None
+    if model is None:
+        model = synthetic_model(args.width, args.depth, args.vocab)
+    model.to(device)
+
+    num_params = sum(p.numel() for p in model.parameters())
+    num_tensors = sum(1 for _ in model.parameters())
+    print(f"Benchmarking {num_params / 1e6:.1f}M parameters in {num_tensors} tensors on {device}")
+
+    implementations = ["for-loop", "foreach"] + (["fused"] if device.type == "cuda" else [])
+    results = {}
+    for implementation in implementations:
+        results[implementation] = time_step(model, implementation, args.warmup, args.steps, device)
+    reference = results["for-loop"]["mean_ms"]
+    print(f"\n{'implementation':<16}{'mean ms':>10}{'min ms':>10}{'speedup':>10}")
+    for implementation, result in results.items():
+        print(
+            f"{implementation:<16}{result['mean_ms']:>10.2f}{result['min_ms']:>10.2f}"
+            f"{reference / result['mean_ms']:>9.2f}x"
+        )
+
+    if args.json:
+        report = {
+            "timestamp": time.time(),
+            "config": args.config,
+            "device": str(device),
+            "parameters": num_params,
+            "tensors": num_tensors,
+            "host": platform.node(),
+            "torch": torch.__version__,
+            "results": results,
+        }
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Load-test a running {{cookiecutter.project_name}} inference server.
+
+Opens ``--concurrency`` keep-alive connections, each sending random
+``/predict`` requests back to back (closed loop), and reports request
+latency percentiles and throughput for every concurrency level, plus how
+the server batched them (mean batch size and queue wait from ``/stats``).
+Start the server first with scripts/serve_{{cookiecutter.model_name}}.py.
+
+Usage:
+    # 1, 8 and 32 concurrent clients, 1000 requests each, 128-feature inputs
+    python scripts/bench_serve.py --input-shape 128 --concurrency 1 8 32
+
+    # Over a Unix socket, save the results
+    python scripts/bench_serve.py --unix-socket /tmp/{{cookiecutter.model_name}}.sock --input-shape 3 32 32 --requests 5000 --json bench/serve.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.serving import InferenceClient
+
+
+async def run_level(args: argparse.Namespace, concurrency: int) -> Dict[str, Any]:
+    """Send ``args.requests`` requests from ``concurrency`` clients."""
+    connect = dict(host=args.host, port=args.port, unix_socket=args.unix_socket)
+    clients = [await InferenceClient.connect(**connect) for _ in range(concurrency)]
+    # A small pool of payloads, serialized once, keeps the client side cheap
+    payloads = [
+        json.dumps({"inputs": torch.randn(*args.input_shape).tolist()}).encode()
+        for _ in range(16)
+    ]
+    latencies: List[float] = []
+    errors = 0
+    remaining = args.requests
+
+    async def worker(client: InferenceClient, index: int) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            status, _ = await client.request("POST", "/predict", payloads[index % len(payloads)])
+            latencies.append(time.perf_counter() - start)
+            errors += status != 200
+            index += concurrency
+
+    _, before = await clients[0].request("GET", "/stats")
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(client, i) for i, client in enumerate(clients)))
+    elapsed = time.perf_counter() - start
+    _, after = await clients[0].request("GET", "/stats")
+    for client in clients:
+        await client.close()
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e3
+    requests = after["requests"] - before["requests"]
+    batches = after["batches"] - before["batches"]
+    wait = after["mean_queue_wait_ms"] * after["requests"]
+    wait -= before["mean_queue_wait_ms"] * before["requests"]
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": float(p50),
+        "p90_ms": float(p90),
+        "p99_ms": float(p99),
+        "requests_per_s": len(latencies) / elapsed,
+        "mean_batch_size": requests / batches if batches else 0.0,
+        "mean_queue_wait_ms": wait / requests if requests else 0.0,
+    }
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    connect = dict(host=args.host, port=args.port, unix_socket=args.unix_socket)
+    client = await InferenceClient.connect(**connect)
+    # Warm up the model (and any lazy initialization) before timing
+    payload = {"inputs": torch.randn(*args.input_shape).tolist()}
+    for _ in range(args.warmup):
+        status, body = await client.request("POST", "/predict", payload)
+        if status != 200:
+            raise SystemExit(f"Server rejected the warmup request ({status}): {body}")
+    await client.close()
+
+    results = []
+    print(f"{'clients':>8}{'req/s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'batch':>8}")
+    for concurrency in args.concurrency:
+        r = await run_level(args, concurrency)
+        results.append(r)
+        print(
+            f"{r['concurrency']:>8}{r['requests_per_s']:>10.1f}{r['p50_ms']:>9.2f}"
+            f"{r['p90_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['mean_batch_size']:>8.1f}"
+            + (f"  ({r['errors']} errors)" if r["errors"] else "")
+        )
+    return {
+        "timestamp": time.time(),
+        "host": platform.node(),
+        "torch": torch.__version__,
+        "endpoint": args.unix_socket or f"{args.host}:{args.port}",
+        "input_shape": args.input_shape,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the inference server")
+    parser.add_argument("--host", default="127.0.0.1", help="Server address")
+    parser.add_argument("--port", type=int, default=8000, help="Server TCP port")
+    parser.add_argument("--unix-socket", help="Connect to this Unix socket instead of TCP")
+    parser.add_argument(
+        "--input-shape", type=int, nargs="+", required=True, help="Per-sample input shape"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Concurrent clients"
+    )
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per level")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests first")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    report = asyncio.run(bench(args))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
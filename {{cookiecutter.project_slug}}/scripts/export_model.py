@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Export a trained {{cookiecutter.project_name}} model and benchmark inference.
+
+Loads a Lightning checkpoint into the model class from the training config,
+exports it to TorchScript and ONNX, checks that each export reproduces the
+eager outputs, then measures p50/p90/p99 latency and throughput on the CPU
+for several batch sizes. Exports and a JSON report are written to the
+output directory.
+
+The input shape comes from the model's ``example_input_array`` if it sets
+one, otherwise from ``--input-shape`` (per sample, without the batch
+dimension).
+
+Usage:
+    # Export to TorchScript and ONNX, benchmark batch sizes 1, 8 and 32
+    python scripts/export_model.py --config configs/{{cookiecutter.model_name}}.yaml --ckpt tmp/lightning_logs/version_0/checkpoints/last.ckpt --input-shape 3 224 224
+
+    # TorchScript only, EMA weights, 4 inference threads
+    python scripts/export_model.py --config configs/{{cookiecutter.model_name}}.yaml --ckpt <path> --input-shape 128 --formats torchscript --ema --threads 4
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}} import paths
+from {{cookiecutter.package_name}}.models.export import (
+    EXPORT_FORMATS,
+    benchmark,
+    check_outputs,
+    eager_runner,
+    export_onnx,
+    export_torchscript,
+    load_checkpoint,
+    onnx_runner,
+    torchscript_runner,
+)
+from {{cookiecutter.package_name}}.utils import load_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a checkpoint and benchmark inference")
+    parser.add_argument("--config", required=True, help="Training config YAML (model class)")
+    parser.add_argument("--ckpt", required=True, help="Lightning checkpoint to export")
+    parser.add_argument("--input-shape", type=int, nargs="+", help="Per-sample input shape")
+    parser.add_argument(
+        "--formats", nargs="+", default=list(EXPORT_FORMATS), choices=EXPORT_FORMATS,
+        help="Export formats",
+    )
+    parser.add_argument("--ema", action="store_true", help="Export the EMA weights")
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 8, 32], help="Benchmarked batch sizes"
+    )
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed calls per batch size")
+    parser.add_argument("--iters", type=int, default=100, help="Timed calls per batch size")
+    parser.add_argument("--threads", type=int, help="CPU threads for inference")
+    parser.add_argument("--rtol", type=float, default=1e-4, help="Relative tolerance vs eager")
+    parser.add_argument("--atol", type=float, default=1e-5, help="Absolute tolerance vs eager")
+    parser.add_argument(
+        "--output-dir", type=Path, help="Where to write exports and report.json "
+        "(default: <output root>/exports/<checkpoint name>)",
+    )
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    config = load_config(args.config)
+    model = load_checkpoint(config["model"]["class_path"], args.ckpt, ema=args.ema)
+
+    example = getattr(model, "example_input_array", None)
+    if example is not None:
+        input_shape = list(example.shape[1:])
+    elif args.input_shape:
+        input_shape = args.input_shape
+    else:
+        parser.error("the model has no example_input_array; pass --input-shape")
+
+    def make_input(batch_size: int) -> torch.Tensor:
+        return torch.randn(batch_size, *input_shape)
+
+    output_dir = args.output_dir or paths.EXPORTS / Path(args.ckpt).stem
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Batch > 1 so the exporters keep the batch dimension dynamic
+    trace_input = make_input(2)
+    check_inputs = [make_input(batch_size) for batch_size in sorted({1, *args.batch_sizes})]
+
+    runners = {"eager": eager_runner(model)}
+    report = {
+        "timestamp": time.time(),
+        "config": args.config,
+        "checkpoint": args.ckpt,
+        "ema": args.ema,
+        "input_shape": input_shape,
+        "host": platform.node(),
+        "torch": torch.__version__,
+        "threads": torch.get_num_threads(),
+        "exports": {},
+        "benchmarks": {},
+    }
+    for export_format in args.formats:
+        if export_format == "torchscript":
+            path = export_torchscript(model, trace_input, output_dir / "model.pt")
+            runners[export_format] = torchscript_runner(path)
+        else:
+            path = export_onnx(model, trace_input, output_dir / "model.onnx")
+            runners[export_format] = onnx_runner(path, args.threads)
+        error = check_outputs(
+            runners["eager"], runners[export_format], check_inputs, args.rtol, args.atol
+        )
+        report["exports"][export_format] = {"path": str(path), "max_abs_error": error}
+        print(f"{export_format}: wrote {path}, max |diff| vs eager {error:.2e}")
+
+    print(f"\n{'runtime':<14}{'batch':>7}{'p50 ms':>10}{'p99 ms':>10}{'samples/s':>12}")
+    for name, runner in runners.items():
+        results = benchmark(runner, make_input, args.batch_sizes, args.warmup, args.iters)
+        report["benchmarks"][name] = results
+        for r in results:
+            print(
+                f"{name:<14}{r['batch_size']:>7}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+                f"{r['samples_per_s']:>12.1f}"
+            )
+
+    report_path = output_dir / "report.json"
+    report_path.write_text(json.dumps(report, indent=2))
+    print(f"\nWrote {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Inspect and prune the preprocessed feature cache of {{cookiecutter.project_name}}.
+
+Entries are created by ``FeatureCache.get_or_build()`` during training and
+live under ``paths.FEATURE_CACHE`` ({{cookiecutter.package_name.upper()}}_OUTPUT_DIR/feature_cache).
+
+Usage:
+    # List entries with their size, sample count and last use
+    python scripts/feature_cache.py list
+
+    # Keep the cache under 50 GB, dropping least recently used entries
+    python scripts/feature_cache.py prune --max-size-gb 50
+
+    # Drop entries unused for two weeks, or specific entries
+    python scripts/feature_cache.py prune --older-than-days 14
+    python scripts/feature_cache.py prune --key 3f2a9c0d1e4b5a6f7c8d9e0f
+
+    # Drop everything
+    python scripts/feature_cache.py prune --all
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.data.feature_cache import FeatureCache
+
+
+def format_bytes(num_bytes: float) -> str:
+    """Human-readable size."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+def list_entries(cache: FeatureCache, as_json: bool) -> None:
+    """Print the cache contents, most recently used first."""
+    entries = cache.entries()
+    if as_json:
+        print(json.dumps(entries, indent=2, default=str))
+        return
+
+    total = format_bytes(sum(entry["size_bytes"] for entry in entries))
+    print(f"Feature cache at {cache.root}: {len(entries)} entries, {total}")
+    for entry in entries:
+        days = (time.time() - entry["last_used"]) / 86400
+        print(
+            f"  {entry['key']}  {format_bytes(entry['size_bytes']):>10}  "
+            f"{entry['num_samples']:>9} samples  used {days:.1f}d ago  {entry['source']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the preprocessed feature cache")
+    parser.add_argument("--root", type=Path, help="Cache directory (default: paths.FEATURE_CACHE)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="Show entries and total size")
+    list_parser.add_argument("--json", action="store_true", help="Print entries as JSON")
+
+    prune_parser = subparsers.add_parser("prune", help="Delete entries")
+    prune_parser.add_argument("--max-size-gb", type=float, help="Shrink the cache to this size")
+    prune_parser.add_argument(
+        "--older-than-days", type=float, help="Delete entries unused for this many days"
+    )
+    prune_parser.add_argument("--key", action="append", help="Delete this entry (repeatable)")
+    prune_parser.add_argument("--all", action="store_true", help="Delete every entry")
+    args = parser.parse_args()
+
+    cache = FeatureCache(args.root)
+    if args.command == "list":
+        list_entries(cache, args.json)
+        return
+
+    if args.all:
+        removed = cache.prune(max_bytes=0)
+    elif args.max_size_gb is None and args.older_than_days is None and not args.key:
+        prune_parser.error("Give --max-size-gb, --older-than-days, --key or --all")
+    else:
+        removed = cache.prune(
+            max_bytes=int(args.max_size_gb * 1024**3) if args.max_size_gb is not None else None,
+            older_than_s=args.older_than_days * 86400 if args.older_than_days is not None else None,
+            keys=args.key,
+        )
+
+    freed = sum(entry["size_bytes"] for entry in removed)
+    print(f"Removed {len(removed)} entries, freed {format_bytes(freed)}")
+    print(f"Cache is now {format_bytes(cache.total_bytes())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Find the largest batch size for {{cookiecutter.project_name}} on this machine.
+
+Builds the model and datamodule from the training config, runs a few real
+training steps at growing batch sizes (binary search up to the first
+out-of-memory, or up to a RAM budget on CPU) and writes the recommended
+batch size and gradient accumulation to an override YAML that the train
+script layers on top of the base config. Results are cached per hardware and
+model/data config, so rerunning on the same machine returns immediately.
+
+Usage:
+    # Search and write configs/{{cookiecutter.model_name}}_batch_size.yaml
+    python scripts/find_batch_size.py --config configs/{{cookiecutter.model_name}}.yaml
+
+    # Reach an effective batch of 1024 with gradient accumulation
+    python scripts/find_batch_size.py --config configs/{{cookiecutter.model_name}}.yaml --target-batch-size 1024
+
+    # CPU: stay within 16 GB of RAM; ignore any cached result
+    python scripts/find_batch_size.py --config configs/{{cookiecutter.model_name}}.yaml --ram-budget-gb 16 --force
+
+    # Train with the result
+    python scripts/train_{{cookiecutter.model_name}}.py fit --config configs/{{cookiecutter.model_name}}.yaml --config configs/{{cookiecutter.model_name}}_batch_size.yaml
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.data import BaseDataModule
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.utils import instantiate, load_config, write_overrides
+from {{cookiecutter.package_name}}.utils.batch_size import (
+    cache_path,
+    find_batch_size,
+    load_cached,
+    probe_device,
+    save_cached,
+)
+
+# Trainer settings that affect memory per sample and carry over to the probe
+PROBE_TRAINER_ARGS = ("accelerator", "precision", "gradient_clip_val")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the largest batch size that fits")
+    parser.add_argument("--config", required=True, help="Training config YAML")
+    parser.add_argument(
+        "--output",
+        default="configs/{{cookiecutter.model_name}}_batch_size.yaml",
+        help="Where to write the override YAML",
+    )
+    parser.add_argument("--target-batch-size", type=int, help="Effective batch to reach")
+    parser.add_argument("--max-batch-size", type=int, help="Upper bound for the search")
+    parser.add_argument("--ram-budget-gb", type=float, help="CPU only: peak RSS allowed")
+    parser.add_argument(
+        "--margin", type=float, default=0.1, help="Fraction taken off the largest fitting batch"
+    )
+    parser.add_argument("--steps", type=int, default=2, help="Training steps per probe")
+    parser.add_argument("--force", action="store_true", help="Search even if a result is cached")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    trainer_config = config.get("trainer") or {}
+    trainer_kwargs = {k: trainer_config[k] for k in PROBE_TRAINER_ARGS if k in trainer_config}
+    device = probe_device(trainer_kwargs)
+    options = {
+        "max_batch_size": args.max_batch_size,
+        "ram_budget_gb": None if device.type == "cuda" else args.ram_budget_gb,
+        "margin": args.margin,
+        "target_batch_size": args.target_batch_size,
+    }
+    cache = cache_path(config, device, **options)
+
+    result = None if args.force else load_cached(cache)
+    if result is not None:
+        print(f"Using cached result {cache} (--force to search again)")
+    else:
+        model = instantiate(config["model"], BaseModel)
+        datamodule = instantiate(config["data"], BaseDataModule)
+        print(f"Searching batch size for {type(model).__name__} on {device}")
+        result = find_batch_size(
+            model,
+            datamodule,
+            trainer_kwargs=trainer_kwargs,
+            max_batch_size=args.max_batch_size,
+            ram_budget_bytes=int(args.ram_budget_gb * 2**30) if args.ram_budget_gb else None,
+            margin=args.margin,
+            target_batch_size=args.target_batch_size,
+            steps=args.steps,
+            log=print,
+        )
+        save_cached(cache, result)
+
+    header = (
+        f"Batch size found by scripts/find_batch_size.py for {args.config} on {result.device}\n"
+        f"Largest fitting batch {result.max_batch_size}, effective batch "
+        f"{result.batch_size * result.accumulate_grad_batches}"
+    )
+    output = write_overrides(args.output, result.settings(), header=header)
+
+    print(f"\nLargest batch that fits: {result.max_batch_size}")
+    print(f"  batch_size: {result.batch_size}")
+    print(f"  accumulate_grad_batches: {result.accumulate_grad_batches}")
+    print(f"\nWrote {output}. Train with:")
+    print("-" * 60)
+    print(f"python scripts/train_{{cookiecutter.model_name}}.py fit --config {args.config} --config {output}")
+
+
+if __name__ == "__main__":
+    main()
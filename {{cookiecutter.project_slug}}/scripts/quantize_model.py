@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""
+Quantize a trained {{cookiecutter.project_name}} model to int8 for CPU inference.
+
+Loads a Lightning checkpoint, applies dynamic and/or static post-training
+int8 quantization (static mode calibrates on the first validation batches),
+and evaluates every variant on later validation batches. It reports the
+output drift and accuracy delta against fp32, the model size reduction and
+the CPU latency/throughput speedup, saves each quantized model as TorchScript
+and writes a JSON report.
+
+Usage:
+    # Dynamic and static int8, calibrated on 32 validation batches
+    python scripts/quantize_model.py --config configs/{{cookiecutter.model_name}}.yaml --ckpt <path>
+
+    # Dynamic only, evaluate on 100 batches, 4 inference threads
+    python scripts/quantize_model.py --config configs/{{cookiecutter.model_name}}.yaml --ckpt <path> --modes dynamic --eval-batches 100 --threads 4
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}} import paths
+from {{cookiecutter.package_name}}.data import BaseDataModule
+from {{cookiecutter.package_name}}.models.export import (
+    benchmark,
+    eager_runner,
+    export_torchscript,
+    load_checkpoint,
+)
+from {{cookiecutter.package_name}}.models.quantize import (
+    QUANT_MODES,
+    compare_outputs,
+    model_size_bytes,
+    quantize_dynamic,
+    quantize_static,
+    split_batch,
+)
+from {{cookiecutter.package_name}}.utils import instantiate, load_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Post-training int8 quantization")
+    parser.add_argument("--config", required=True, help="Training config YAML")
+    parser.add_argument("--ckpt", required=True, help="Lightning checkpoint to quantize")
+    parser.add_argument(
+        "--modes", nargs="+", default=list(QUANT_MODES), choices=QUANT_MODES,
+        help="Quantization modes",
+    )
+    parser.add_argument("--ema", action="store_true", help="Quantize the EMA weights")
+    parser.add_argument(
+        "--calibration-batches", type=int, default=32, help="Validation batches for calibration"
+    )
+    parser.add_argument(
+        "--eval-batches", type=int, default=50, help="Validation batches for evaluation"
+    )
+    parser.add_argument("--backend", default="x86", help="Quantized engine (x86, fbgemm, qnnpack)")
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 8, 32], help="Benchmarked batch sizes"
+    )
+    parser.add_argument("--iters", type=int, default=100, help="Timed calls per batch size")
+    parser.add_argument("--threads", type=int, help="CPU threads for inference")
+    parser.add_argument(
+        "--output-dir", type=Path, help="Where to write models and report.json "
+        "(default: <output root>/exports/<checkpoint name>/int8)",
+    )
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    config = load_config(args.config)
+    model = load_checkpoint(config["model"]["class_path"], args.ckpt, ema=args.ema)
+    datamodule = instantiate(config["data"], BaseDataModule, num_workers=0)
+    datamodule.prepare_data()
+    datamodule.setup("fit")
+
+    # Calibrate and evaluate on disjoint slices of the validation set
+    total = args.calibration_batches + args.eval_batches
+    batches = list(islice(datamodule.val_dataloader(), total))
+    calibration = [split_batch(b)[0] for b in batches[: args.calibration_batches]]
+    evaluation = batches[args.calibration_batches :] or batches
+    if len(batches) <= args.calibration_batches:
+        print("Validation set too small to hold out; evaluating on the calibration batches")
+    sample = split_batch(evaluation[0])[0]
+
+    def make_input(batch_size: int) -> torch.Tensor:
+        repeats = math.ceil(batch_size / len(sample))
+        return sample.repeat(repeats, *[1] * (sample.ndim - 1))[:batch_size]
+
+    output_dir = args.output_dir or paths.EXPORTS / Path(args.ckpt).stem / "int8"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    fp32_size = model_size_bytes(model)
+    fp32_bench = benchmark(eager_runner(model), make_input, args.batch_sizes, iters=args.iters)
+    report = {
+        "timestamp": time.time(),
+        "config": args.config,
+        "checkpoint": args.ckpt,
+        "ema": args.ema,
+        "backend": args.backend,
+        "calibration_batches": len(calibration),
+        "eval_batches": len(evaluation),
+        "host": platform.node(),
+        "torch": torch.__version__,
+        "threads": torch.get_num_threads(),
+        "fp32": {"size_bytes": fp32_size, "benchmark": fp32_bench},
+        "int8": {},
+    }
+
+    for mode in args.modes:
+        if mode == "dynamic":
+            quantized = quantize_dynamic(model)
+        else:
+            quantized = quantize_static(model, calibration, backend=args.backend)
+        path = export_torchscript(quantized, sample, output_dir / f"model_{mode}.pt")
+        results = benchmark(eager_runner(quantized), make_input, args.batch_sizes, iters=args.iters)
+        for fp32, int8 in zip(fp32_bench, results):
+            int8["speedup"] = fp32["mean_ms"] / int8["mean_ms"]
+        size = model_size_bytes(quantized)
+        report["int8"][mode] = {
+            "path": str(path),
+            "size_bytes": size,
+            "size_ratio": size / fp32_size,
+            "accuracy": compare_outputs(model, quantized, evaluation),
+            "benchmark": results,
+        }
+
+    print(f"\n{'variant':<10}{'size MB':>9}{'max |diff|':>12}{'acc delta':>11}", end="")
+    print("".join(f"{'speedup@' + str(b):>12}" for b in args.batch_sizes))
+    print(f"{'fp32':<10}{fp32_size / 2**20:>9.2f}{'':>12}{'':>11}", end="")
+    print("".join(f"{'1.00x':>12}" for _ in args.batch_sizes))
+    for mode, result in report["int8"].items():
+        accuracy = result["accuracy"]
+        delta = accuracy.get("accuracy_delta")
+        print(
+            f"{mode:<10}{result['size_bytes'] / 2**20:>9.2f}{accuracy['max_abs_error']:>12.2e}"
+            f"{'n/a' if delta is None else f'{delta:+.4f}':>11}",
+            end="",
+        )
+        print("".join(f"{r['speedup']:>11.2f}x" for r in result["benchmark"]))
+
+    report_path = output_dir / "report.json"
+    report_path.write_text(json.dumps(report, indent=2))
+    print(f"\nWrote {report_path}")
+
+
+if __name__ == "__main__":
+    main()
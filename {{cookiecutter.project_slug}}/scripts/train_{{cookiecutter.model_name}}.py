@@ -3,6 +3,7 @@
 {{cookiecutter.project_name}} Training Script using LightningReflowCLI.
 
 This script provides pause/resume functionality and maintains deterministic training.
+A StepTimer callback is registered by default and logs step phase timings as time/*.
 
 Usage:
     # Training with config
@@ -21,19 +22,25 @@ Usage:
 import sys
 from pathlib import Path
 
-import torch
-
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from lightning_reflow import LightningReflowCLI
-from {{cookiecutter.package_name}}.models import BaseModel
-from {{cookiecutter.package_name}}.data import BaseDataModule
-
 
 def main():
     """Main training entry point using LightningReflowCLI."""
+    from {{cookiecutter.package_name}} import paths
+
+    # Before importing Lightning, which sets TORCHINDUCTOR_CACHE_DIR to Inductor's default
+    paths.setup_environment()
+
+    # Imported here, not at module level, so importing this script stays cheap
+    import torch
+    from lightning_reflow import LightningReflowCLI
+    from {{cookiecutter.package_name}}.callbacks import StepTimer
+    from {{cookiecutter.package_name}}.models import BaseModel
+    from {{cookiecutter.package_name}}.data import BaseDataModule
+
     # Set CUDNN settings for determinism (must be set BEFORE any CUDA operations)
     torch.backends.cudnn.deterministic = True
     torch.backends.cudnn.benchmark = False
@@ -48,6 +55,8 @@ def main():
         subclass_mode_model=True,  # Allow nested config instantiation
         subclass_mode_data=True,  # Allow nested config instantiation
         run=True,  # Start training immediately
+        # Added to any callbacks from the config; a StepTimer configured there replaces it
+        trainer_defaults={"callbacks": [StepTimer()]},
     )
 
 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Tune DataLoader settings for {{cookiecutter.project_name}}.
+
+Builds the datamodule from the training config, sweeps num_workers,
+prefetch_factor and persistent_workers against the real train_dataset, and
+writes the fastest setting to an override YAML that the train script layers
+on top of the base config.
+
+Usage:
+    # Sweep and write configs/{{cookiecutter.model_name}}_dataloader.yaml
+    python scripts/tune_dataloader.py --config configs/{{cookiecutter.model_name}}.yaml
+
+    # Longer measurement, explicit candidates
+    python scripts/tune_dataloader.py --config configs/{{cookiecutter.model_name}}.yaml --max-batches 200 --workers 4 8 16
+
+    # Train with the tuned settings
+    python scripts/train_{{cookiecutter.model_name}}.py fit --config configs/{{cookiecutter.model_name}}.yaml --config configs/{{cookiecutter.model_name}}_dataloader.yaml
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.data import BaseDataModule
+from {{cookiecutter.package_name}}.data.autotune import autotune_dataloader
+from {{cookiecutter.package_name}}.utils import instantiate, load_config, write_overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autotune DataLoader worker settings")
+    parser.add_argument("--config", required=True, help="Training config YAML")
+    parser.add_argument(
+        "--output",
+        default="configs/{{cookiecutter.model_name}}_dataloader.yaml",
+        help="Where to write the override YAML",
+    )
+    parser.add_argument("--max-batches", type=int, default=50, help="Batches per measured epoch")
+    parser.add_argument("--workers", type=int, nargs="+", help="Candidate num_workers values")
+    parser.add_argument(
+        "--prefetch-factors", type=int, nargs="+", default=[2, 4, 8],
+        help="Candidate prefetch_factor values",
+    )
+    parser.add_argument("--json", type=Path, help="Also write all trial results to this JSON file")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    datamodule = instantiate(config["data"], BaseDataModule)
+    datamodule.prepare_data()
+    datamodule.setup("fit")
+
+    print(f"Tuning DataLoader for {type(datamodule).__name__} (batch_size={datamodule.batch_size})")
+    trials = autotune_dataloader(
+        datamodule,
+        worker_counts=args.workers,
+        prefetch_factors=args.prefetch_factors,
+        max_batches=args.max_batches,
+    )
+    best = trials[0]
+
+    overrides = {f"data.init_args.{key}": value for key, value in best.settings().items()}
+    header = (
+        f"DataLoader settings tuned by scripts/tune_dataloader.py for {args.config}\n"
+        f"{best.effective_samples_per_s:.1f} samples/s, worker startup {best.startup_s:.2f}s, "
+        f"epoch restart {best.restart_s:.2f}s"
+    )
+    output = write_overrides(args.output, overrides, header=header)
+
+    if args.json:
+        args.json.write_text(json.dumps([t.as_dict() for t in trials], indent=2))
+
+    print("\nBest settings:")
+    for key, value in best.settings().items():
+        print(f"  {key}: {value}")
+    print(f"\nWrote {output}. Train with:")
+    print("-" * 60)
+    print(f"python scripts/train_{{cookiecutter.model_name}}.py fit --config {args.config} --config {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Convert a directory of samples into packed shards for {{cookiecutter.project_name}}.
+
+Each sample file becomes one record: ``.npy`` files are stored as their array
+data, any other file is stored as raw bytes (decode it in your transform).
+Point ``data.init_args.shard_dir`` at the parent of the written split
+directories to train from the shards.
+
+Usage:
+    # One split per call
+    python scripts/write_shards.py data/raw/train data/shards/train
+    python scripts/write_shards.py data/raw/val data/shards/val
+
+    # Use class subdirectories (data/raw/train/<class>/<file>) as labels
+    python scripts/write_shards.py data/raw/train data/shards/train --labels-from-subdirs
+
+    # Only pick up some files, smaller shards
+    python scripts/write_shards.py data/raw/train data/shards/train --pattern "*.npy" --shard-size-mb 64
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from {{cookiecutter.package_name}}.data.shards import ShardWriter
+
+
+def load_sample(path: Path) -> np.ndarray:
+    """Load one sample file as an array."""
+    if path.suffix == ".npy":
+        return np.load(path)
+    return np.fromfile(path, dtype=np.uint8)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack a directory of samples into shards")
+    parser.add_argument("source", type=Path, help="Directory containing sample files")
+    parser.add_argument("output", type=Path, help="Output directory for shards and manifest")
+    parser.add_argument("--pattern", default="*", help="Glob pattern for sample files (default: *)")
+    parser.add_argument("--shard-size-mb", type=int, default=256, help="Target shard size in MB")
+    parser.add_argument(
+        "--labels-from-subdirs",
+        action="store_true",
+        help="Label each sample by its first-level subdirectory under source",
+    )
+    args = parser.parse_args()
+
+    files = sorted(p for p in args.source.rglob(args.pattern) if p.is_file())
+    if not files:
+        parser.error(f"No files matching '{args.pattern}' under {args.source}")
+
+    classes = None
+    if args.labels_from_subdirs:
+        # Files directly under source have no class directory and are skipped
+        files = [p for p in files if p.parent != args.source]
+        classes = sorted({p.relative_to(args.source).parts[0] for p in files})
+        class_to_idx = {name: i for i, name in enumerate(classes)}
+
+    writer = ShardWriter(
+        args.output,
+        shard_size_bytes=args.shard_size_mb * 1024 * 1024,
+        classes=classes,
+    )
+    with writer:
+        for i, path in enumerate(files):
+            label = class_to_idx[path.relative_to(args.source).parts[0]] if classes else None
+            writer.add(load_sample(path), label=label)
+            if (i + 1) % 10000 == 0:
+                print(f"  Packed {i + 1}/{len(files)} samples")
+
+    num_shards = len(list(args.output.glob("*.bin")))
+    print(f"Wrote {writer.num_samples} samples in {num_shards} shards to {args.output}")
+    if classes:
+        print(f"  {len(classes)} classes: {', '.join(classes)}")
+
+
+if __name__ == "__main__":
+    main()
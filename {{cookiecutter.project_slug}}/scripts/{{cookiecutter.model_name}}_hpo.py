@@ -20,20 +20,27 @@ Usage:
 
     # Quick test
     python scripts/{{cookiecutter.model_name}}_hpo.py --config configs/{{cookiecutter.model_name}}.yaml --n-trials 3 --trial-steps 100 --test-mode
+
+    # Load datasets once; trials that only change model/loader settings reuse them
+    python scripts/{{cookiecutter.model_name}}_hpo.py --config configs/{{cookiecutter.model_name}}.yaml --n-trials 100 --share-datasets
 """
 
 import copy
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Import paths early to set environment variables (WANDB_DIR, etc.)
-import {{cookiecutter.package_name}}.paths  # noqa: F401
+# Set environment variables (WANDB_DIR, etc.) before anything reads them
+from {{cookiecutter.package_name}} import paths
+
+paths.setup_environment()
 
 from LightningTune import HPORunner
 from {{cookiecutter.package_name}}.models import BaseModel
 from {{cookiecutter.package_name}}.data import BaseDataModule
+from {{cookiecutter.package_name}}.data.shared import SHARE_ENV
 from {{cookiecutter.package_name}}.hpo import EXCLUDED_CLI_PARAMS, PRODUCTION_DEFAULTS
 
 
@@ -74,6 +81,21 @@ def search_space(trial, config):
     # Example: Batch size (categorical)
     data["batch_size"] = trial.suggest_categorical("batch_size", [64, 128, 256])
 
+    # Example: Activation checkpointing, trading recompute for larger batches
+    # (uncomment and replace the batch_size example above; set the pattern to your blocks)
+    # checkpoint_every = trial.suggest_categorical("checkpoint_every", [0, 1, 2])
+    # if checkpoint_every:
+    #     model["activation_checkpointing"] = {
+    #         "modules": ["encoder.layers.*"],
+    #         "every_n": checkpoint_every,
+    #     }
+    #     data["batch_size"] = trial.suggest_categorical("batch_size_ckpt", [256, 512])
+    # else:
+    #     data["batch_size"] = trial.suggest_categorical("batch_size", [64, 128, 256])
+    # model["log_step_stats"] = True
+
+    # With callbacks.ThroughputMonitor in the config, trials log throughput/samples_per_sec
+    # and throughput/mfu, so architectures can be compared on efficiency as well as val_loss
     # Example: Architecture choice (uncomment and customize)
     # architecture = trial.suggest_categorical("architecture", ["small", "medium", "large"])
     # if architecture == "small":
@@ -108,6 +130,11 @@ if __name__ == "__main__":
     if "--trainer.enable_checkpointing" not in " ".join(sys.argv):
         sys.argv.extend(["--trainer.enable_checkpointing", "false"])
 
+    # Share loaded datasets between trials (see {{cookiecutter.package_name}}/data/shared.py)
+    if "--share-datasets" in sys.argv:
+        sys.argv.remove("--share-datasets")
+        os.environ[SHARE_ENV] = "1"
+
     # Use MedianPruner by default (less aggressive, good for multi-architecture search)
     if "--pruner" not in sys.argv:
         sys.argv.extend(["--pruner", "median"])
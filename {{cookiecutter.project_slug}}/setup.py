@@ -13,7 +13,7 @@ if requirements_file.exists():
     requirements = requirements_file.read_text().strip().split("\n")
     requirements = [r.strip() for r in requirements if r.strip() and not r.startswith("#")]
 else:
-    requirements = ["torch", "lightning"]
+    requirements = ["torch", "lightning", "numpy"]
 
 setup(
     name="{{cookiecutter.project_slug}}",
@@ -0,0 +1,63 @@
+"""Tests for the DataLoader autotuner and override configs."""
+
+import numpy as np
+import yaml
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, ShardWriter
+from {{cookiecutter.package_name}}.data.autotune import LoaderTrial, _rank, autotune_dataloader
+from {{cookiecutter.package_name}}.utils import instantiate, write_overrides
+
+
+def make_trial(workers, throughput, prefetch=2):
+    return LoaderTrial(workers, prefetch, True, 0.0, 0.0, throughput, throughput)
+
+
+class TestAutotune:
+    """Tests for trial ranking and the end-to-end sweep."""
+
+    def test_rank_prefers_cheaper_settings_within_tolerance(self):
+        """A setting within tolerance of the best wins if it uses fewer workers."""
+        trials = [make_trial(8, 1000.0), make_trial(4, 980.0), make_trial(2, 600.0)]
+        assert _rank(trials, tolerance=0.05)[0].num_workers == 4
+        assert _rank(trials, tolerance=0.0)[0].num_workers == 8
+
+    def test_sweep_on_real_datamodule(self, tmp_path):
+        """The sweep runs against a datamodule's train loader and returns ranked trials."""
+        with ShardWriter(tmp_path / "train") as writer:
+            for i in range(64):
+                writer.add(np.full(4, i, dtype=np.float32), label=i % 2)
+        dm = BaseDataModule(batch_size=8, shard_dir=str(tmp_path))
+        dm.setup("fit")
+
+        trials = autotune_dataloader(
+            dm, worker_counts=[0, 1], prefetch_factors=[2], max_batches=4, log=None
+        )
+        assert {t.num_workers for t in trials} == {0, 1}
+        assert all(t.effective_samples_per_s > 0 for t in trials)
+
+
+class TestConfigHelpers:
+    """Tests for reading and writing config files."""
+
+    def test_write_overrides_nests_dotted_keys(self, tmp_path):
+        """Dotted keys become nested YAML that LightningCLI can merge."""
+        path = write_overrides(
+            tmp_path / "override.yaml",
+            {"data.init_args.num_workers": 8, "data.init_args.persistent_workers": True},
+            header="tuned",
+        )
+        assert path.read_text().startswith("# tuned\n")
+        assert yaml.safe_load(path.read_text()) == {
+            "data": {"init_args": {"num_workers": 8, "persistent_workers": True}}
+        }
+
+    def test_instantiate_parses_against_signature(self):
+        """Config values are coerced to the types in the class signature."""
+        section = {
+            "class_path": "{{cookiecutter.package_name}}.data.BaseDataModule",
+            "init_args": {"batch_size": "16"},
+        }
+        dm = instantiate(section, BaseDataModule, num_workers=0)
+        assert isinstance(dm, BaseDataModule)
+        assert dm.batch_size == 16
+        assert dm.num_workers == 0
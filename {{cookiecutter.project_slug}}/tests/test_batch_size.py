@@ -0,0 +1,90 @@
+"""Tests for the batch size search."""
+
+import numpy as np
+import pytest
+import torch
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, ShardWriter
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.utils import batch_size as batch_size_module
+from {{cookiecutter.package_name}}.utils.batch_size import (
+    accumulation_for,
+    config_hash,
+    find_batch_size,
+    load_cached,
+    save_cached,
+)
+
+
+class VectorModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = torch.nn.Linear(4, 2)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.cross_entropy(self.layer(x), y)
+
+
+@pytest.fixture
+def datamodule(tmp_path):
+    with ShardWriter(tmp_path / "train") as writer:
+        for i in range(16):
+            writer.add(np.full(4, i, dtype=np.float32), label=i % 2)
+    return BaseDataModule(shard_dir=str(tmp_path), batch_size=3, num_workers=0)
+
+
+class TestFindBatchSize:
+    """Tests for find_batch_size()."""
+
+    def test_binary_search_against_budget(self, datamodule, monkeypatch):
+        """Doubling stops at the first batch over budget; bisection finds the boundary.
+
+        Batches whose extrapolated peak exceeds the budget (16, 12, 11) are not run.
+        """
+        monkeypatch.setattr(batch_size_module, "_probe", lambda m, dm, bs, *args: bs * 1000)
+        result = find_batch_size(VectorModel(), datamodule, ram_budget_bytes=10_500, margin=0.0)
+
+        assert result.max_batch_size == 10
+        assert [bs for bs, _ in result.trials] == [1, 2, 4, 8, 10]
+        assert datamodule.batch_size == 3  # restored
+
+    def test_probes_when_prediction_is_optimistic(self, datamodule, monkeypatch):
+        """A batch predicted to fit is still run and rejected on its measured peak."""
+        peaks = {1: 1000, 2: 2000, 4: 4000, 8: 12_000, 6: 6000, 7: 9000}
+        monkeypatch.setattr(batch_size_module, "_probe", lambda m, dm, bs, *args: peaks[bs])
+        result = find_batch_size(VectorModel(), datamodule, ram_budget_bytes=8500, margin=0.0)
+
+        assert result.max_batch_size == 6
+        assert [bs for bs, _ in result.trials] == [1, 2, 4, 8, 6, 7]
+
+    def test_real_training_steps(self, datamodule):
+        """On CPU every batch up to the dataset size fits a generous budget."""
+        result = find_batch_size(
+            VectorModel(), datamodule, trainer_kwargs={"accelerator": "cpu"},
+            ram_budget_bytes=2**40, target_batch_size=64, log=None,
+        )
+        assert result.max_batch_size == 16
+        assert result.batch_size * result.accumulate_grad_batches >= 64
+        assert result.peak_bytes > 0
+
+    def test_accumulation(self):
+        """The fewest accumulation steps, with the smallest batch reaching the target."""
+        assert accumulation_for(100, 64) == (64, 1)
+        assert accumulation_for(100, 256) == (86, 3)
+        assert accumulation_for(7, 7) == (7, 1)
+
+
+def test_cache_roundtrip(tmp_path, datamodule, monkeypatch):
+    """Cached results load back; loader-only args don't change the config hash."""
+    monkeypatch.setattr(batch_size_module, "_probe", lambda m, dm, bs, *args: bs)
+    result = find_batch_size(VectorModel(), datamodule, ram_budget_bytes=2**40, log=None)
+    path = tmp_path / "cache.json"
+    save_cached(path, result)
+    assert load_cached(path) == result
+    assert load_cached(tmp_path / "missing.json") is None
+
+    config = {"data": {"init_args": {"batch_size": 8, "shard_dir": "a"}}}
+    retuned = {"data": {"init_args": {"batch_size": 64, "num_workers": 8, "shard_dir": "a"}}}
+    other = {"data": {"init_args": {"batch_size": 8, "shard_dir": "b"}}}
+    assert config_hash(config) == config_hash(retuned) != config_hash(other)
@@ -0,0 +1,73 @@
+"""Tests for the shared-memory sample cache."""
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, Dataset
+
+from {{cookiecutter.package_name}}.data import CachedDataset
+from {{cookiecutter.package_name}}.data.cache import SharedMemoryCache
+
+
+class SquaresDataset(Dataset):
+    def __len__(self):
+        return 32
+
+    def __getitem__(self, idx):
+        return torch.full((4,), float(idx * idx))
+
+
+class TestSharedMemoryCache:
+    """Unit tests for slot allocation and eviction."""
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = SharedMemoryCache(num_keys=10, capacity_bytes=512, slot_bytes=256, policy="lru")
+        cache.put(0, "a")
+        cache.put(1, "b")
+        assert cache.get(0) == "a"  # 1 is now least recently used
+        cache.put(2, "c")
+        assert cache.get(1) is None
+        assert cache.get(0) == "a"
+        assert cache.get(2) == "c"
+        assert cache.stats()["evictions"] == 1
+
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = SharedMemoryCache(num_keys=10, capacity_bytes=512, slot_bytes=256, policy="lfu")
+        cache.put(0, "a")
+        cache.put(1, "b")
+        for _ in range(3):
+            cache.get(0)
+        cache.get(1)
+        cache.get(1)
+        cache.get(0)
+        cache.put(2, "c")
+        assert cache.get(1) is None
+        assert cache.get(0) == "a"
+
+    def test_oversize_samples_are_skipped(self):
+        cache = SharedMemoryCache(num_keys=2, capacity_bytes=64, slot_bytes=64)
+        assert not cache.put(0, b"x" * 1000)
+        assert cache.stats()["oversize"] == 1
+
+    def test_budget_smaller_than_slot_rejected(self):
+        with pytest.raises(ValueError):
+            SharedMemoryCache(num_keys=2, capacity_bytes=10, slot_bytes=64)
+
+
+class TestCachedDataset:
+    """The cache is shared between DataLoader workers and epochs."""
+
+    @pytest.mark.parametrize("persistent", [False, True])
+    def test_second_epoch_hits_across_workers(self, persistent):
+        dataset = CachedDataset(SquaresDataset(), capacity_bytes=1 << 20)
+        loader = DataLoader(
+            dataset, batch_size=4, shuffle=True, num_workers=2, persistent_workers=persistent
+        )
+
+        first = torch.cat([batch for batch in loader]).sort(dim=0).values
+        second = torch.cat([batch for batch in loader]).sort(dim=0).values
+        assert torch.equal(first, second)
+
+        stats = dataset.cache.stats()
+        assert stats["misses"] == 32
+        assert stats["hits"] == 32
+        assert stats["hit_rate"] == pytest.approx(0.5)
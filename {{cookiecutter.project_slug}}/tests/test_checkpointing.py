@@ -0,0 +1,73 @@
+"""Tests for activation checkpointing in BaseModel."""
+
+import lightning as L
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.models.checkpointing import select_modules
+
+
+class StackModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layers = torch.nn.ModuleList(
+            torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.Tanh()) for _ in range(4)
+        )
+        self.head = torch.nn.Linear(8, 1)
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return self.head(x).squeeze(-1)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self(x), y)
+
+
+def gradients(model, x):
+    model.zero_grad()
+    model(x).sum().backward()
+    return [p.grad.clone() for p in model.parameters()]
+
+
+class TestActivationCheckpointing:
+    """Tests for BaseModel(activation_checkpointing=...)."""
+
+    def test_select_every_nth_match(self):
+        """Patterns match top-level blocks, not their children; every_n thins them."""
+        model = StackModel()
+        assert select_modules(model, ["layers.*"]) == [f"layers.{i}" for i in range(4)]
+        assert select_modules(model, ["layers.*"], every_n=2) == ["layers.0", "layers.2"]
+
+    def test_same_gradients_and_state_dict(self):
+        """Checkpointed blocks recompute in backward without changing results or names."""
+        torch.manual_seed(0)
+        eager = StackModel()
+        checkpointed = StackModel(activation_checkpointing={"modules": ["layers.*"]})
+        checkpointed.load_state_dict(eager.state_dict())
+        checkpointed.configure_model()
+
+        assert checkpointed.checkpointed_modules == [f"layers.{i}" for i in range(4)]
+        assert checkpointed.state_dict().keys() == eager.state_dict().keys()
+        x = torch.randn(16, 8)
+        for a, b in zip(gradients(eager, x), gradients(checkpointed, x)):
+            torch.testing.assert_close(a, b)
+
+    def test_unmatched_pattern_raises(self):
+        """A pattern that selects nothing is reported instead of silently ignored."""
+        model = StackModel(activation_checkpointing={"modules": ["encoder.*"]})
+        with pytest.raises(ValueError, match="matched no submodule"):
+            model.configure_model()
+
+    def test_step_stats_logged(self):
+        """log_step_stats reports the time of every training step."""
+        model = StackModel(activation_checkpointing={"modules": ["layers.*"]}, log_step_stats=True)
+        trainer = L.Trainer(
+            max_steps=3, logger=False, enable_checkpointing=False, enable_progress_bar=False,
+        )
+        data = TensorDataset(torch.randn(24, 8), torch.randn(24))
+        trainer.fit(model, DataLoader(data, batch_size=8))
+        assert trainer.logged_metrics["perf/step_time_ms"] > 0
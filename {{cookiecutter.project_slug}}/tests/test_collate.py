@@ -0,0 +1,59 @@
+"""Tests for shared-memory batch collation."""
+
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, SharedMemoryDataLoader
+
+
+@pytest.fixture
+def dataset():
+    x = torch.arange(60, dtype=torch.float32).reshape(20, 3)
+    y = torch.arange(20)
+    return TensorDataset(x, y)
+
+
+class TestSharedMemoryDataLoader:
+    """Tests for SharedMemoryDataLoader."""
+
+    @pytest.mark.parametrize("num_workers", [0, 2])
+    def test_matches_default_collate(self, dataset, num_workers):
+        """Batches equal the default DataLoader's, including the short last batch."""
+        expected = list(DataLoader(dataset, batch_size=6))
+        loader = SharedMemoryDataLoader(dataset, batch_size=6, num_workers=num_workers)
+
+        got = [(x.clone(), y.clone()) for x, y in loader]
+        assert len(got) == len(expected) == len(loader)
+        for (gx, gy), (ex, ey) in zip(got, expected):
+            assert torch.equal(gx, ex)
+            assert torch.equal(gy, ey)
+
+    def test_buffers_are_reused(self, dataset):
+        """Batches are views into a fixed ring of buffers."""
+        loader = SharedMemoryDataLoader(dataset, batch_size=2)
+        pointers = {x.data_ptr() for x, _ in loader}
+        assert len(pointers) == loader.collate.num_slots < len(loader)
+
+    def test_nested_samples(self):
+        """Dicts, numpy arrays and Python numbers are collated into the buffers."""
+        samples = [{"image": np.full((2, 2), i, dtype=np.uint8), "label": i} for i in range(5)]
+        batch = next(iter(SharedMemoryDataLoader(samples, batch_size=5)))
+        assert batch["image"].dtype == torch.uint8
+        assert batch["image"].shape == (5, 2, 2)
+        assert batch["label"].tolist() == list(range(5))
+
+    def test_mismatched_shapes_fall_back(self):
+        """Samples that don't match the template are collated normally."""
+        samples = [torch.zeros(2), torch.zeros(2), torch.ones(3), torch.ones(3)]
+        first, second = SharedMemoryDataLoader(samples, batch_size=2)
+        assert first.shape == (2, 2)
+        assert torch.equal(second, torch.ones(2, 3))
+
+    def test_datamodule_flag(self, dataset):
+        """BaseDataModule uses the shared-memory loader when asked."""
+        datamodule = BaseDataModule(batch_size=4, num_workers=0, shared_memory_collate=True)
+        datamodule.train_dataset = datamodule.val_dataset = dataset
+        assert isinstance(datamodule.train_dataloader(), SharedMemoryDataLoader)
+        assert len(list(datamodule.val_dataloader())) == 5
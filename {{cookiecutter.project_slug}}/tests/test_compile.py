@@ -0,0 +1,80 @@
+"""Tests for compiling BaseModel."""
+
+import os
+
+import lightning as L
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}} import paths
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.models.compile import enable_compile_cache
+
+
+class TinyModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = torch.nn.Linear(4, 1)
+
+    def forward(self, x):
+        return self.layer(x).squeeze(-1)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self(x), y)
+
+
+def fit(model):
+    data = TensorDataset(torch.randn(32, 4), torch.randn(32))
+    trainer = L.Trainer(
+        max_steps=4, logger=False, enable_checkpointing=False, enable_progress_bar=False,
+        log_every_n_steps=1,
+    )
+    trainer.fit(model, DataLoader(data, batch_size=8))
+    return trainer
+
+
+class TestCompile:
+    """Tests for BaseModel(compile=...)."""
+
+    def test_forward_is_compiled_and_stats_logged(self):
+        """configure_model() swaps in a compiled forward and compile/* metrics are logged."""
+        torch._dynamo.reset()
+        model = TinyModel(compile={"backend": "eager"})
+        trainer = fit(model)
+
+        assert "forward" in model.__dict__
+        metrics = trainer.logged_metrics
+        assert metrics["compile/graphs"] >= 1
+        assert metrics["compile/recompiles"] == 0
+        assert "compile/graph_breaks" in metrics
+
+    def test_eager_by_default(self):
+        """Without a compile config nothing is compiled or logged."""
+        model = TinyModel()
+        trainer = fit(model)
+        assert "forward" not in model.__dict__
+        assert not any(key.startswith("compile/") for key in trainer.logged_metrics)
+
+    def test_cache_lives_under_output_root(self, monkeypatch, tmp_path):
+        """A CPU Inductor compile writes its artifacts to paths.COMPILE_CACHE.
+
+        Importing Lightning has already set TORCHINDUCTOR_CACHE_DIR to Inductor's
+        default, which must not win over the project's cache.
+        """
+        from torch._inductor.runtime.cache_dir_utils import default_cache_dir
+
+        cache = tmp_path / "compile_cache"
+        monkeypatch.setattr(paths, "COMPILE_CACHE", cache)
+        monkeypatch.setenv("TORCHINDUCTOR_CACHE_DIR", default_cache_dir())
+        torch._dynamo.reset()
+        fit(TinyModel(compile={"backend": "inductor"}))
+
+        assert os.environ["TORCHINDUCTOR_CACHE_DIR"] == str(cache.resolve())
+        assert any(path.is_file() for path in cache.rglob("*"))
+
+    def test_user_cache_dir_is_kept(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(paths, "COMPILE_CACHE", tmp_path / "compile_cache")
+        monkeypatch.setenv("TORCHINDUCTOR_CACHE_DIR", str(tmp_path))
+        enable_compile_cache()
+        assert os.environ["TORCHINDUCTOR_CACHE_DIR"] == str(tmp_path)
@@ -0,0 +1,91 @@
+"""Tests for the EMA callback."""
+
+import lightning as L
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.callbacks import EMA
+from {{cookiecutter.package_name}}.models import BaseModel
+
+
+class LinearModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = torch.nn.Linear(4, 1)
+        self.validated_weights = []
+
+    def forward(self, x):
+        return self.layer(x).squeeze(-1)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self(x), y)
+
+    def validation_step(self, batch, batch_idx):
+        self.validated_weights.append(self.layer.weight.detach().clone())
+
+
+def loader():
+    data = TensorDataset(torch.randn(32, 4), torch.randn(32))
+    return DataLoader(data, batch_size=8)
+
+
+def trainer(ema, max_steps, **kwargs):
+    return L.Trainer(
+        max_steps=max_steps, callbacks=[ema], logger=False, enable_checkpointing=False,
+        enable_progress_bar=False, num_sanity_val_steps=0, **kwargs,
+    )
+
+
+class TestEMA:
+    """Tests for EMA."""
+
+    @pytest.mark.parametrize("every_n_steps", [1, 3])
+    def test_update_matches_reference(self, every_n_steps):
+        """One foreach update equals the per-parameter formula with decay ** every_n_steps."""
+        model = LinearModel()
+        ema = EMA(decay=0.9, every_n_steps=every_n_steps, warmup=False)
+        ema.on_fit_start(None, model)
+        before = [p.detach().clone() for p in model.parameters()]
+        with torch.no_grad():
+            for p in model.parameters():
+                p.add_(1.0)
+        ema.update()
+
+        decay = 0.9**every_n_steps
+        for shadow, old, new in zip(ema.shadow, before, model.parameters()):
+            torch.testing.assert_close(shadow, decay * old + (1 - decay) * new.detach())
+
+    def test_low_precision_cpu_shadow(self):
+        """Shadow weights can be kept in another dtype and device."""
+        model = LinearModel()
+        ema = EMA(dtype="bfloat16", device="cpu")
+        ema.on_fit_start(None, model)
+        ema.update()
+        assert all(s.dtype == torch.bfloat16 and s.device.type == "cpu" for s in ema.shadow)
+
+    def test_validation_uses_shadow_weights(self):
+        """Validation runs on the EMA weights; training weights are restored afterwards."""
+        model = LinearModel(learning_rate=0.1)
+        ema = EMA(decay=0.9)
+        trainer(ema, max_steps=4).fit(model, loader(), loader())
+
+        torch.testing.assert_close(model.validated_weights[-1], ema.shadow[0])
+        assert not torch.equal(model.layer.weight, ema.shadow[0])
+
+    def test_resume_restores_shadow(self, tmp_path):
+        """Shadow weights and the update count come back from a checkpoint."""
+        model = LinearModel(learning_rate=0.1)
+        ema = EMA(decay=0.9)
+        first = trainer(ema, max_steps=4)
+        first.fit(model, loader())
+        path = tmp_path / "pause.ckpt"
+        first.save_checkpoint(path)
+
+        resumed = EMA(decay=0.9)
+        resumed_trainer = trainer(resumed, max_steps=4)
+        resumed_trainer.fit(LinearModel(learning_rate=0.1), loader(), ckpt_path=path)
+        assert resumed.num_updates == ema.num_updates
+        for a, b in zip(resumed.shadow, ema.shadow):
+            torch.testing.assert_close(a, b)
@@ -0,0 +1,104 @@
+"""Tests for model export."""
+
+import lightning as L
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.callbacks import EMA
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.models.export import (
+    benchmark,
+    check_outputs,
+    eager_runner,
+    export_onnx,
+    export_torchscript,
+    load_checkpoint,
+    onnx_runner,
+    torchscript_runner,
+)
+from {{cookiecutter.package_name}}.models.quantize import compare_outputs, quantize_dynamic
+
+
+class MLP(BaseModel):
+    def __init__(self, hidden: int = 8, **kwargs):
+        super().__init__(**kwargs)
+        self.net = torch.nn.Sequential(
+            torch.nn.Linear(4, hidden), torch.nn.ReLU(), torch.nn.Linear(hidden, 2)
+        )
+
+    def forward(self, x):
+        return self.net(x)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.cross_entropy(self(x), y)
+
+
+def train_checkpoint(path, **kwargs):
+    data = TensorDataset(torch.randn(16, 4), torch.randint(0, 2, (16,)))
+    trainer = L.Trainer(
+        max_steps=4, callbacks=[EMA(decay=0.5)], logger=False, enable_checkpointing=False,
+        enable_progress_bar=False,
+    )
+    trainer.fit(MLP(hidden=6, learning_rate=0.1, **kwargs), DataLoader(data, batch_size=4))
+    trainer.save_checkpoint(path)
+    return path
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return train_checkpoint(tmp_path / "model.ckpt")
+
+
+CLASS_PATH = f"{__name__}.MLP"
+
+
+class TestExport:
+    """Tests for loading, exporting and checking models."""
+
+    def test_load_checkpoint(self, checkpoint):
+        """Hyperparameters come from the checkpoint; --ema swaps in the shadow weights."""
+        model = load_checkpoint(CLASS_PATH, checkpoint)
+        ema_model = load_checkpoint(CLASS_PATH, checkpoint, ema=True)
+
+        assert model.net[0].out_features == 6 and not model.training
+        assert not torch.equal(model.net[0].weight, ema_model.net[0].weight)
+
+    def test_torchscript_matches_eager(self, checkpoint, tmp_path):
+        """The traced module reproduces eager outputs at every batch size."""
+        model = load_checkpoint(CLASS_PATH, checkpoint)
+        path = export_torchscript(model, torch.randn(2, 4), tmp_path / "model.pt")
+        inputs = [torch.randn(n, 4) for n in (1, 5)]
+        assert check_outputs(eager_runner(model), torchscript_runner(path), inputs) < 1e-5
+
+    def test_compiled_checkpoint_loads_eagerly(self, tmp_path):
+        """A model trained with compile exports to TorchScript and quantizes."""
+        checkpoint = train_checkpoint(tmp_path / "model.ckpt", compile={"backend": "eager"})
+        model = load_checkpoint(CLASS_PATH, checkpoint)
+        assert "forward" not in model.__dict__
+
+        path = export_torchscript(model, torch.randn(2, 4), tmp_path / "model.pt")
+        inputs = [torch.randn(n, 4) for n in (1, 5)]
+        assert check_outputs(eager_runner(model), torchscript_runner(path), inputs) < 1e-5
+        assert compare_outputs(model, quantize_dynamic(model), inputs)["max_abs_error"] < 0.1
+
+    def test_onnx_matches_eager(self, checkpoint, tmp_path):
+        """The ONNX export runs with a different batch size than it was exported with."""
+        pytest.importorskip("onnxscript")
+        pytest.importorskip("onnxruntime")
+        model = load_checkpoint(CLASS_PATH, checkpoint)
+        path = export_onnx(model, torch.randn(2, 4), tmp_path / "model.onnx")
+        inputs = [torch.randn(n, 4) for n in (1, 7)]
+        assert check_outputs(eager_runner(model), onnx_runner(path), inputs) < 1e-4
+
+    def test_mismatch_raises(self):
+        with pytest.raises(AssertionError):
+            check_outputs(lambda x: x, lambda x: x + 1, [torch.zeros(2, 4)])
+
+
+def test_benchmark_report():
+    """One result per batch size with ordered percentiles."""
+    results = benchmark(lambda x: x * 2, lambda n: torch.randn(n, 4), [1, 4], warmup=1, iters=5)
+    assert [r["batch_size"] for r in results] == [1, 4]
+    assert all(r["p50_ms"] <= r["p99_ms"] and r["samples_per_s"] > 0 for r in results)
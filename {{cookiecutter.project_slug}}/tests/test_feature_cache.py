@@ -0,0 +1,77 @@
+"""Tests for the on-disk feature cache."""
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+
+from {{cookiecutter.package_name}}.data import FeatureCache
+from {{cookiecutter.package_name}}.data.feature_cache import cache_key
+
+
+class CountingDataset(Dataset):
+    """Dataset that records how often samples were preprocessed."""
+
+    def __init__(self, n=10, scale=1.0):
+        self.n = n
+        self.scale = scale
+        self.calls = 0
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, idx):
+        self.calls += 1
+        return torch.full((4,), idx * self.scale), idx % 2
+
+
+class TestFeatureCache:
+    """Tests for FeatureCache."""
+
+    def test_builds_once_and_reads_back(self, tmp_path):
+        """The second request is served from disk without preprocessing."""
+        cache = FeatureCache(tmp_path)
+        dataset = CountingDataset()
+
+        first = cache.get_or_build(dataset, "raw/train", {"scale": 1.0}, num_workers=0)
+        assert dataset.calls == 10
+
+        again = cache.get_or_build(dataset, "raw/train", {"scale": 1.0}, num_workers=0)
+        assert dataset.calls == 10
+        assert len(again) == len(first) == 10
+        x, y = again[3]
+        assert torch.equal(x, torch.full((4,), 3.0))
+        assert y == 1
+
+    def test_key_depends_on_source_and_transform(self):
+        """Changing the source or any transform setting gives a new key."""
+        base = cache_key("raw/train", {"resize": 224, "norm": True})
+        assert base == cache_key("raw/train", {"norm": True, "resize": 224})
+        assert base != cache_key("raw/val", {"resize": 224, "norm": True})
+        assert base != cache_key("raw/train", {"resize": 256, "norm": True})
+
+    def test_parallel_build(self, tmp_path):
+        """Workers preprocess in parallel and samples keep dataset order."""
+        cache = FeatureCache(tmp_path)
+        cached = cache.get_or_build(CountingDataset(n=20), "src", {}, num_workers=2)
+        values = [float(cached[i][0][0]) for i in range(20)]
+        assert values == list(range(20))
+
+    def test_entries_and_prune(self, tmp_path):
+        """Entries report their size; pruning by size drops least recently used first."""
+        cache = FeatureCache(tmp_path)
+        for scale in (1.0, 2.0, 3.0):
+            cache.get_or_build(CountingDataset(scale=scale), "src", {"scale": scale}, num_workers=0)
+        assert cache.get("src", {"scale": 1.0}) is not None  # most recently used now
+
+        entries = cache.entries()
+        assert len(entries) == 3
+        assert entries[0]["transform"] == {"scale": 1.0}
+        assert cache.total_bytes() == sum(e["size_bytes"] for e in entries) > 0
+
+        removed = cache.prune(max_bytes=entries[0]["size_bytes"])
+        assert len(removed) == 2
+        assert [e["transform"] for e in cache.entries()] == [{"scale": 1.0}]
+
+        cache.prune(keys=[entries[0]["key"]])
+        assert cache.entries() == []
+        assert np.isclose(cache.total_bytes(), 0)
@@ -0,0 +1,90 @@
+"""Cold-start import budget for {{cookiecutter.project_name}}.
+
+Each check runs ``python -X importtime`` in a fresh interpreter, so it
+measures a real cold start and sees every module that got imported.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PACKAGE = "{{cookiecutter.package_name}}"
+
+# Importing these must stay cheap: no torch, Lightning or numpy until a name is used
+LIGHT_IMPORTS = [
+    PACKAGE,
+    f"{PACKAGE}.paths",
+    f"{PACKAGE}.utils",
+    f"{PACKAGE}.models",
+    f"{PACKAGE}.data",
+    f"{PACKAGE}.callbacks",
+    f"{PACKAGE}.serving",
+]
+HEAVY_MODULES = ("torch", "lightning", "numpy")
+# The package's own import cost measures ~5 ms; torch alone takes seconds
+BUDGET_MS = 100
+
+
+def import_profile(code: str, **env: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module ``code`` imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT), **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def heavy_modules(profile: Dict[str, int]):
+    return sorted(m for m in profile if m.split(".")[0] in HEAVY_MODULES)
+
+
+class TestImportTime:
+    """Tests for side-effect-free, lazy package imports."""
+
+    def test_light_imports_within_budget(self):
+        profile = import_profile("import " + ", ".join(LIGHT_IMPORTS))
+        heavy = heavy_modules(profile)
+        assert not heavy, f"Importing the package loaded {heavy[:5]}; defer them to first use"
+        own_ms = sum(profile[m] for m in LIGHT_IMPORTS if m in profile) / 1e3
+        slowest = sorted(profile.items(), key=lambda kv: -kv[1])[:5]
+        assert own_ms < BUDGET_MS, f"Cold import took {own_ms:.0f} ms; slowest: {slowest}"
+
+    def test_train_script_import_is_cheap(self):
+        """Loading the train script (e.g. to inspect it) defers torch until main()."""
+        script = PROJECT_ROOT / "scripts" / "train_{{cookiecutter.model_name}}.py"
+        code = (
+            "import importlib.util; "
+            f"spec = importlib.util.spec_from_file_location('train', {str(script)!r}); "
+            "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+        )
+        assert heavy_modules(import_profile(code)) == []
+
+    def test_paths_import_creates_nothing(self, tmp_path):
+        output_dir = tmp_path / "outputs"
+        env = {"{{cookiecutter.package_name.upper()}}_OUTPUT_DIR": str(output_dir)}
+        import_profile(f"import {PACKAGE}.paths", **env)
+        assert not output_dir.exists()
+
+    def test_lazy_exports_resolve(self):
+        import {{cookiecutter.package_name}}.callbacks as callbacks
+        from {{cookiecutter.package_name}}.callbacks.step_timer import StepTimer
+
+        assert callbacks.StepTimer is StepTimer
+        assert "MemoryMonitor" in dir(callbacks)
+        with pytest.raises(AttributeError):
+            callbacks.NotACallback
@@ -0,0 +1,80 @@
+"""Tests for the precomputed dataset index."""
+
+import os
+
+import numpy as np
+import pytest
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, DatasetIndex
+
+
+def write_files(root, names):
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * len(name))
+
+
+@pytest.fixture
+def split_tree(tmp_path):
+    root = tmp_path / "raw"
+    write_files(root, ["train/cat/a.jpg", "train/dog/b.jpg", "train/dog/c.png", "val/cat/d.jpg"])
+    return root
+
+
+class TestDatasetIndex:
+    """Tests for DatasetIndex."""
+
+    def test_split_dirs_and_classes(self, split_tree):
+        """Top-level split dirs fix the split; the next level names the class."""
+        index = DatasetIndex.build(split_tree)
+
+        assert index.classes == ["cat", "dog"]
+        assert [p.name for p in index.paths("train")] == ["a.jpg", "b.jpg", "c.png"]
+        assert [p.name for p in index.paths("val")] == ["d.jpg"]
+        assert index.labels[index.indices("train")].tolist() == [0, 1, 1]
+        assert index.sizes.tolist() == [len(str(p.relative_to(split_tree))) for p in index.paths()]
+
+    def test_hash_split_is_stable(self, tmp_path):
+        """Without split dirs, files are split by path hash, independent of other files."""
+        root = tmp_path / "raw"
+        write_files(root, [f"c{i % 3}/{i}.bin" for i in range(200)])
+        index = DatasetIndex.build(root, val_fraction=0.25)
+        assert 20 < len(index.indices("val")) < 80
+
+        write_files(root, [f"c0/new{i}.bin" for i in range(50)])
+        rebuilt = DatasetIndex.build(root, val_fraction=0.25)
+        old = {p: s for p, s in zip(index.paths(), index.splits.tolist())}
+        assert all(
+            old[p] == s for p, s in zip(rebuilt.paths(), rebuilt.splits.tolist()) if p in old
+        )
+
+    def test_saved_index_is_reused_until_a_directory_changes(self, split_tree, tmp_path):
+        """load_or_build reads the saved file and rebuilds once files are added."""
+        path = tmp_path / "index.npz"
+        DatasetIndex.load_or_build(split_tree, path, extensions=[".jpg"])
+        loaded = DatasetIndex.load(path)
+        assert len(loaded) == 3 and not loaded.is_stale()
+
+        write_files(split_tree, ["val/dog/e.jpg"])
+        os.utime(split_tree / "val", ns=(0, 0))  # coarse timestamps may not move on their own
+        assert loaded.is_stale()
+        assert len(DatasetIndex.load_or_build(split_tree, path, extensions=[".jpg"])) == 4
+
+    def test_dataset(self, split_tree):
+        """index.dataset() loads files of a split with their labels."""
+        dataset = DatasetIndex.build(split_tree).dataset("train", load_fn=lambda p: p.read_bytes())
+        assert len(dataset) == 3
+        assert dataset[1] == (b"x" * len("train/dog/b.jpg"), 1)
+        assert np.array_equal(dataset.sample_sizes(), [15, 15, 15])
+
+
+def test_datamodule_loads_index(split_tree, tmp_path):
+    """prepare_data() writes the index and setup() exposes it."""
+    path = tmp_path / "index.npz"
+    datamodule = BaseDataModule(data_dir=str(split_tree), index_path=str(path))
+    datamodule.prepare_data()
+    assert path.exists()
+
+    datamodule.setup("fit")
+    assert len(datamodule.index.indices("train")) == 3
@@ -0,0 +1,76 @@
+"""Tests for the MemoryMonitor callback."""
+
+import json
+
+import lightning as L
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.callbacks import MemoryMonitor
+from {{cookiecutter.package_name}}.models import BaseModel
+
+
+class LinearModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = torch.nn.Linear(4, 1)
+
+    def forward(self, x):
+        return self.layer(x).squeeze(-1)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self(x), y)
+
+
+def fit(monitor, max_steps=6, **loader_kwargs):
+    trainer = L.Trainer(
+        max_steps=max_steps, callbacks=[monitor], logger=False, enable_checkpointing=False,
+        enable_progress_bar=False, num_sanity_val_steps=0,
+    )
+    data = TensorDataset(torch.randn(64, 4), torch.randn(64))
+    trainer.fit(LinearModel(), DataLoader(data, batch_size=8, **loader_kwargs))
+    return trainer
+
+
+def fake_samples(monitor, rss_values):
+    values = iter(rss_values)
+    monitor.sample = lambda device: {"rss_mb": next(values)}
+
+
+class TestMemoryMonitor:
+    """Tests for MemoryMonitor."""
+
+    def test_timeline_and_worker_sampling(self, tmp_path):
+        """Every sampled step lands in the timeline, dataloader workers counted as children."""
+        path = tmp_path / "memory.jsonl"
+        monitor = MemoryMonitor(every_n_steps=2, timeline_path=path)
+        fit(monitor, num_workers=2, persistent_workers=True)
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["step"] for r in rows] == [2, 4, 6]
+        assert all(r["rss_mb"] > 0 and r["python_blocks"] > 0 for r in rows)
+        assert all(r["children"] >= 2 and r["children_pss_mb"] > 0 for r in rows)
+
+    def test_warns_on_monotonic_growth(self, tmp_path):
+        """Growth at every sample over the window, above the threshold, warns once."""
+        monitor = MemoryMonitor(
+            every_n_steps=1, window=3, growth_threshold_mb=100, timeline_path=tmp_path / "m.jsonl"
+        )
+        fake_samples(monitor, [1000, 1050, 1100, 1150, 1160, 1170])
+        with pytest.warns(UserWarning, match="rss_mb grew 150 MB"):
+            fit(monitor)
+        assert len(monitor.alerts) == 1
+
+    @pytest.mark.parametrize(
+        "rss", [[1000, 1200, 1100, 1300, 1400, 1500], list(range(1000, 1060, 10))]
+    )
+    def test_no_warning_without_sustained_growth(self, tmp_path, rss):
+        """A dip inside the window, or growth under the threshold, doesn't warn."""
+        monitor = MemoryMonitor(
+            every_n_steps=1, window=5, growth_threshold_mb=100, timeline_path=tmp_path / "m.jsonl"
+        )
+        fake_samples(monitor, rss)
+        fit(monitor)
+        assert monitor.alerts == []
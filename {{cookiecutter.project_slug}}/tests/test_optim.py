@@ -0,0 +1,92 @@
+"""Tests for optimizer and schedule construction."""
+
+import lightning as L
+import pytest
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.models.optim import (
+    build_optimizer,
+    build_scheduler,
+    param_groups,
+)
+
+
+class EmbeddingModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.embed = nn.Embedding(10, 4)
+        self.linear = nn.Linear(4, 4)
+        self.norm = nn.LayerNorm(4)
+        self.head = nn.Linear(4, 1)
+
+    def forward(self, x):
+        return self.head(self.norm(self.linear(self.embed(x)))).squeeze(-1)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return nn.functional.mse_loss(self(x), y)
+
+
+class TestOptimizer:
+    """Tests for build_optimizer()."""
+
+    def test_no_decay_for_biases_norms_and_embeddings(self):
+        """Only weight matrices of Linear layers are decayed."""
+        model = EmbeddingModel()
+        decay, no_decay = param_groups(model, weight_decay=0.1)
+
+        assert decay["weight_decay"] == 0.1 and no_decay["weight_decay"] == 0.0
+        assert {id(p) for p in decay["params"]} == {id(model.linear.weight), id(model.head.weight)}
+        assert len(no_decay["params"]) == 5  # embedding, 2 biases, norm weight and bias
+
+    @pytest.mark.parametrize("implementation", ["auto", "foreach", "for-loop"])
+    def test_implementations_agree(self, implementation):
+        """Every implementation takes the same step; auto picks foreach on CPU."""
+        torch.manual_seed(0)
+        reference, model = EmbeddingModel(), EmbeddingModel()
+        model.load_state_dict(reference.state_dict())
+        for m, impl in ((reference, "for-loop"), (model, implementation)):
+            optimizer = build_optimizer(m, lr=0.1, weight_decay=0.1, implementation=impl)
+            torch.manual_seed(1)
+            for p in m.parameters():
+                p.grad = torch.randn_like(p)
+            optimizer.step()
+            if impl == "auto":
+                assert optimizer.defaults["foreach"] and not optimizer.defaults["fused"]
+        for a, b in zip(reference.parameters(), model.parameters()):
+            torch.testing.assert_close(a, b)
+
+    def test_unknown_implementation(self):
+        with pytest.raises(ValueError, match="Unknown optimizer implementation"):
+            build_optimizer(EmbeddingModel(), lr=0.1, weight_decay=0.0, implementation="apex")
+
+
+class TestScheduler:
+    """Tests for build_scheduler()."""
+
+    def test_warmup_then_cosine(self):
+        """The rate ramps up linearly, then decays to min_lr_ratio at total_steps."""
+        optimizer = torch.optim.SGD([nn.Parameter(torch.zeros(1))], lr=1.0)
+        scheduler = build_scheduler(optimizer, 10, "cosine", warmup_steps=2, min_lr_ratio=0.1)
+        rates = []
+        for _ in range(12):
+            rates.append(optimizer.param_groups[0]["lr"])
+            optimizer.step()
+            scheduler.step()
+
+        assert rates[:3] == pytest.approx([0.5, 1.0, 1.0])
+        assert rates[6] == pytest.approx(0.1 + 0.9 * 0.5)
+        assert rates[10:] == pytest.approx([0.1, 0.1])
+
+    def test_configured_from_model(self):
+        """BaseModel(lr_scheduler=...) steps the schedule every optimizer step."""
+        model = EmbeddingModel(learning_rate=1.0, lr_scheduler={"name": "linear"})
+        trainer = L.Trainer(
+            max_steps=4, logger=False, enable_checkpointing=False, enable_progress_bar=False,
+        )
+        data = TensorDataset(torch.randint(0, 10, (16,)), torch.randn(16))
+        trainer.fit(model, DataLoader(data, batch_size=4))
+        assert trainer.optimizers[0].param_groups[0]["lr"] == pytest.approx(0.0)
@@ -0,0 +1,95 @@
+"""Tests for background batch prefetching."""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data.distributed import DistributedSampler
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, DevicePrefetcher
+
+
+@pytest.fixture
+def loader():
+    x = torch.arange(40, dtype=torch.float32).reshape(20, 2)
+    y = torch.arange(20)
+    return DataLoader(TensorDataset(x, y), batch_size=3, shuffle=False)
+
+
+class TestDevicePrefetcher:
+    """Tests for DevicePrefetcher on CPU."""
+
+    def test_yields_same_batches_in_order(self, loader):
+        """Prefetched batches match the wrapped loader, including the short last batch."""
+        expected = [(x.clone(), y.clone()) for x, y in loader]
+        prefetcher = DevicePrefetcher(loader, device="cpu", num_batches=2)
+
+        got = [(x.clone(), y.clone()) for x, y in prefetcher]
+        assert len(got) == len(expected) == len(prefetcher)
+        for (gx, gy), (ex, ey) in zip(got, expected):
+            assert torch.equal(gx, ex)
+            assert torch.equal(gy, ey)
+
+    def test_host_buffers_are_reused(self, loader):
+        """Staging buffers are allocated once per slot, not once per batch."""
+        prefetcher = DevicePrefetcher(loader, device="cpu", num_batches=1)
+        pointers = {x.data_ptr() for x, _ in prefetcher}
+        assert len(pointers) <= len(prefetcher._slots)
+        assert len(pointers) < len(loader)
+
+    def test_reports_wait_stats(self, loader):
+        """Wait statistics are populated after a pass."""
+        prefetcher = DevicePrefetcher(loader, device="cpu")
+        for _ in prefetcher:
+            pass
+        stats = prefetcher.stats()
+        assert set(stats) == {"wait_s", "wait_ms_per_batch", "wait_fraction"}
+        assert 0.0 <= stats["wait_fraction"] <= 1.0
+
+    def test_worker_errors_are_raised(self):
+        """Exceptions from the wrapped loader surface in the consuming thread."""
+
+        def broken():
+            yield torch.zeros(1)
+            raise ValueError("boom")
+
+        class Broken:
+            def __iter__(self):
+                return broken()
+
+        with pytest.raises(ValueError, match="boom"):
+            list(DevicePrefetcher(Broken()))
+
+    def test_early_break_and_restart(self, loader):
+        """Abandoning a pass and iterating again starts a fresh pass."""
+        prefetcher = DevicePrefetcher(loader)
+        first = next(iter(prefetcher))[1].clone()
+        assert torch.equal(next(iter(prefetcher))[1], first)
+
+
+class TestPrefetchDataModule:
+    """Tests for prefetch_batches through BaseDataModule."""
+
+    @pytest.mark.parametrize("bucket_by_size", [False, True])
+    def test_ranks_read_disjoint_shares(self, bucket_by_size):
+        """Under DDP each rank's prefetched loader covers its own share of the dataset."""
+        seen = []
+        for rank in range(2):
+            datamodule = BaseDataModule(
+                batch_size=4, num_workers=0, prefetch_batches=1, bucket_by_size=bucket_by_size
+            )
+            datamodule.trainer = SimpleNamespace(
+                global_rank=rank,
+                world_size=2,
+                strategy=SimpleNamespace(root_device=torch.device("cpu")),
+            )
+            datamodule.train_dataset = [torch.tensor([float(i)]) for i in range(32)]
+            loader = datamodule.train_dataloader()
+            assert isinstance(loader, DevicePrefetcher)
+            sampler = loader.batch_sampler.sampler if bucket_by_size else loader.sampler
+            assert isinstance(sampler, DistributedSampler)
+            seen.append({int(v) for batch in loader for v in batch.flatten()})
+
+        assert len(seen[0]) == len(seen[1]) == 16
+        assert not seen[0] & seen[1]
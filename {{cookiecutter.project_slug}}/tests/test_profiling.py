@@ -0,0 +1,52 @@
+"""Tests for input pipeline measurement helpers."""
+
+import sys
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.data.profiling import (
+    WorkerLatencyRecorder,
+    measure_loader,
+    rss_bytes,
+)
+
+
+def make_loader(recorder, num_workers):
+    dataset = TensorDataset(torch.arange(64.0)[:, None], torch.arange(64))
+    loader = DataLoader(recorder.wrap_dataset(dataset), batch_size=8, num_workers=num_workers)
+    loader.collate_fn = recorder.wrap_collate(loader.collate_fn)
+    return loader
+
+
+class TestWorkerLatencyRecorder:
+    """Tests for per-worker batch latency."""
+
+    @pytest.mark.parametrize("num_workers", [0, 2])
+    def test_one_latency_per_batch_per_worker(self, num_workers):
+        """Every batch is attributed to the worker (or main process) that built it."""
+        recorder = WorkerLatencyRecorder()
+        batches = list(make_loader(recorder, num_workers))
+
+        assert torch.equal(torch.cat([x for x, _ in batches]).flatten(), torch.arange(64.0))
+        summary = recorder.summary()
+        expected = ["main"] if num_workers == 0 else ["worker_0", "worker_1"]
+        assert sorted(summary) == expected
+        assert sum(stats["batches"] for stats in summary.values()) == 8
+        for stats in summary.values():
+            assert 0 <= stats["p50_ms"] <= stats["p90_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+    def test_measure_loader_reports_progress(self):
+        """on_batch is called once per batch with the running count."""
+        seen = []
+        stats = measure_loader(make_loader(WorkerLatencyRecorder(), 0), on_batch=seen.append)
+        assert seen == list(range(1, 9))
+        assert stats["samples"] == 64
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RSS is read from /proc")
+def test_rss_bytes():
+    """The current process has a positive RSS; a missing process has none."""
+    assert rss_bytes() > 0
+    assert rss_bytes(2**22 + 1) is None
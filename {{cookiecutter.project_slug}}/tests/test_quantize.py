@@ -0,0 +1,58 @@
+"""Tests for post-training quantization."""
+
+import pytest
+import torch
+
+from {{cookiecutter.package_name}}.models import BaseModel
+from {{cookiecutter.package_name}}.models.quantize import (
+    compare_outputs,
+    model_size_bytes,
+    quantize_dynamic,
+    quantize_static,
+    split_batch,
+)
+
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning", "ignore::UserWarning")
+
+
+class Classifier(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.net = torch.nn.Sequential(
+            torch.nn.Linear(64, 512), torch.nn.ReLU(), torch.nn.Linear(512, 4)
+        )
+
+    def forward(self, x):
+        return self.net(x)
+
+
+@pytest.fixture
+def batches():
+    torch.manual_seed(0)
+    return [(torch.randn(8, 64), torch.randint(0, 4, (8,))) for _ in range(4)]
+
+
+@pytest.mark.parametrize("mode", ["dynamic", "static"])
+def test_quantized_model_close_to_fp32(mode, batches):
+    """int8 models are smaller, stay close to fp32 and leave the original untouched."""
+    model = Classifier().eval()
+    weight = model.net[0].weight.clone()
+    if mode == "dynamic":
+        quantized = quantize_dynamic(model)
+    else:
+        quantized = quantize_static(model, [split_batch(b)[0] for b in batches])
+
+    stats = compare_outputs(model, quantized, batches)
+    assert stats["max_abs_error"] < 0.1
+    assert stats["argmax_agreement"] > 0.9
+    assert abs(stats["accuracy_delta"]) <= 0.25
+    assert model_size_bytes(quantized) < model_size_bytes(model) / 2
+    assert torch.equal(model.net[0].weight, weight)
+
+
+def test_split_batch():
+    x, y = torch.zeros(2, 3), torch.ones(2)
+    assert split_batch(x) == (x, None)
+    assert split_batch((x, y))[1] is y
+    with pytest.raises(TypeError):
+        split_batch({"x": x})
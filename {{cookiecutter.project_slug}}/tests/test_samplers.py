@@ -0,0 +1,168 @@
+"""Tests for size-bucketed batching and mid-epoch resume."""
+
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import DataLoader, RandomSampler, SequentialSampler
+from torch.utils.data.distributed import DistributedSampler
+
+from {{cookiecutter.package_name}}.data import (
+    BaseDataModule,
+    BucketBatchSampler,
+    ResumableDataLoader,
+    ResumableSampler,
+    pad_collate,
+    sample_sizes,
+)
+
+
+@pytest.fixture
+def sizes():
+    return np.random.default_rng(0).integers(1, 200, size=1000)
+
+
+def distributed(n, rank=0, num_replicas=1, seed=0):
+    return DistributedSampler(range(n), num_replicas=num_replicas, rank=rank, seed=seed)
+
+
+class TestBucketBatchSampler:
+    """Tests for BucketBatchSampler."""
+
+    def test_covers_every_sample_once(self, sizes):
+        """Without drop_last every index appears in exactly one batch."""
+        batches = list(BucketBatchSampler(distributed(len(sizes)), sizes, batch_size=32))
+        assert sorted(i for batch in batches for i in batch) == list(range(len(sizes)))
+
+    def test_reduces_padding(self, sizes):
+        """Bucketed batches pad far less than random batches of the same size."""
+
+        def padding(batches):
+            return sum(len(b) * sizes[b].max() - sizes[b].sum() for b in batches)
+
+        bucketed = list(BucketBatchSampler(distributed(len(sizes)), sizes, batch_size=32))
+        random = np.array_split(np.random.default_rng(0).permutation(len(sizes)), len(bucketed))
+        assert padding(bucketed) < 0.2 * padding(random)
+
+    def test_token_budget(self, sizes):
+        """Padded batch size stays within max_tokens unless a sample alone exceeds it."""
+        sampler = BucketBatchSampler(distributed(len(sizes)), sizes, max_tokens=1000)
+        for batch in sampler:
+            assert len(batch) == 1 or len(batch) * sizes[batch].max() <= 1000
+
+    def test_deterministic_per_seed_and_epoch(self, sizes):
+        """Same seed and epoch give the same plan; the epoch reshuffles it."""
+        a = BucketBatchSampler(distributed(len(sizes), seed=7), sizes, batch_size=16)
+        b = BucketBatchSampler(distributed(len(sizes), seed=7), sizes, batch_size=16)
+        assert list(a) == list(b)
+
+        first = list(a)
+        a.sampler.set_epoch(1)
+        assert list(a) != first
+
+    def test_ranks_get_equal_disjoint_shares(self, sizes):
+        """Ranks see the same number of batches and no shared batches."""
+        shares = [
+            list(BucketBatchSampler(distributed(len(sizes), r, 3), sizes, max_tokens=2000))
+            for r in range(3)
+        ]
+        assert len({len(share) for share in shares}) == 1
+        seen = [tuple(batch) for share in shares for batch in share]
+        assert len(set(seen)) >= len(seen) - 2  # at most two batches repeated as padding
+
+    def test_plain_samplers(self, sizes):
+        """Sequential samplers keep size order; other samplers advance epochs themselves."""
+        sequential = BucketBatchSampler(SequentialSampler(sizes), sizes, batch_size=10)
+        assert list(sequential) == list(sequential)
+
+        shuffled = BucketBatchSampler(RandomSampler(sizes), sizes, batch_size=10, seed=0)
+        assert list(shuffled) != list(shuffled)
+
+
+class TestBucketingDataModule:
+    """Tests for bucketing through BaseDataModule."""
+
+    def test_train_dataloader_pads_batches(self):
+        """Variable-length samples come out as padded, size-bucketed batches."""
+        lengths = [1 + i % 17 for i in range(100)]
+        dataset = [torch.ones(n) for n in lengths]
+
+        datamodule = BaseDataModule(batch_size=8, num_workers=0, bucket_by_size=True)
+        datamodule.train_dataset = dataset
+        batches = list(datamodule.train_dataloader())
+
+        assert sum(len(b) for b in batches) == 96  # drop_last with a fixed batch size
+        assert all(b.shape[1] == b.sum(dim=1).max() for b in batches)
+        assert np.array_equal(sample_sizes(dataset), lengths)
+
+    def test_pad_collate_structures(self):
+        """Tensors inside tuples are padded, labels collated normally."""
+        batch = [(torch.ones(2, 3), 0), (torch.ones(4, 1), 1)]
+        x, y = pad_collate(batch)
+        assert x.shape == (2, 4, 3)
+        assert x.sum() == 10
+        assert y.tolist() == [0, 1]
+
+
+class TestResumableLoading:
+    """Tests for ResumableSampler and ResumableDataLoader."""
+
+    def make_loader(self, n=100, **kwargs):
+        dataset = torch.arange(n)
+        return ResumableDataLoader(dataset, sampler=ResumableSampler(dataset, seed=0), **kwargs)
+
+    def resume(self, loader, steps):
+        """Consume ``steps`` batches, then continue the epoch in a fresh loader."""
+        iterator = iter(loader)
+        head = [next(iterator) for _ in range(steps)]
+        state = loader.state_dict()
+        fresh = type(loader)(loader.dataset, batch_sampler=loader.batch_sampler)
+        fresh.load_state_dict(state)
+        return head, list(fresh), state
+
+    def test_resume_continues_the_epoch(self):
+        """A restored loader yields exactly the remaining batches of the epoch."""
+        loader = self.make_loader(batch_size=8, drop_last=True)
+        loader.sampler.set_epoch(3)
+        full = [b.tolist() for b in loader]
+        head, tail, state = self.resume(loader, 5)
+
+        assert state == {"seed": 0, "epoch": 3, "batches_consumed": 5}
+        assert [b.tolist() for b in head + tail] == full
+        assert len(loader) == len(full)
+
+    def test_skipped_samples_are_not_loaded(self):
+        """Resuming fetches only the samples of the remaining batches."""
+        fetched = []
+
+        class Recording(torch.utils.data.Dataset):
+            def __len__(self):
+                return 64
+
+            def __getitem__(self, idx):
+                fetched.append(idx)
+                return idx
+
+        dataset = Recording()
+        loader = ResumableDataLoader(dataset, batch_size=8, sampler=ResumableSampler(dataset))
+        loader.load_state_dict({"seed": 0, "epoch": 0, "batches_consumed": 6})
+        assert len(list(loader)) == 2
+        assert len(fetched) == 16
+
+    def test_bucketed_resume_with_workers(self, sizes):
+        """Bucketed batches resume too, also through worker processes."""
+        sampler = BucketBatchSampler(distributed(len(sizes)), sizes, batch_size=32)
+        loader = ResumableDataLoader(
+            torch.arange(len(sizes)), batch_sampler=sampler, num_workers=1
+        )
+        full = [b.tolist() for b in loader]
+        head, tail, _ = self.resume(loader, 10)
+        assert [b.tolist() for b in head + tail] == full
+
+    def test_datamodule_option(self):
+        """resumable=True gives a stateful training loader with a ResumableSampler."""
+        datamodule = BaseDataModule(batch_size=4, num_workers=0, resumable=True)
+        datamodule.train_dataset = list(range(20))
+        loader = datamodule.train_dataloader()
+        assert isinstance(loader, ResumableDataLoader)
+        assert isinstance(loader.sampler, ResumableSampler)
+        assert loader.state_dict()["batches_consumed"] == 0
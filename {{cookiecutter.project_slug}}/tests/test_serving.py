@@ -0,0 +1,127 @@
+"""Tests for dynamic batching and the inference server."""
+
+import asyncio
+import json
+import time
+
+import torch
+import torch.nn as nn
+
+from {{cookiecutter.package_name}}.serving import DynamicBatcher, InferenceClient, InferenceServer
+
+
+class RecordingModel(nn.Module):
+    """Linear model that records the batch size of every call."""
+
+    def __init__(self):
+        super().__init__()
+        self.layer = nn.Linear(4, 2)
+        self.calls = []
+
+    def forward(self, x):
+        self.calls.append(len(x))
+        assert torch.is_inference_mode_enabled()
+        return self.layer(x)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestDynamicBatcher:
+    """Tests for DynamicBatcher."""
+
+    def test_coalesces_concurrent_requests(self):
+        """Concurrent requests share model calls capped at max_batch_size, in order."""
+        model = RecordingModel().eval()
+        samples = torch.randn(10, 4)
+
+        async def main():
+            batcher = DynamicBatcher(model, max_batch_size=4, max_latency_ms=50)
+            await batcher.start()
+            outputs = await asyncio.gather(*(batcher.predict(s) for s in samples))
+            await batcher.stop()
+            return outputs, batcher.stats()
+
+        outputs, stats = run(main())
+        assert model.calls == [4, 4, 2]
+        torch.testing.assert_close(torch.stack(outputs), model.layer(samples).detach())
+        assert stats["requests"] == 10 and stats["batches"] == 3
+        assert stats["batch_size_histogram"] == {"2": 1, "4": 2}
+        assert sum(stats["queue_depth_histogram"].values()) == 3
+
+    def test_deadline_bounds_wait(self):
+        """A lone request is dispatched after max_latency_ms, not held for a full batch."""
+        model = RecordingModel().eval()
+
+        async def main():
+            batcher = DynamicBatcher(model, max_batch_size=64, max_latency_ms=20)
+            await batcher.start()
+            start = time.perf_counter()
+            await batcher.predict(torch.randn(4))
+            elapsed = time.perf_counter() - start
+            await batcher.stop()
+            return elapsed
+
+        assert 0.015 < run(main()) < 1.0
+        assert model.calls == [1]
+
+    def test_bad_shape_fails_only_its_request(self):
+        model = RecordingModel().eval()
+
+        async def main():
+            batcher = DynamicBatcher(model, max_batch_size=8, max_latency_ms=20)
+            await batcher.start()
+            results = await asyncio.gather(
+                batcher.predict(torch.randn(4)),
+                batcher.predict(torch.randn(3)),
+                return_exceptions=True,
+            )
+            await batcher.stop()
+            return results, batcher.stats()
+
+        (good, bad), stats = run(main())
+        assert good.shape == (2,)
+        assert isinstance(bad, RuntimeError)
+        assert stats["errors"] == 1
+
+
+class TestInferenceServer:
+    """Tests for InferenceServer over a Unix socket."""
+
+    def test_predict_stats_and_errors(self, tmp_path):
+        model = RecordingModel().eval()
+        socket = str(tmp_path / "model.sock")
+        sample = [0.1, 0.2, 0.3, 0.4]
+
+        async def main():
+            batcher = DynamicBatcher(model, max_batch_size=8, max_latency_ms=10)
+            await batcher.start()
+            server = InferenceServer(batcher)
+            await server.start(unix_socket=socket)
+            clients = [await InferenceClient.connect(unix_socket=socket) for _ in range(4)]
+            # Two requests per keep-alive connection, the second with a pre-encoded body
+            predictions = await asyncio.gather(
+                *(c.request("POST", "/predict", {"inputs": sample}) for c in clients)
+            )
+            encoded = json.dumps({"inputs": sample}).encode()
+            predictions += await asyncio.gather(
+                *(c.request("POST", "/predict", encoded) for c in clients)
+            )
+            bad_json = await clients[0].request("POST", "/predict", {"x": 1})
+            missing = await clients[0].request("GET", "/nope")
+            stats = await clients[0].request("GET", "/stats")
+            for client in clients:
+                await client.close()
+            await server.stop()
+            await batcher.stop()
+            return predictions, bad_json, missing, stats
+
+        predictions, bad_json, missing, (status, stats) = run(main())
+        expected = model.layer(torch.tensor([sample])).detach()[0].tolist()
+        for code, body in predictions:
+            assert code == 200
+            assert body["outputs"] == expected
+        assert bad_json[0] == 400 and missing[0] == 404
+        assert status == 200 and stats["requests"] == 8
+        assert stats["mean_batch_size"] > 1
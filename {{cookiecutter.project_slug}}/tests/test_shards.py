@@ -0,0 +1,67 @@
+"""Tests for the packed shard format."""
+
+import numpy as np
+import pytest
+import torch
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, ShardedDataset, ShardWriter
+
+
+class TestShards:
+    """Round-trip tests for ShardWriter and ShardedDataset."""
+
+    def test_round_trip_fixed_shape(self, tmp_path):
+        """Fixed-shape samples come back with their shape, dtype and label."""
+        samples = [np.full((3, 4), i, dtype=np.float32) for i in range(10)]
+        with ShardWriter(tmp_path, shard_size_bytes=128) as writer:
+            for i, sample in enumerate(samples):
+                writer.add(sample, label=i % 3)
+
+        dataset = ShardedDataset(tmp_path)
+        assert len(dataset) == 10
+        assert len(list(tmp_path.glob("*.bin"))) > 1
+
+        for i in range(10):
+            tensor, label = dataset[i]
+            assert tensor.shape == (3, 4)
+            assert tensor.dtype == torch.float32
+            assert torch.equal(tensor, torch.from_numpy(samples[i]))
+            assert label == i % 3
+
+    def test_variable_length_samples_are_flat(self, tmp_path):
+        """Variable-size samples are returned as 1-D tensors of the right length."""
+        with ShardWriter(tmp_path) as writer:
+            for n in (1, 5, 3):
+                writer.add(np.arange(n, dtype=np.int64))
+
+        dataset = ShardedDataset(tmp_path)
+        assert dataset.record_shape is None
+        assert [len(dataset[i]) for i in range(3)] == [1, 5, 3]
+        assert dataset.sample_sizes().tolist() == [1, 5, 3]
+
+    def test_mixed_dtypes_rejected(self, tmp_path):
+        """All samples in a shard set must share a dtype."""
+        writer = ShardWriter(tmp_path)
+        writer.add(np.zeros(2, dtype=np.float32))
+        with pytest.raises(ValueError):
+            writer.add(np.zeros(2, dtype=np.int64))
+
+    def test_in_place_transform_does_not_modify_shards(self, tmp_path):
+        """Copy-on-write mapping keeps the files on disk untouched."""
+        with ShardWriter(tmp_path) as writer:
+            writer.add(np.ones(4, dtype=np.float32))
+
+        dataset = ShardedDataset(tmp_path, transform=lambda x: x.mul_(0))
+        assert dataset[0].sum() == 0
+        assert ShardedDataset(tmp_path)[0].sum() == 4
+
+    def test_datamodule_reads_shard_dir(self, tmp_path):
+        """BaseDataModule builds datasets from shard_dir splits that exist."""
+        with ShardWriter(tmp_path / "train") as writer:
+            for i in range(8):
+                writer.add(np.full(2, i, dtype=np.float32))
+
+        dm = BaseDataModule(batch_size=4, num_workers=0, shard_dir=str(tmp_path))
+        dm.setup("fit")
+        assert len(dm.train_dataset) == 8
+        assert dm.val_dataset is None
@@ -0,0 +1,52 @@
+"""Tests for sharing datasets between datamodules."""
+
+import numpy as np
+import pytest
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, ShardWriter
+from {{cookiecutter.package_name}}.data.shared import REGISTRY, SHARE_ENV
+
+
+@pytest.fixture
+def shard_dir(tmp_path):
+    for split in ("train", "val"):
+        with ShardWriter(tmp_path / split) as writer:
+            for i in range(16):
+                writer.add(np.full(4, i, dtype=np.float32), label=i % 2)
+    yield str(tmp_path)
+    REGISTRY.clear()
+
+
+class TestSharedDatasets:
+    """Tests for BaseDataModule(share_datasets=True)."""
+
+    def test_loader_settings_reuse_datasets(self, shard_dir):
+        """Datamodules differing only in loader settings attach to the same datasets."""
+        first = BaseDataModule(shard_dir=shard_dir, batch_size=4, share_datasets=True)
+        first.setup("fit")
+        second = BaseDataModule(
+            shard_dir=shard_dir, batch_size=8, num_workers=0, share_datasets=True
+        )
+        second.setup("fit")
+
+        assert second.train_dataset is first.train_dataset
+        assert second.val_dataset is first.val_dataset
+        assert next(iter(second.train_dataloader()))[0].shape[0] == 8
+
+    def test_data_settings_rebuild(self, shard_dir):
+        """A change to a data-affecting argument loads new datasets."""
+        first = BaseDataModule(shard_dir=shard_dir, share_datasets=True)
+        first.setup("fit")
+        streaming = BaseDataModule(shard_dir=shard_dir, streaming=True, share_datasets=True)
+        streaming.setup("fit")
+        unshared = BaseDataModule(shard_dir=shard_dir)
+        unshared.setup("fit")
+
+        assert streaming.train_dataset is not first.train_dataset
+        assert unshared.train_dataset is not first.train_dataset
+
+    def test_environment_default(self, shard_dir, monkeypatch):
+        """The environment variable turns sharing on when the argument isn't given."""
+        monkeypatch.setenv(SHARE_ENV, "1")
+        assert BaseDataModule(shard_dir=shard_dir).share_datasets
+        assert not BaseDataModule(shard_dir=shard_dir, share_datasets=False).share_datasets
@@ -0,0 +1,74 @@
+"""Tests for the StepTimer callback."""
+
+import lightning as L
+import torch
+from lightning.pytorch.loggers import CSVLogger
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.callbacks import StepTimer
+from {{cookiecutter.package_name}}.callbacks.step_timer import PhaseHistogram
+from {{cookiecutter.package_name}}.models import BaseModel
+
+
+class LinearModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = torch.nn.Linear(4, 1)
+
+    def forward(self, x):
+        return self.layer(x).squeeze(-1)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self(x), y)
+
+
+def fit(callbacks, tmp_path, max_steps=8):
+    trainer = L.Trainer(
+        max_steps=max_steps, callbacks=callbacks, logger=CSVLogger(tmp_path),
+        default_root_dir=tmp_path, enable_progress_bar=False, num_sanity_val_steps=0,
+        log_every_n_steps=1,
+    )
+    data = TensorDataset(torch.randn(64, 4), torch.randn(64))
+    trainer.fit(LinearModel(), DataLoader(data, batch_size=8))
+    return trainer
+
+
+class TestStepTimer:
+    """Tests for StepTimer."""
+
+    def test_histogram_percentiles(self):
+        """Percentiles land within one bin of the recorded durations."""
+        histogram = PhaseHistogram()
+        for ms in range(1, 101):
+            histogram.add(ms / 1e3)
+        assert histogram.count == 100
+        assert 0.050 <= histogram.percentile(50) <= 0.053
+        assert 0.100 <= histogram.percentile(100) <= 0.105
+
+    def test_logs_phase_timings(self, tmp_path):
+        """Sampled steps log every compute phase, and fractions sum to one."""
+        timer = StepTimer(sample_every_n_steps=2, log_every_n_steps=4)
+        trainer = fit([timer], tmp_path)
+        metrics = trainer.logged_metrics
+        for phase in ("data_wait", "forward", "backward", "optimizer"):
+            assert metrics[f"time/{phase}_p50_ms"] > 0
+        fractions = [v for k, v in metrics.items() if k.endswith("_frac")]
+        assert abs(sum(fractions) - 1) < 1e-4
+        # Every logger call was timed (data_wait excludes them)
+        assert "time/logging_p50_ms" in metrics
+
+    def test_times_checkpoints_and_restores(self, tmp_path):
+        """Checkpoint saves are timed, and patched methods are restored after fit."""
+        timer = StepTimer(sample_every_n_steps=1, log_every_n_steps=100)
+        trainer = fit([timer], tmp_path)
+        assert timer.histograms["checkpoint"].count >= 1
+        assert "save_checkpoint" not in trainer.__dict__
+        assert "log_metrics" not in trainer.logger.__dict__
+
+    def test_configured_timer_replaces_default(self, tmp_path):
+        """A later (default) StepTimer disables itself when one is already configured."""
+        configured, default = StepTimer(log_every_n_steps=4), StepTimer()
+        fit([configured, default], tmp_path)
+        assert configured.enabled and not default.enabled
+        assert default.histograms["forward"].count == 0
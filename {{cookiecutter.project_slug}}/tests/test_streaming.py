@@ -0,0 +1,90 @@
+"""Tests for the streaming dataset mode."""
+
+import numpy as np
+import pytest
+
+from {{cookiecutter.package_name}}.data import (
+    ShardWriter,
+    StreamingDataLoader,
+    StreamingShardDataset,
+)
+
+
+def make_stream(num_shards=6, per_shard=10, **kwargs):
+    shards = [list(range(s * per_shard, (s + 1) * per_shard)) for s in range(num_shards)]
+    return StreamingShardDataset(
+        list(range(num_shards)), open_shard=shards.__getitem__, seed=0, **kwargs
+    )
+
+
+def flatten(loader):
+    return [int(x) for batch in loader for x in batch]
+
+
+class TestStreamingShardDataset:
+    """Tests for partitioning, shuffling and resume."""
+
+    @pytest.mark.parametrize("num_shards", [8, 3])
+    def test_ranks_and_workers_are_disjoint(self, num_shards):
+        """Every sample is produced exactly once across ranks and workers."""
+        seen = []
+        for rank in range(2):
+            dataset = make_stream(num_shards=num_shards, shuffle_buffer=4)
+            dataset.set_distributed(rank, 2)
+            seen += flatten(StreamingDataLoader(dataset, batch_size=1, num_workers=2))
+        assert sorted(seen) == list(range(num_shards * 10))
+
+    def test_order_is_deterministic_per_epoch(self):
+        """The same seed and epoch replay the same stream; a new epoch reshuffles."""
+        first = list(make_stream(shuffle_buffer=8))
+        assert list(make_stream(shuffle_buffer=8)) == first
+        assert sorted(first) == list(range(60))
+        assert first != list(range(60))
+
+        dataset = make_stream(shuffle_buffer=8)
+        dataset.set_epoch(1)
+        assert list(dataset) != first
+
+    def test_loader_advances_epoch(self):
+        """Each full pass of the loader uses the next epoch's order."""
+        loader = StreamingDataLoader(make_stream(shuffle_buffer=8), batch_size=5)
+        epoch0, epoch1 = flatten(loader), flatten(loader)
+        assert epoch0 != epoch1
+        assert loader.state_dict() == {"epoch": 2, "batches_consumed": 0}
+
+    @pytest.mark.parametrize("num_workers", [0, 2])
+    def test_resume_mid_epoch(self, num_workers):
+        """A loader restored from state_dict continues with the next unseen batch."""
+        loader = StreamingDataLoader(
+            make_stream(shuffle_buffer=8), batch_size=4, num_workers=num_workers
+        )
+        full = [batch.tolist() for batch in loader]
+
+        iterator = iter(loader)
+        head = [next(iterator).tolist() for _ in range(5)]
+        state = loader.state_dict()
+        assert state == {"epoch": 1, "batches_consumed": 5}
+
+        resumed = StreamingDataLoader(
+            make_stream(shuffle_buffer=8), batch_size=4, num_workers=num_workers
+        )
+        resumed.load_state_dict(state)
+        tail = [batch.tolist() for batch in resumed]
+
+        loader.load_state_dict({"epoch": 1, "batches_consumed": 0})
+        epoch1 = [batch.tolist() for batch in loader]
+        assert head == epoch1[:5]
+        assert tail == epoch1[5:]
+        assert epoch1 != full
+
+    def test_from_packed(self, tmp_path):
+        """Packed shards are streamed once each, with labels."""
+        with ShardWriter(tmp_path, shard_size_bytes=64) as writer:
+            for i in range(12):
+                writer.add(np.array([i], dtype=np.int64), label=i % 2)
+
+        dataset = StreamingShardDataset.from_packed(tmp_path, shuffle_buffer=4)
+        samples = list(dataset)
+        assert len(dataset) == 12
+        assert sorted(int(x) for x, _ in samples) == list(range(12))
+        assert all(label == int(x) % 2 for x, label in samples)
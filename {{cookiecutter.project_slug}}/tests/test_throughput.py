@@ -0,0 +1,103 @@
+"""Tests for the ThroughputMonitor callback."""
+
+import lightning as L
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from {{cookiecutter.package_name}}.callbacks import ThroughputMonitor
+from {{cookiecutter.package_name}}.callbacks.throughput import compute_dtype
+from {{cookiecutter.package_name}}.data.profiling import batch_size_of
+from {{cookiecutter.package_name}}.models import BaseModel
+
+IN, OUT, BATCH = 16, 8, 4
+# Forward matmul plus the weight gradient (inputs need no gradient)
+STEP_FLOPS = 2 * 2 * BATCH * IN * OUT
+
+
+class LinearModel(BaseModel):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = torch.nn.Linear(IN, OUT, bias=False)
+
+    def forward(self, x):
+        return self.layer(x)
+
+    def training_step(self, batch, batch_idx):
+        x, y = batch
+        return torch.nn.functional.mse_loss(self(x), y)
+
+
+class TokenModel(LinearModel):
+    def batch_stats(self, batch):
+        x, _ = batch
+        return len(x), x.numel()
+
+
+class TextModel(LinearModel):
+    """Batches are lists of strings, with no tensor to count samples from."""
+
+    def training_step(self, batch, batch_idx):
+        return self(torch.randn(len(batch), IN)).pow(2).mean()
+
+
+def fit(model, callbacks=None, max_steps=6, loader=None):
+    data = TensorDataset(torch.randn(32, IN), torch.randn(32, OUT))
+    trainer = L.Trainer(
+        max_steps=max_steps, logger=False, enable_checkpointing=False, enable_progress_bar=False,
+        log_every_n_steps=2, callbacks=callbacks,
+    )
+    trainer.fit(model, loader or DataLoader(data, batch_size=BATCH))
+    return trainer.logged_metrics
+
+
+class TestThroughputMonitor:
+    """Tests for ThroughputMonitor."""
+
+    def test_flops_counted_on_first_step(self):
+        """FLOPs per step match the matmul count; no MFU without a known peak."""
+        metrics = fit(LinearModel(), [ThroughputMonitor()])
+        assert metrics["throughput/flops_per_step"] == STEP_FLOPS
+        assert metrics["throughput/samples_per_sec"] > 0
+        assert metrics["throughput/tflops_per_sec"] > 0
+        assert "throughput/mfu" not in metrics
+        assert "throughput/tokens_per_sec" not in metrics
+
+    def test_mfu_and_tokens(self):
+        """A configured peak gives MFU, and batch_stats() tokens give tokens/s."""
+        metrics = fit(TokenModel(), [ThroughputMonitor(peak_tflops=1.0)])
+        achieved = metrics["throughput/tflops_per_sec"]
+        assert metrics["throughput/mfu"] == pytest.approx(achieved / 1.0)
+        assert metrics["throughput/tokens_per_sec"] == pytest.approx(
+            metrics["throughput/samples_per_sec"] * IN
+        )
+
+    def test_compiled_model_counts_without_recompiling(self):
+        """The counted step runs eagerly, so compiling doesn't happen twice."""
+        torch._dynamo.reset()
+        model = LinearModel(compile={"backend": "eager"})
+        metrics = fit(model, [ThroughputMonitor()])
+        assert "forward" in model.__dict__
+        assert metrics["throughput/flops_per_step"] == STEP_FLOPS
+        assert metrics["compile/recompiles"] == 0
+
+    def test_off_by_default(self):
+        metrics = fit(LinearModel())
+        assert not any(key.startswith("throughput/") for key in metrics)
+
+    def test_batch_without_tensors_is_skipped(self):
+        """An unknown batch size skips logging with a warning instead of failing fit."""
+        loader = DataLoader([f"sample {i}" for i in range(32)], batch_size=BATCH)
+        with pytest.warns(UserWarning, match="batch_stats"):
+            metrics = fit(TextModel(), [ThroughputMonitor()], loader=loader)
+        assert not any(key.startswith("throughput/") for key in metrics)
+
+    def test_batch_size_of(self):
+        assert batch_size_of({"ids": torch.zeros(3, 5), "label": torch.zeros(3)}) == 3
+        assert batch_size_of(("name", [torch.zeros(7, 2)])) == 7
+        assert batch_size_of({"text": "no tensors"}) == 0
+
+    def test_compute_dtype(self):
+        assert compute_dtype("bf16-mixed") is torch.bfloat16
+        assert compute_dtype("16-mixed") is torch.float16
+        assert compute_dtype("32-true") is torch.float32
@@ -0,0 +1,94 @@
+"""Tests for batch-level augmentation."""
+
+import torch
+
+from {{cookiecutter.package_name}}.data import BaseDataModule, BatchAugment
+
+
+def images(n=16, size=8):
+    return torch.arange(n * 3 * size * size, dtype=torch.float32).reshape(n, 3, size, size)
+
+
+class TestBatchAugment:
+    """Tests for BatchAugment."""
+
+    def test_crops_are_windows_of_the_padded_input(self):
+        """Each crop is a contiguous window of its own padded sample."""
+        x = images()
+        out = BatchAugment(crop_size=8, padding=2, seed=0)(x)
+        padded = torch.nn.functional.pad(x, [2] * 4)
+
+        assert out.shape == x.shape
+        for i in range(len(x)):
+            windows = padded[i].unfold(1, 8, 1).unfold(2, 8, 1)  # (C, dy, dx, 8, 8)
+            matches = (windows == out[i][:, None, None]).flatten(3).all(-1).all(0)
+            assert matches.any()
+
+    def test_flip_probability(self):
+        """p=1 flips every sample, p=0 none."""
+        x = images()
+        assert torch.equal(BatchAugment(hflip_p=1.0)(x), x.flip(-1))
+        assert torch.equal(BatchAugment(vflip_p=1.0)(x), x.flip(-2))
+        assert torch.equal(BatchAugment(hflip_p=0.0)(x), x)
+
+    def test_per_sample_randomness_is_seeded(self):
+        """Samples get independent draws; the same seed reproduces them."""
+        x = images(n=64)
+        a = BatchAugment(hflip_p=0.5, seed=3)
+        out = a(x)
+        flipped = sum(torch.equal(out[i], x[i].flip(-1)) for i in range(64))
+        assert 0 < flipped < 64
+        assert torch.equal(out, BatchAugment(hflip_p=0.5, seed=3)(x))
+        assert not torch.equal(out, a(x))
+
+    def test_ranks_draw_different_augmentations(self, monkeypatch):
+        """The seed is offset by the global rank."""
+        from lightning.fabric.utilities.rank_zero import rank_zero_only
+
+        x = images(n=64)
+        rank0 = BatchAugment(hflip_p=0.5, seed=3)(x)
+        monkeypatch.setattr(rank_zero_only, "rank", 1)
+        assert not torch.equal(BatchAugment(hflip_p=0.5, seed=3)(x), rank0)
+
+    def test_uint8_and_normalize(self):
+        """Integer batches are scaled to [0, 1] before normalization."""
+        x = torch.full((2, 3, 4, 4), 255, dtype=torch.uint8)
+        out = BatchAugment(mean=[0.5] * 3, std=[0.5] * 3)(x)
+        assert out.dtype == torch.float32
+        assert torch.allclose(out, torch.ones_like(out))
+
+    def test_apply_to_structured_batch(self):
+        """Only the selected element of the batch is augmented."""
+        x, y = images(n=4), torch.arange(4)
+        augment = BatchAugment(hflip_p=1.0)
+        out_x, out_y = augment.apply((x, y))
+        assert torch.equal(out_x, x.flip(-1))
+        assert out_y is y
+        by_key = BatchAugment(hflip_p=1.0, key="image").apply({"image": x})
+        assert torch.equal(by_key["image"], out_x)
+
+
+class TestBatchTransformHook:
+    """Tests for BaseDataModule.batch_transform."""
+
+    def test_random_steps_only_during_training(self):
+        """Eval batches are normalized and center-cropped but not randomly augmented."""
+
+        class Trainer:
+            training = True
+
+        augment = BatchAugment(
+            crop_size=6, hflip_p=1.0, noise_std=1.0, mean=[1.0] * 3, std=[2.0] * 3
+        )
+        datamodule = BaseDataModule(batch_transform=augment)
+        batch = (images(n=2), torch.zeros(2))
+        datamodule.trainer = Trainer()
+        train_x = datamodule.on_after_batch_transfer(batch, 0)[0]
+
+        Trainer.training = False
+        eval_x, eval_y = datamodule.on_after_batch_transfer(batch, 0)
+        expected = (batch[0][..., 1:7, 1:7] - 1.0) / 2.0
+        assert torch.equal(eval_x, expected)
+        assert eval_y is batch[1]
+        assert train_x.shape == eval_x.shape
+        assert not torch.equal(train_x, eval_x)
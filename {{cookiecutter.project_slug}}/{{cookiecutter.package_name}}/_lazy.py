@@ -0,0 +1,38 @@
+"""Lazy package exports for {{cookiecutter.project_name}}.
+
+Subpackage ``__init__`` modules list their public names here instead of
+importing them, so ``import {{cookiecutter.package_name}}.data.index`` or reading
+``{{cookiecutter.package_name}}.paths`` doesn't pull in torch and Lightning. A name's
+submodule is imported the first time the name is accessed (PEP 562).
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def attach(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Module ``__getattr__`` and ``__dir__`` resolving ``exports`` on first access.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> submodule (relative to ``package``) defining it
+
+    Usage (in a package ``__init__``):
+        __getattr__, __dir__ = attach(__name__, {"BaseModel": "base"})
+        __all__ = ["BaseModel"]
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{exports[name]}", package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
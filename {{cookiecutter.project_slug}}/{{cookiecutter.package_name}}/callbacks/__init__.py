@@ -0,0 +1,24 @@
+"""Lightning callbacks for {{cookiecutter.project_name}}."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# Public name -> defining submodule; imported on first access (see _lazy.py)
+_EXPORTS = {
+    "DataPipelineMonitor": "data_pipeline",
+    "EMA": "ema",
+    "MemoryMonitor": "memory",
+    "StepTimer": "step_timer",
+    "ThroughputMonitor": "throughput",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .data_pipeline import DataPipelineMonitor
+    from .ema import EMA
+    from .memory import MemoryMonitor
+    from .step_timer import StepTimer
+    from .throughput import ThroughputMonitor
@@ -0,0 +1,47 @@
+"""Input-pipeline monitoring for {{cookiecutter.project_name}}."""
+
+import lightning as L
+from lightning.pytorch.callbacks import Callback
+
+
+class DataPipelineMonitor(Callback):
+    """Log the datamodule's input-pipeline statistics during training.
+
+    Calls ``trainer.datamodule.pipeline_stats()`` (see BaseDataModule) and logs
+    the returned metrics, e.g. ``data/wait_fraction`` when prefetching is on.
+
+    Usage (in config YAML):
+        trainer:
+          callbacks:
+            - class_path: {{cookiecutter.package_name}}.callbacks.DataPipelineMonitor
+              init_args:
+                log_every_n_steps: 50
+    """
+
+    def __init__(self, log_every_n_steps: int = 50):
+        """Initialize the monitor.
+
+        Args:
+            log_every_n_steps: Log interval in optimizer steps
+        """
+        super().__init__()
+        self.log_every_n_steps = log_every_n_steps
+
+    def on_train_batch_end(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, outputs, batch, batch_idx
+    ):
+        if trainer.global_step % self.log_every_n_steps == 0:
+            self._log_stats(trainer, pl_module)
+
+    def on_train_epoch_end(self, trainer: L.Trainer, pl_module: L.LightningModule):
+        self._log_stats(trainer, pl_module)
+
+    def _log_stats(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        if trainer.sanity_checking:
+            return
+        pipeline_stats = getattr(trainer.datamodule, "pipeline_stats", None)
+        if pipeline_stats is None:
+            return
+        stats = pipeline_stats()
+        if stats:
+            pl_module.log_dict(stats)
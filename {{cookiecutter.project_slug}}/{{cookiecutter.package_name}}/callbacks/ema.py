@@ -0,0 +1,158 @@
+"""Exponential moving average of model weights for {{cookiecutter.project_name}}."""
+
+from typing import Any, Dict, List, Optional
+
+import lightning as L
+import torch
+from lightning.pytorch.callbacks import Callback
+
+
+class EMA(Callback):
+    """Keep an exponential moving average of the trainable weights.
+
+    Every ``every_n_steps`` optimizer steps the shadow weights move towards
+    the current ones with a single ``torch._foreach_lerp_`` over all
+    parameters. The decay is raised to ``every_n_steps`` so the averaging
+    horizon in steps doesn't depend on the update interval. During
+    validation the shadow weights are swapped into the model, so validation
+    metrics (and checkpoint selection) reflect the EMA model.
+
+    The shadow weights can be stored in a lower precision and/or on the CPU
+    to save accelerator memory. In bfloat16, updates smaller than the
+    format's resolution are lost; update less often (larger ``every_n_steps``,
+    hence larger individual updates) or keep float32.
+
+    The shadow weights are part of the callback state, so they are saved in
+    every checkpoint, including LightningReflow pause checkpoints, and restored
+    on resume.
+
+    Usage (in config YAML):
+        trainer:
+          callbacks:
+            - class_path: {{cookiecutter.package_name}}.callbacks.EMA
+              init_args:
+                decay: 0.999
+                every_n_steps: 1
+    """
+
+    def __init__(
+        self,
+        decay: float = 0.999,
+        every_n_steps: int = 1,
+        warmup: bool = True,
+        dtype: Optional[str] = None,
+        device: Optional[str] = None,
+        validate_with_ema: bool = True,
+    ):
+        """Initialize the EMA.
+
+        Args:
+            decay: Per-step decay; the average spans roughly ``1 / (1 - decay)`` steps
+            every_n_steps: Update interval in optimizer steps
+            warmup: Use ``min(decay, (1 + n) / (10 + n))`` for the n-th update, so
+                early random weights are forgotten quickly
+            dtype: Shadow weight dtype, e.g. "bfloat16" (default: the parameters')
+            device: Shadow weight device, e.g. "cpu" (default: the parameters')
+            validate_with_ema: Swap the shadow weights in during validation
+        """
+        super().__init__()
+        if not 0.0 <= decay < 1.0:
+            raise ValueError(f"decay must be in [0, 1), got {decay}")
+        if every_n_steps < 1:
+            raise ValueError(f"every_n_steps must be >= 1, got {every_n_steps}")
+        self.decay = decay
+        self.every_n_steps = every_n_steps
+        self.warmup = warmup
+        self.dtype = getattr(torch, dtype) if dtype else None
+        self.device = torch.device(device) if device else None
+        self.validate_with_ema = validate_with_ema
+
+        self.num_updates = 0
+        self.names: List[str] = []
+        self.shadow: List[torch.Tensor] = []
+        self._loaded: Optional[Dict[str, torch.Tensor]] = None
+        self._backup: Optional[List[torch.Tensor]] = None
+        self._params: List[torch.nn.Parameter] = []
+        self._last_step = -1
+
+    def _to_shadow(self, tensor: torch.Tensor, param: torch.Tensor) -> torch.Tensor:
+        """``tensor`` on the shadow device and dtype for ``param``, always a new copy."""
+        device = self.device or param.device
+        return tensor.detach().to(device=device, dtype=self.dtype or param.dtype, copy=True)
+
+    def on_fit_start(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        named = [(n, p) for n, p in pl_module.named_parameters() if p.requires_grad]
+        self.names = [name for name, _ in named]
+        self._params = [p for _, p in named]
+        if self._loaded is not None:
+            missing = set(self.names) - set(self._loaded)
+            if missing:
+                raise KeyError(f"EMA state has no shadow for {sorted(missing)}")
+            self.shadow = [self._to_shadow(self._loaded[n], p) for n, p in named]
+            self._loaded = None
+        else:
+            self.shadow = [self._to_shadow(p, p) for _, p in named]
+
+    def on_train_batch_end(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, outputs, batch, batch_idx
+    ) -> None:
+        step = trainer.global_step
+        # With gradient accumulation, several batches end on the same optimizer step
+        if step == self._last_step or step % self.every_n_steps:
+            return
+        self._last_step = step
+        self.update()
+
+    @torch.no_grad()
+    def update(self) -> None:
+        """Move the shadow weights towards the module's current weights."""
+        decay = self.decay
+        if self.warmup:
+            decay = min(decay, (1 + self.num_updates) / (10 + self.num_updates))
+        weight = 1.0 - decay**self.every_n_steps
+        params = [p.to(s.device, s.dtype) for p, s in zip(self._params, self.shadow)]
+        torch._foreach_lerp_(self.shadow, params, weight)
+        self.num_updates += 1
+
+    @torch.no_grad()
+    def swap_in(self) -> None:
+        """Load the shadow weights into the module, keeping the originals aside."""
+        if self._backup is not None or not self.shadow:
+            return
+        params = self._params
+        self._backup = [p.to(self.device or p.device, copy=True) for p in params]
+        torch._foreach_copy_(params, [s.to(p.device) for s, p in zip(self.shadow, params)])
+
+    @torch.no_grad()
+    def swap_out(self) -> None:
+        """Restore the weights replaced by ``swap_in()``."""
+        if self._backup is None:
+            return
+        params = self._params
+        torch._foreach_copy_(params, [b.to(p.device) for b, p in zip(self._backup, params)])
+        self._backup = None
+
+    def on_validation_start(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        if self.validate_with_ema and not trainer.sanity_checking:
+            self.swap_in()
+
+    def on_validation_end(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        self.swap_out()
+
+    def on_save_checkpoint(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, checkpoint: Dict[str, Any]
+    ) -> None:
+        # A checkpoint taken mid-validation must still hold the trained weights
+        if self._backup is not None:
+            for name, original in zip(self.names, self._backup):
+                checkpoint["state_dict"][name] = original.clone()
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {
+            "num_updates": self.num_updates,
+            "shadow": dict(zip(self.names, self.shadow)),
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, Any]) -> None:
+        self.num_updates = state_dict["num_updates"]
+        self._loaded = state_dict["shadow"]
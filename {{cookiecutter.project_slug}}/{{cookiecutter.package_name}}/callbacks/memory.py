@@ -0,0 +1,196 @@
+"""Memory instrumentation and leak detection for {{cookiecutter.project_name}}."""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Union
+
+import lightning as L
+import torch
+from lightning.pytorch.callbacks import Callback
+
+from .. import paths
+from ..utils.procfs import pss_bytes, rss_bytes
+
+# Metrics checked for monotonic growth
+WATCHED = ("rss_mb", "children_pss_mb", "python_blocks", "cuda_allocated_mb")
+
+
+class MemoryMonitor(Callback):
+    """Sample host, dataloader worker, Python heap and torch allocator memory
+    every ``every_n_steps`` steps, and warn when it keeps growing.
+
+    Each sample reads, from ``/proc`` (Linux; other platforms skip them):
+
+    - ``rss_mb``: this process's resident set
+    - ``children_rss_mb`` / ``children_pss_mb``: summed over child processes.
+      These are mostly DataLoader workers, but also include e.g. Inductor
+      compile workers, whose memory stays flat. PSS splits pages shared with
+      the parent, so copy-on-write growth from touching a forked dataset in
+      the workers shows up there.
+
+    plus ``python_blocks`` (live Python heap blocks from
+    ``sys.getallocatedblocks()``, free to read) and, on CUDA,
+    ``cuda_allocated_mb``, ``cuda_reserved_mb`` and ``cuda_alloc_retries``.
+    With ``trace_python``, ``tracemalloc`` also reports ``python_traced_mb``
+    and, on an alert, the source lines that grew the most; tracing slows
+    Python allocations down, so leave it off until you're chasing a leak.
+
+    Samples are logged as ``memory/*`` and appended to a JSON-lines timeline
+    (``<paths.LOGS>/memory/<run>_rank<N>.jsonl`` by default). A warning is
+    raised when a watched metric rose at every one of the last ``window``
+    samples, by ``growth_threshold_mb`` in total (Python blocks are counted
+    as 64 bytes each). The usual causes are tensors kept alive across steps,
+    e.g. appending a loss that still holds its graph, and workers bloating.
+
+    Usage (in config YAML):
+        trainer:
+          callbacks:
+            - class_path: {{cookiecutter.package_name}}.callbacks.MemoryMonitor
+              init_args:
+                every_n_steps: 100
+                window: 10
+                growth_threshold_mb: 256
+    """
+
+    def __init__(
+        self,
+        every_n_steps: int = 100,
+        window: int = 10,
+        growth_threshold_mb: float = 256.0,
+        trace_python: bool = False,
+        timeline_path: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            every_n_steps: Sampling interval in optimizer steps
+            window: Consecutive rising samples that count as a leak
+            growth_threshold_mb: Minimum growth over the window to warn about
+            trace_python: Trace Python allocations with tracemalloc
+            timeline_path: JSON-lines file for the samples (default: under paths.LOGS)
+        """
+        super().__init__()
+        self.every_n_steps = every_n_steps
+        self.window = window
+        self.growth_threshold_mb = growth_threshold_mb
+        self.trace_python = trace_python
+        self.timeline_path = Path(timeline_path) if timeline_path else None
+        self.history: Deque[Dict[str, float]] = deque(maxlen=window + 1)
+        self.alerts: List[str] = []
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+        self._last_step = -1
+
+    def setup(self, trainer: L.Trainer, pl_module: L.LightningModule, stage: str) -> None:
+        if self.timeline_path is None:
+            run = time.strftime("%Y%m%d-%H%M%S")
+            name = f"{run}_rank{trainer.global_rank}.jsonl"
+            self.timeline_path = paths.LOGS / "memory" / name
+        self.timeline_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.trace_python and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if tracemalloc.is_tracing():
+            self._snapshot = tracemalloc.take_snapshot()
+
+    def teardown(self, trainer: L.Trainer, pl_module: L.LightningModule, stage: str) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def on_train_batch_end(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, outputs, batch, batch_idx
+    ) -> None:
+        step = trainer.global_step
+        # Once per optimizer step, also under gradient accumulation
+        if step % self.every_n_steps or step == self._last_step:
+            return
+        self._last_step = step
+        sample = self.sample(pl_module.device)
+        pl_module.log_dict({f"memory/{k}": float(v) for k, v in sample.items()})
+        with open(self.timeline_path, "a") as f:
+            f.write(json.dumps({"step": step, "time": time.time(), **sample}) + "\n")
+        self.history.append(sample)
+        self._check_growth(step, trainer.global_rank)
+
+    def sample(self, device: torch.device) -> Dict[str, float]:
+        """Current memory readings; unavailable ones are left out."""
+        sample: Dict[str, float] = {}
+        rss = rss_bytes()
+        if rss is not None:
+            sample["rss_mb"] = rss / 2**20
+        children = _child_pids()
+        if children is not None:
+            sample["children"] = len(children)
+            sample["children_rss_mb"] = sum(rss_bytes(pid) or 0 for pid in children) / 2**20
+            sample["children_pss_mb"] = sum(pss_bytes(pid) or 0 for pid in children) / 2**20
+        sample["python_blocks"] = sys.getallocatedblocks()
+        if tracemalloc.is_tracing():
+            sample["python_traced_mb"] = tracemalloc.get_traced_memory()[0] / 2**20
+        if device.type == "cuda":
+            stats = torch.cuda.memory_stats(device)
+            sample["cuda_allocated_mb"] = stats.get("allocated_bytes.all.current", 0) / 2**20
+            sample["cuda_reserved_mb"] = stats.get("reserved_bytes.all.current", 0) / 2**20
+            sample["cuda_alloc_retries"] = stats.get("num_alloc_retries", 0)
+        return sample
+
+    def _check_growth(self, step: int, rank: int) -> None:
+        if len(self.history) <= self.window:
+            return
+        for key in WATCHED:
+            values = [s.get(key) for s in self.history]
+            if any(v is None for v in values):
+                continue
+            rising = all(b > a for a, b in zip(values, values[1:]))
+            # Blocks are counts; treat each as ~64 bytes to share the MB threshold
+            scale = 64 / 2**20 if key == "python_blocks" else 1.0
+            growth = (values[-1] - values[0]) * scale
+            if rising and growth >= self.growth_threshold_mb:
+                self._alert(key, growth, step, rank)
+                # Start a fresh window so a steady leak warns once per window
+                self.history.clear()
+                return
+
+    def _alert(self, key: str, growth_mb: float, step: int, rank: int) -> None:
+        span = self.window * self.every_n_steps
+        message = (
+            f"Possible memory leak on rank {rank}: {key} grew {growth_mb:.0f} MB over the last "
+            f"{span} steps (to step {step}), rising at every sample. Look for tensors kept "
+            f"across steps (e.g. accumulating losses without .item()/.detach()) or, for "
+            f"children_*, dataset objects being touched and copied in each worker. "
+            f"Timeline: {self.timeline_path}"
+        )
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            if self._snapshot is not None:
+                top = snapshot.compare_to(self._snapshot, "lineno")[:10]
+                message += "\nTop Python allocation growth:\n" + "\n".join(f"  {s}" for s in top)
+            self._snapshot = snapshot
+        self.alerts.append(message)
+        warnings.warn(message)
+
+
+def _child_pids() -> Optional[List[int]]:
+    """PIDs of this process's children, or None without /proc."""
+    if not os.path.isdir("/proc"):
+        return None
+    parent = os.getpid()
+    children = []
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat") as f:
+                # The command name may contain spaces; fields resume after its ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == parent:
+            children.append(int(entry.name))
+    return children
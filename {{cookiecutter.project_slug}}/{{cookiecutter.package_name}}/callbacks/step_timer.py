@@ -0,0 +1,198 @@
+"""Training step phase timing for {{cookiecutter.project_name}}."""
+
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import lightning as L
+import numpy as np
+import torch
+from lightning.pytorch.callbacks import Callback
+
+# Phases of a training step, in the order they happen
+PHASES = ("data_wait", "forward", "backward", "optimizer", "logging", "checkpoint")
+
+
+class PhaseHistogram:
+    """Log-spaced histogram of durations, from 10 us to 1000 s.
+
+    Constant memory however many steps are recorded; percentiles are read
+    from bin edges, so they are accurate to the bin width (about 5%).
+    """
+
+    EDGES = np.logspace(-5, 3, 8 * 48 + 1)
+
+    def __init__(self):
+        self.counts = np.zeros(len(self.EDGES) + 1, dtype=np.int64)
+        self.total_s = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[np.searchsorted(self.EDGES, seconds)] += 1
+        self.total_s += seconds
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bin holding the ``q``-th percentile, in seconds."""
+        rank = np.searchsorted(np.cumsum(self.counts), q / 100 * self.count)
+        return float(self.EDGES[min(rank, len(self.EDGES) - 1)])
+
+
+class StepTimer(Callback):
+    """Time the phases of training steps: data wait, forward, backward,
+    optimizer step, logging and checkpointing.
+
+    Forward, backward and optimizer are timed on every ``sample_every_n_steps``-th
+    step only, with a CUDA synchronize at each phase boundary so queued kernels
+    are attributed to the right phase; other steps take no timestamps and
+    don't synchronize. Logging (``Logger.log_metrics``) and checkpointing
+    (``Trainer.save_checkpoint``, including pause checkpoints) are timed on
+    every call; data wait on sampled steps is the time between the previous
+    step's end and this step's start, minus logging and checkpointing.
+
+    Every ``log_every_n_steps`` steps, p50/p90/max and the share of the
+    sampled step time are logged per phase as ``time/<phase>_*``, and the
+    histograms are reset.
+
+    The train script registers a StepTimer by default. To change its
+    settings, add one to ``trainer.callbacks``; the default then steps aside.
+
+    Usage (in config YAML):
+        trainer:
+          callbacks:
+            - class_path: {{cookiecutter.package_name}}.callbacks.StepTimer
+              init_args:
+                sample_every_n_steps: 10
+                log_every_n_steps: 200
+    """
+
+    def __init__(self, sample_every_n_steps: int = 10, log_every_n_steps: int = 200):
+        """Initialize the timer.
+
+        Args:
+            sample_every_n_steps: Time the compute phases of every n-th step (0 disables)
+            log_every_n_steps: Log and reset the histograms every n steps
+        """
+        super().__init__()
+        self.sample_every_n_steps = sample_every_n_steps
+        self.log_every_n_steps = log_every_n_steps
+        self.histograms = {phase: PhaseHistogram() for phase in PHASES}
+        self.enabled = sample_every_n_steps > 0
+        self._sampled = False
+        self._sync: Callable[[], None] = lambda: None
+        self._marks: Dict[str, float] = {}
+        self._batch_end: Optional[float] = None
+        self._host_in_gap = 0.0
+        self._logged_step = -1
+        self._patched: List[Tuple[Any, str, Any]] = []
+
+    def setup(self, trainer: L.Trainer, pl_module: L.LightningModule, stage: str) -> None:
+        timers = [c for c in trainer.callbacks if isinstance(c, StepTimer)]
+        # Defaults are appended after configured callbacks; a configured timer wins
+        if len(timers) > 1 and timers[-1] is self:
+            self.enabled = False
+
+    def on_fit_start(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        if not self.enabled:
+            return
+        if pl_module.device.type == "cuda":
+            self._sync = lambda: torch.cuda.synchronize(pl_module.device)
+        for logger in trainer.loggers:
+            self._wrap(logger, "log_metrics", "logging")
+        self._wrap(trainer, "save_checkpoint", "checkpoint")
+
+    def on_fit_end(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        for obj, name, original in reversed(self._patched):
+            if original is None:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, original)
+        self._patched.clear()
+
+    def _wrap(self, obj: Any, name: str, phase: str) -> None:
+        """Replace ``obj.name`` on the instance with a version timed into ``phase``."""
+        method = getattr(obj, name)
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                self.histograms[phase].add(elapsed)
+                self._host_in_gap += elapsed
+
+        self._patched.append((obj, name, obj.__dict__.get(name)))
+        setattr(obj, name, timed)
+
+    def _mark(self, name: str) -> float:
+        self._sync()
+        self._marks[name] = now = perf_counter()
+        return now
+
+    def on_train_batch_start(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, batch: Any, batch_idx: int
+    ) -> None:
+        self._sampled = (
+            self.enabled
+            and not trainer.sanity_checking
+            and trainer.global_step % self.sample_every_n_steps == 0
+        )
+        if not self._sampled:
+            return
+        start = self._mark("start")
+        if self._batch_end is not None:
+            wait = start - self._batch_end - self._host_in_gap
+            self.histograms["data_wait"].add(max(wait, 0.0))
+
+    def on_before_backward(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, loss: torch.Tensor
+    ) -> None:
+        if self._sampled:
+            self.histograms["forward"].add(self._mark("backward") - self._marks["start"])
+
+    def on_after_backward(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        if self._sampled:
+            self.histograms["backward"].add(self._mark("after_backward") - self._marks["backward"])
+
+    def on_before_optimizer_step(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, optimizer: torch.optim.Optimizer
+    ) -> None:
+        if self._sampled:
+            self._mark("optimizer")
+
+    def on_train_batch_end(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, outputs, batch, batch_idx
+    ) -> None:
+        if not self.enabled:
+            return
+        if self._sampled and "optimizer" in self._marks:
+            self.histograms["optimizer"].add(self._mark("end") - self._marks["optimizer"])
+        self._marks.clear()
+        step = trainer.global_step
+        due = step % self.log_every_n_steps == 0 and step != self._logged_step
+        if due and self.histograms["forward"].count:
+            pl_module.log_dict(self.summary())
+            self._logged_step = step
+            self.histograms = {phase: PhaseHistogram() for phase in PHASES}
+        # Start the next data-wait window; anything logged or saved from here is excluded
+        self._host_in_gap = 0.0
+        # global_step already counts this batch's optimizer step, so it is the next batch's
+        next_sampled = step % self.sample_every_n_steps == 0
+        self._batch_end = perf_counter() if next_sampled else None
+
+    def summary(self) -> Dict[str, float]:
+        """``time/<phase>_p50_ms``, ``_p90_ms``, ``_max_ms`` and ``_frac`` per recorded phase."""
+        sampled = {p: h for p, h in self.histograms.items() if p not in ("logging", "checkpoint")}
+        step_s = sum(h.total_s / h.count for h in sampled.values() if h.count)
+        stats = {}
+        for phase, histogram in self.histograms.items():
+            if not histogram.count:
+                continue
+            stats[f"time/{phase}_p50_ms"] = histogram.percentile(50) * 1e3
+            stats[f"time/{phase}_p90_ms"] = histogram.percentile(90) * 1e3
+            stats[f"time/{phase}_max_ms"] = histogram.percentile(100) * 1e3
+            if phase in sampled and step_s > 0:
+                stats[f"time/{phase}_frac"] = histogram.total_s / histogram.count / step_s
+        return stats
@@ -0,0 +1,195 @@
+"""Training throughput and FLOPs utilization for {{cookiecutter.project_name}}.
+
+``ThroughputMonitor`` counts the FLOPs of the first training step with
+``torch.utils.flop_counter.FlopCounterMode`` (forward and backward of the
+real step, so no extra pass and no effect on training), then reports
+samples/s, tokens/s, achieved FLOP/s and model FLOPs utilization (MFU)
+over each logging window. MFU is achieved FLOP/s over the device's peak:
+``peak_tflops`` if given, otherwise Lightning's table of dense peaks per
+GPU model and compute dtype.
+
+Unlike Lightning's own ``ThroughputMonitor``, the FLOPs don't have to be
+provided by the model, batches may vary in size, and steps aren't
+synchronized: rates are per device and averaged over the window. FLOPs are
+scaled to each batch by its sample count; with activation checkpointing the
+recomputed forward is counted too. The counted step runs eagerly even when
+BaseModel compiles: torch.compile guards on the active dispatch modes, so
+compiling under the counter would compile forward again once it's gone.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import lightning as L
+import torch
+from lightning.fabric.utilities.throughput import get_available_flops
+from lightning.pytorch.callbacks import Callback
+from lightning.pytorch.utilities import rank_zero_warn
+from torch.utils.flop_counter import FlopCounterMode
+
+from ..data.profiling import batch_size_of
+
+
+def compute_dtype(precision: str) -> torch.dtype:
+    """Dtype matmuls run in under a Trainer ``precision`` setting ("bf16-mixed", "32", ...)."""
+    precision = str(precision)
+    if precision.startswith("bf16"):
+        return torch.bfloat16
+    if precision.startswith("16"):
+        return torch.float16
+    if precision.startswith("64"):
+        return torch.float64
+    return torch.float32
+
+
+def peak_flops(trainer: L.Trainer, peak_tflops: Optional[float] = None) -> Optional[float]:
+    """Peak FLOP/s of one device of ``trainer``, or None when unknown (e.g. CPU)."""
+    if peak_tflops is not None:
+        return peak_tflops * 1e12
+    device = trainer.strategy.root_device
+    if device.type not in ("cuda", "xla"):
+        return None
+    return get_available_flops(device, compute_dtype(trainer.precision))
+
+
+class ThroughputMeter:
+    """Samples/s, tokens/s, FLOP/s and MFU over logging windows.
+
+    Usage:
+        meter = ThroughputMeter(peak_flops=312e12)
+        meter.start()                     # before each training step
+        ...                               # forward, backward, optimizer step
+        meter.stop(samples=32, tokens=4096)
+        stats = meter.compute()           # {"throughput/samples_per_sec": ..., ...}
+    """
+
+    def __init__(self, peak_flops: Optional[float] = None):
+        self.peak_flops = peak_flops
+        self.flops_per_sample: Optional[float] = None
+        self._counter: Optional[FlopCounterMode] = None
+        self._window_start: Optional[float] = None
+        self._steps = 0
+        self._samples = 0
+        self._tokens = 0
+
+    @property
+    def counting(self) -> bool:
+        """Whether FLOPs of the current step are being counted."""
+        return self._counter is not None
+
+    def start(self) -> None:
+        """Start counting FLOPs if this is the first step."""
+        if self.flops_per_sample is None and self._counter is None:
+            self._counter = FlopCounterMode(display=False)
+            self._counter.__enter__()
+
+    def stop(self, samples: Optional[int], tokens: Optional[int] = None) -> None:
+        """Record a finished step of ``samples`` samples (and ``tokens`` tokens).
+
+        A step with an unknown sample count (None) is left out of the rates.
+        """
+        if self._counter is not None:
+            self._counter.__exit__(None, None, None)
+            # Counted once either way; 0 (no FLOP metrics) if the batch size was unknown
+            total = self._counter.get_total_flops()
+            self.flops_per_sample = total / samples if samples else 0.0
+            self._counter = None
+            # The counted step runs slower; start timing after it
+            self._window_start = time.perf_counter()
+            return
+        if samples is None:
+            return
+        self._steps += 1
+        self._samples += samples
+        self._tokens += tokens or 0
+
+    def compute(self) -> Dict[str, float]:
+        """Rates since the previous call (or since the first step), then reset."""
+        now = time.perf_counter()
+        if self._window_start is None or not self._samples:
+            return {}
+        elapsed = now - self._window_start
+        stats = {"throughput/samples_per_sec": self._samples / elapsed}
+        if self._tokens:
+            stats["throughput/tokens_per_sec"] = self._tokens / elapsed
+        if self.flops_per_sample:
+            flops_per_sec = self.flops_per_sample * self._samples / elapsed
+            stats["throughput/flops_per_step"] = self.flops_per_sample * self._samples / self._steps
+            stats["throughput/tflops_per_sec"] = flops_per_sec / 1e12
+            if self.peak_flops:
+                stats["throughput/mfu"] = flops_per_sec / self.peak_flops
+        self._window_start, self._steps, self._samples, self._tokens = now, 0, 0, 0
+        return stats
+
+
+class ThroughputMonitor(Callback):
+    """Log samples/s, tokens/s, FLOPs per step and MFU under ``throughput/``.
+
+    FLOPs are counted on the first training step, which runs eagerly;
+    metrics are logged every ``trainer.log_every_n_steps`` batches. Samples
+    are counted along the first tensor's leading dimension. For tokens/s,
+    define ``batch_stats(batch) -> (samples, tokens)`` on the LightningModule,
+    e.g. ``return len(ids), ids.numel()``; avoid counts that need a device
+    sync such as ``int(mask.sum())``. Batches with no tensor and no
+    ``batch_stats`` are skipped with a warning.
+
+    Usage (in config YAML):
+        trainer:
+          callbacks:
+            - class_path: {{cookiecutter.package_name}}.callbacks.ThroughputMonitor
+              init_args:
+                peak_tflops: 312  # per-device peak, e.g. A100 bf16
+    """
+
+    def __init__(self, peak_tflops: Optional[float] = None):
+        """Initialize the monitor.
+
+        Args:
+            peak_tflops: Peak TFLOP/s of one device for MFU; None looks up the
+                GPU model and precision (no MFU on CPU or unknown devices)
+        """
+        super().__init__()
+        self.peak_tflops = peak_tflops
+        self.meter = ThroughputMeter()
+        self._stashed_forward: Optional[Any] = None
+        self._warned = False
+
+    def on_fit_start(self, trainer: L.Trainer, pl_module: L.LightningModule) -> None:
+        self.meter.peak_flops = peak_flops(trainer, self.peak_tflops)
+
+    def on_train_batch_start(
+        self, trainer: L.Trainer, pl_module: L.LightningModule, batch: Any, batch_idx: int
+    ) -> None:
+        self.meter.start()
+        if self.meter.counting:
+            # Count FLOPs on an eager step (see the module docstring)
+            self._stashed_forward = pl_module.__dict__.pop("forward", None)
+
+    def on_train_batch_end(
+        self,
+        trainer: L.Trainer,
+        pl_module: L.LightningModule,
+        outputs: Any,
+        batch: Any,
+        batch_idx: int,
+    ) -> None:
+        self.meter.stop(*self._batch_stats(pl_module, batch))
+        if self._stashed_forward is not None:
+            pl_module.forward, self._stashed_forward = self._stashed_forward, None
+        if (batch_idx + 1) % trainer.log_every_n_steps == 0:
+            pl_module.log_dict(self.meter.compute())
+
+    def _batch_stats(
+        self, pl_module: L.LightningModule, batch: Any
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Samples and tokens in ``batch``, or (None, None) if they can't be found."""
+        if hasattr(pl_module, "batch_stats"):
+            return pl_module.batch_stats(batch)
+        samples = batch_size_of(batch) or None
+        if samples is None and not self._warned:
+            self._warned = True
+            rank_zero_warn(
+                f"ThroughputMonitor found no tensor in a {type(batch).__name__} batch; define "
+                f"batch_stats(batch) on {type(pl_module).__name__} to log throughput/*"
+            )
+        return samples, None
@@ -1,5 +1,46 @@
 """Data loading and processing for {{cookiecutter.project_name}}."""
 
-from .datamodule import BaseDataModule
+from typing import TYPE_CHECKING
 
-__all__ = ["BaseDataModule"]
+from .._lazy import attach
+
+# Public name -> defining submodule; imported on first access (see _lazy.py)
+_EXPORTS = {
+    "BaseDataModule": "datamodule",
+    "BatchAugment": "transforms",
+    "BucketBatchSampler": "samplers",
+    "CachedDataset": "cache",
+    "DatasetIndex": "index",
+    "DevicePrefetcher": "prefetch",
+    "FeatureCache": "feature_cache",
+    "ResumableDataLoader": "samplers",
+    "ResumableSampler": "samplers",
+    "ShardWriter": "shards",
+    "ShardedDataset": "shards",
+    "SharedMemoryDataLoader": "collate",
+    "StreamingDataLoader": "streaming",
+    "StreamingShardDataset": "streaming",
+    "pad_collate": "samplers",
+    "sample_sizes": "samplers",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .cache import CachedDataset
+    from .collate import SharedMemoryDataLoader
+    from .datamodule import BaseDataModule
+    from .feature_cache import FeatureCache
+    from .index import DatasetIndex
+    from .prefetch import DevicePrefetcher
+    from .samplers import (
+        BucketBatchSampler,
+        ResumableDataLoader,
+        ResumableSampler,
+        pad_collate,
+        sample_sizes,
+    )
+    from .shards import ShardWriter, ShardedDataset
+    from .streaming import StreamingDataLoader, StreamingShardDataset
+    from .transforms import BatchAugment
@@ -0,0 +1,149 @@
+"""DataLoader settings autotuner for {{cookiecutter.project_name}}.
+
+Sweeps ``num_workers``, ``prefetch_factor`` and ``persistent_workers`` against
+the datamodule's real training pipeline and picks the fastest setting. Each
+candidate is run for two short epochs so worker startup and the per-epoch
+re-fork cost of non-persistent workers are both part of the score.
+"""
+
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .profiling import measure_loader
+
+
+@dataclass
+class LoaderTrial:
+    """Measurements for one DataLoader setting."""
+
+    num_workers: int
+    prefetch_factor: Optional[int]
+    persistent_workers: bool
+    startup_s: float
+    restart_s: float
+    samples_per_s: float
+    effective_samples_per_s: float
+
+    def settings(self) -> Dict[str, object]:
+        """The DataLoader arguments of this trial, as BaseDataModule init args."""
+        return {
+            "num_workers": self.num_workers,
+            "prefetch_factor": self.prefetch_factor,
+            "persistent_workers": self.persistent_workers,
+        }
+
+    def as_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+def default_worker_counts() -> List[int]:
+    """0, 1, 2, 4, ... up to the number of usable CPUs."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    counts = [0, 1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run_trial(
+    datamodule,
+    num_workers: int,
+    prefetch_factor: Optional[int],
+    persistent_workers: bool,
+    max_batches: int,
+) -> LoaderTrial:
+    """Measure one setting over two short epochs of ``datamodule.train_dataloader()``."""
+    datamodule.num_workers = num_workers
+    datamodule.prefetch_factor = prefetch_factor if num_workers > 0 else None
+    datamodule.persistent_workers = persistent_workers and num_workers > 0
+
+    loader = datamodule.train_dataloader()
+    first = measure_loader(loader, max_batches)
+    second = measure_loader(loader, max_batches)
+    del loader
+
+    total_s = first["total_s"] + second["total_s"]
+    samples = first["samples"] + second["samples"]
+    return LoaderTrial(
+        num_workers=num_workers,
+        prefetch_factor=datamodule.prefetch_factor,
+        persistent_workers=datamodule.persistent_workers,
+        startup_s=first["time_to_first_batch_s"],
+        restart_s=second["time_to_first_batch_s"],
+        samples_per_s=(first["samples_per_s"] + second["samples_per_s"]) / 2,
+        effective_samples_per_s=samples / total_s if total_s > 0 else 0.0,
+    )
+
+
+def autotune_dataloader(
+    datamodule,
+    worker_counts: Optional[Sequence[int]] = None,
+    prefetch_factors: Sequence[int] = (2, 4, 8),
+    max_batches: int = 50,
+    tolerance: float = 0.05,
+    log=print,
+) -> List[LoaderTrial]:
+    """Find the fastest DataLoader settings for ``datamodule``'s training loader.
+
+    Sweeps worker counts first (prefetch_factor=2, persistent workers), then
+    prefetch factors and persistence for the best worker count. Settings within
+    ``tolerance`` of the best throughput are considered equal, and the one
+    with fewer workers and smaller prefetch (less memory) wins.
+
+    Args:
+        datamodule: A BaseDataModule on which setup("fit") has been called
+        worker_counts: Candidate num_workers values (default: powers of two up to
+            the CPU count)
+        prefetch_factors: Candidate prefetch_factor values
+        max_batches: Batches per measured epoch
+        tolerance: Relative throughput difference treated as noise
+        log: Progress callback (e.g. print), or None
+
+    Returns:
+        All trials, best first
+    """
+    trials: List[LoaderTrial] = []
+
+    def run(workers: int, prefetch: Optional[int], persistent: bool) -> LoaderTrial:
+        trial = run_trial(datamodule, workers, prefetch, persistent, max_batches)
+        trials.append(trial)
+        if log is not None:
+            log(
+                f"  workers={trial.num_workers:<3} prefetch={str(trial.prefetch_factor):<4} "
+                f"persistent={str(trial.persistent_workers):<5} "
+                f"startup={trial.startup_s:6.2f}s restart={trial.restart_s:6.2f}s "
+                f"{trial.effective_samples_per_s:10.1f} samples/s"
+            )
+        return trial
+
+    for workers in worker_counts or default_worker_counts():
+        run(workers, 2, True)
+
+    best_workers = _rank(trials, tolerance)[0].num_workers
+    if best_workers > 0:
+        for prefetch in prefetch_factors:
+            for persistent in (True, False):
+                if (prefetch, persistent) != (2, True):
+                    run(best_workers, prefetch, persistent)
+
+    return _rank(trials, tolerance)
+
+
+def _rank(trials: Iterable[LoaderTrial], tolerance: float) -> List[LoaderTrial]:
+    trials = list(trials)
+    best = max(t.effective_samples_per_s for t in trials)
+    threshold = best * (1.0 - tolerance)
+
+    def key(t: LoaderTrial):
+        # Settings within tolerance of the best are ranked by resource cost
+        good_enough = t.effective_samples_per_s >= threshold
+        cost = (t.num_workers, t.prefetch_factor or 0)
+        return (not good_enough, cost if good_enough else (), -t.effective_samples_per_s)
+
+    return sorted(trials, key=key)
@@ -0,0 +1,192 @@
+"""Cross-epoch sample cache for {{cookiecutter.project_name}}.
+
+CachedDataset keeps decoded samples in a fixed-budget shared-memory pool that
+every DataLoader worker reads and writes, so after the first epoch most
+samples are served without touching the underlying dataset again.
+
+Only cache deterministic work (loading, decoding). Random augmentations must
+run after the cache, e.g. as a batch transform, or they get frozen in.
+"""
+
+import multiprocessing
+import pickle
+from typing import Any, Dict, Optional
+
+import torch
+from torch.utils.data import Dataset
+
+CACHE_POLICIES = ("lru", "lfu")
+
+# Indices into the shared counters tensor
+_TICK, _HITS, _MISSES, _EVICTIONS, _USED_SLOTS, _OVERSIZE = range(6)
+
+# Headroom over the first sample's size when sizing slots automatically
+_SLOT_HEADROOM = 1.5
+_SLOT_ALIGNMENT = 64
+
+
+class SharedMemoryCache:
+    """Fixed-size slot cache in shared memory.
+
+    The byte budget is split into equal slots, each holding one pickled
+    sample. All bookkeeping lives in shared tensors guarded by a process lock,
+    so a sample cached by one worker is a hit for every other worker and for
+    later epochs. When full, the slot with the lowest score is evicted: the
+    last-access tick for "lru", the access count for "lfu".
+
+    The cache must be created in the main process before workers start.
+    """
+
+    def __init__(
+        self,
+        num_keys: int,
+        capacity_bytes: int,
+        slot_bytes: int,
+        policy: str = "lru",
+    ):
+        """Initialize the cache.
+
+        Args:
+            num_keys: Number of distinct keys (dataset length)
+            capacity_bytes: Total shared-memory budget
+            slot_bytes: Maximum pickled size of one sample; larger samples are not
+                cached
+            policy: Eviction policy, "lru" or "lfu"
+        """
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy '{policy}', expected one of {CACHE_POLICIES}")
+        num_slots = capacity_bytes // slot_bytes
+        if num_slots < 1:
+            raise ValueError(
+                f"Cache budget of {capacity_bytes} bytes is smaller than one {slot_bytes}-byte slot"
+            )
+
+        self.policy = policy
+        self.slot_bytes = slot_bytes
+        self.num_slots = num_slots
+
+        self._pool = torch.zeros((num_slots, slot_bytes), dtype=torch.uint8).share_memory_()
+        self._slot_key = torch.full((num_slots,), -1, dtype=torch.int64).share_memory_()
+        self._slot_len = torch.zeros(num_slots, dtype=torch.int64).share_memory_()
+        self._slot_score = torch.zeros(num_slots, dtype=torch.int64).share_memory_()
+        self._key_slot = torch.full((num_keys,), -1, dtype=torch.int64).share_memory_()
+        self._counters = torch.zeros(6, dtype=torch.int64).share_memory_()
+        self._lock = multiprocessing.Lock()
+
+    def get(self, key: int) -> Optional[Any]:
+        """Return the cached sample for ``key``, or None on a miss."""
+        with self._lock:
+            slot = int(self._key_slot[key])
+            if slot < 0:
+                self._counters[_MISSES] += 1
+                return None
+            self._touch(slot)
+            self._counters[_HITS] += 1
+            # Copy out under the lock so the slot can't be evicted mid-read
+            data = self._pool[slot, : int(self._slot_len[slot])].numpy().tobytes()
+        return pickle.loads(data)
+
+    def put(self, key: int, sample: Any) -> bool:
+        """Insert ``sample`` under ``key``, evicting if the cache is full.
+
+        Returns:
+            True if the sample is cached after the call
+        """
+        data = pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            if len(data) > self.slot_bytes:
+                self._counters[_OVERSIZE] += 1
+                return False
+            if self._key_slot[key] >= 0:  # another worker got there first
+                return True
+
+            used = int(self._counters[_USED_SLOTS])
+            if used < self.num_slots:
+                slot = used
+                self._counters[_USED_SLOTS] += 1
+            else:
+                slot = int(torch.argmin(self._slot_score))
+                self._key_slot[self._slot_key[slot]] = -1
+                self._counters[_EVICTIONS] += 1
+
+            self._pool[slot, : len(data)] = torch.frombuffer(bytearray(data), dtype=torch.uint8)
+            self._slot_len[slot] = len(data)
+            self._slot_key[slot] = key
+            self._key_slot[key] = slot
+            self._slot_score[slot] = 0
+            self._touch(slot)
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and occupancy since the cache was created."""
+        counters = self._counters.tolist()
+        lookups = counters[_HITS] + counters[_MISSES]
+        used = counters[_USED_SLOTS]
+        return {
+            "hits": counters[_HITS],
+            "misses": counters[_MISSES],
+            "hit_rate": counters[_HITS] / lookups if lookups else 0.0,
+            "evictions": counters[_EVICTIONS],
+            "oversize": counters[_OVERSIZE],
+            "used_slots": used,
+            "used_bytes": int(self._slot_len[:used].sum()) if used else 0,
+        }
+
+    def _touch(self, slot: int) -> None:
+        if self.policy == "lru":
+            self._counters[_TICK] += 1
+            self._slot_score[slot] = self._counters[_TICK]
+        else:
+            self._slot_score[slot] += 1
+
+
+class CachedDataset(Dataset):
+    """Wrap a map-style dataset with a shared-memory sample cache.
+
+    Usage:
+        dataset = CachedDataset(YourDataset(...), capacity_bytes=8 * 1024**3)
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        capacity_bytes: int,
+        policy: str = "lru",
+        slot_bytes: Optional[int] = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            dataset: Dataset to cache (must support ``len()``)
+            capacity_bytes: Shared-memory budget for cached samples
+            policy: Eviction policy, "lru" or "lfu"
+            slot_bytes: Per-sample size limit; estimated from the first sample if None
+        """
+        self.dataset = dataset
+        if slot_bytes is None:
+            slot_bytes = estimate_slot_bytes(dataset[0])
+        self.cache = SharedMemoryCache(len(dataset), capacity_bytes, slot_bytes, policy)
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def __getitem__(self, idx: int) -> Any:
+        sample = self.cache.get(idx)
+        if sample is None:
+            sample = self.dataset[idx]
+            self.cache.put(idx, sample)
+        return sample
+
+    def __getattr__(self, name: str) -> Any:
+        # Forward dataset-specific attributes (classes, sample_sizes, ...)
+        if name == "dataset":
+            raise AttributeError(name)
+        return getattr(self.dataset, name)
+
+
+def estimate_slot_bytes(sample: Any) -> int:
+    """Slot size for samples like ``sample``, with headroom for size variation."""
+    size = len(pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL))
+    size = int(size * _SLOT_HEADROOM)
+    return size + (-size % _SLOT_ALIGNMENT)
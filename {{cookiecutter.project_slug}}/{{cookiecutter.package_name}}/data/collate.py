@@ -0,0 +1,220 @@
+"""Shared-memory batch collation for {{cookiecutter.project_name}}.
+
+The default collate allocates fresh shared-memory tensors for every batch in
+every worker and passes their handles to the main process. SharedMemoryDataLoader
+instead preallocates a small ring of batch buffers per worker: workers stack
+samples straight into the next slot and send back only a slot reference,
+which the main process turns into views of the buffers.
+
+Batches are views of reused buffers: they stay valid while the next
+``prefetch_factor`` batches are produced, which covers the current step and
+the one Lightning fetches ahead. Clone anything kept longer than that.
+"""
+
+import numbers
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import torch
+from torch.utils.data import BatchSampler, DataLoader, Dataset, RandomSampler, SequentialSampler
+from torch.utils.data import get_worker_info
+from torch.utils.data.dataloader import default_collate
+
+from .prefetch import CONSUMER_HELD_BATCHES
+
+# Slots beyond prefetch_factor + CONSUMER_HELD_BATCHES, for a consumer lagging behind
+RING_HEADROOM = 1
+
+
+class _SlotRef(NamedTuple):
+    """What a worker sends back instead of a batch."""
+
+    worker: int
+    slot: int
+    size: int
+
+
+class SharedMemoryCollate:
+    """Collate function writing into per-worker rings of shared-memory buffers.
+
+    Buffers are allocated in the main process from a template sample, before
+    workers start. Batches whose samples don't match the template's shapes
+    and dtypes fall back to the default collate.
+    """
+
+    def __init__(self, template: Any, batch_size: int, num_workers: int, num_slots: int):
+        """Initialize the collate function.
+
+        Args:
+            template: A sample whose tensor shapes and dtypes every sample shares
+            batch_size: Largest batch to collate
+            num_workers: DataLoader workers (0 for main-process loading)
+            num_slots: Ring size per worker
+        """
+        self.template = template
+        self.batch_size = batch_size
+        self.num_slots = num_slots
+        self._specs = [(leaf.shape, leaf.dtype) for leaf in map(_as_tensor, _flatten(template))]
+        # buffers[worker][slot][leaf], each of shape (batch_size, *leaf_shape)
+        self._buffers = [
+            [self._allocate() for _ in range(num_slots)] for _ in range(max(num_workers, 1))
+        ]
+        self._next_slot = 0  # per process: each worker has its own copy
+
+    def __call__(self, samples: List[Any]) -> Any:
+        columns = list(_columns(self.template, samples))
+        if len(samples) > self.batch_size or not self._fits(columns):
+            return default_collate(samples)
+
+        info = get_worker_info()
+        worker = info.id if info is not None else 0
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.num_slots
+
+        n = len(samples)
+        for buffer, column in zip(self._buffers[worker][slot], columns):
+            if isinstance(column[0], torch.Tensor):
+                torch.stack(column, out=buffer[:n])
+            elif isinstance(column[0], np.ndarray):
+                torch.stack([torch.from_numpy(leaf) for leaf in column], out=buffer[:n])
+            else:
+                buffer[:n].copy_(torch.as_tensor(np.asarray(column)))
+        return _SlotRef(worker, slot, n)
+
+    def resolve(self, batch: Any) -> Any:
+        """Turn a slot reference into the batch it stands for (other batches pass through)."""
+        if not isinstance(batch, _SlotRef):
+            return batch
+        leaves = [buffer[: batch.size] for buffer in self._buffers[batch.worker][batch.slot]]
+        return _unflatten(self.template, iter(leaves))
+
+    def _allocate(self) -> List[torch.Tensor]:
+        return [
+            torch.empty((self.batch_size, *shape), dtype=dtype).share_memory_()
+            for shape, dtype in self._specs
+        ]
+
+    def _fits(self, columns: List[Sequence[Any]]) -> bool:
+        for column, (shape, dtype) in zip(columns, self._specs):
+            if isinstance(column[0], torch.Tensor):
+                if any(leaf.shape != shape or leaf.dtype != dtype for leaf in column):
+                    return False
+            elif isinstance(column[0], np.ndarray):
+                if _as_tensor(column[0]).dtype != dtype:
+                    return False
+                first = column[0].dtype
+                if any(leaf.shape != tuple(shape) or leaf.dtype != first for leaf in column):
+                    return False
+            elif not all(isinstance(leaf, numbers.Number) for leaf in column):
+                return False
+        return True
+
+
+class SharedMemoryDataLoader(DataLoader):
+    """DataLoader that collates into preallocated shared-memory buffers.
+
+    Takes the usual DataLoader arguments, except ``collate_fn``. Samples
+    must have the same structure and, to benefit, the same tensor shapes.
+    ``pin_memory`` has no effect on these batches; use the datamodule's
+    ``prefetch_batches`` to overlap host-to-device copies.
+
+    Usage:
+        loader = SharedMemoryDataLoader(dataset, batch_size=256, num_workers=8, shuffle=True)
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        batch_size: Optional[int] = 1,
+        shuffle: Optional[bool] = None,
+        sampler: Optional[Any] = None,
+        batch_sampler: Optional[Any] = None,
+        num_workers: int = 0,
+        drop_last: bool = False,
+        prefetch_factor: Optional[int] = None,
+        num_slots: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the loader.
+
+        Args:
+            dataset: Map-style dataset
+            batch_size: Samples per batch
+            shuffle: Shuffle every epoch (ignored if ``sampler`` is given)
+            sampler: Index sampler
+            batch_sampler: Batch sampler; must have a fixed ``batch_size``
+            num_workers: Worker processes
+            drop_last: Drop the last incomplete batch
+            prefetch_factor: Batches loaded in advance by each worker
+            num_slots: Ring size per worker; by default just enough for the batches
+                in flight
+            **kwargs: Other DataLoader arguments
+        """
+        # Lightning passes our own collate back in when it re-creates the loader for DDP
+        if not isinstance(kwargs.pop("collate_fn", None), (SharedMemoryCollate, type(None))):
+            raise ValueError("SharedMemoryDataLoader collates itself; collate_fn is not supported")
+        if batch_sampler is None:
+            if sampler is None:
+                sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+            batch_sampler = BatchSampler(sampler, batch_size, drop_last)
+        if getattr(batch_sampler, "batch_size", None) is None:
+            raise ValueError("SharedMemoryDataLoader needs a batch sampler with a fixed batch_size")
+
+        if num_slots is None:
+            in_flight = (prefetch_factor or 2) if num_workers > 0 else 0
+            num_slots = in_flight + CONSUMER_HELD_BATCHES + RING_HEADROOM
+        batch_size = batch_sampler.batch_size
+        self.collate = SharedMemoryCollate(dataset[0], batch_size, num_workers, num_slots)
+
+        super().__init__(
+            dataset,
+            batch_sampler=batch_sampler,
+            num_workers=num_workers,
+            collate_fn=self.collate,
+            prefetch_factor=prefetch_factor,
+            **kwargs,
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.collate.resolve, super().__iter__())
+
+
+def _as_tensor(leaf: Any) -> torch.Tensor:
+    if isinstance(leaf, torch.Tensor):
+        return leaf
+    return torch.as_tensor(np.asarray(leaf))
+
+
+def _columns(template: Any, samples: Sequence[Any]) -> Iterator[Sequence[Any]]:
+    """Per-leaf columns of ``samples``, following ``template``'s structure."""
+    if isinstance(template, dict):
+        for key, value in template.items():
+            yield from _columns(value, [sample[key] for sample in samples])
+    elif isinstance(template, (list, tuple)):
+        for value, column in zip(template, zip(*samples)):
+            yield from _columns(value, column)
+    else:
+        yield samples
+
+
+def _flatten(sample: Any) -> List[Any]:
+    """Tensor/array/number leaves of a (nested) dict/list/tuple sample, in order."""
+    if isinstance(sample, (torch.Tensor, np.ndarray, numbers.Number)):
+        return [sample]
+    if isinstance(sample, dict):
+        return [leaf for value in sample.values() for leaf in _flatten(value)]
+    if isinstance(sample, (list, tuple)):
+        return [leaf for value in sample for leaf in _flatten(value)]
+    raise TypeError(f"SharedMemoryDataLoader can't collate a {type(sample).__name__}")
+
+
+def _unflatten(template: Any, leaves: Iterator[torch.Tensor]) -> Any:
+    """Rebuild ``template``'s structure from batched leaves."""
+    if isinstance(template, dict):
+        return type(template)((key, _unflatten(value, leaves)) for key, value in template.items())
+    if isinstance(template, tuple) and hasattr(template, "_fields"):  # namedtuple
+        return type(template)(*(_unflatten(value, leaves) for value in template))
+    if isinstance(template, (list, tuple)):
+        return type(template)(_unflatten(value, leaves) for value in template)
+    return next(leaves)
+
@@ -4,10 +4,32 @@ This module provides a skeleton LightningDataModule that you can extend
 with your own data loading logic.
 """
 
-from typing import Optional
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
 
 import lightning as L
-from torch.utils.data import DataLoader, Dataset
+import numpy as np
+import torch
+from lightning.pytorch.utilities import rank_zero_warn
+from torch.utils.data import DataLoader, Dataset, IterableDataset
+from torch.utils.data.distributed import DistributedSampler
+
+from .cache import CachedDataset
+from .collate import SharedMemoryDataLoader
+from .index import DatasetIndex
+from .prefetch import DevicePrefetcher
+from .samplers import (
+    BucketBatchSampler,
+    ResumableDataLoader,
+    ResumableSampler,
+    pad_collate,
+    sample_sizes,
+)
+from .shards import MANIFEST_NAME, ShardedDataset
+from .shared import REGISTRY, SHARED_ATTRS, dataset_key, sharing_enabled
+from .streaming import StreamingDataLoader, StreamingShardDataset
+from .transforms import BatchAugment
 
 
 class BaseDataModule(L.LightningDataModule):
@@ -23,6 +45,22 @@ class BaseDataModule(L.LightningDataModule):
         self,
         batch_size: int = 128,
         num_workers: int = 4,
+        prefetch_factor: Optional[int] = None,
+        persistent_workers: bool = True,
+        shard_dir: Optional[str] = None,
+        data_dir: Optional[str] = None,
+        index_path: Optional[str] = None,
+        prefetch_batches: int = 0,
+        cache_bytes: int = 0,
+        cache_policy: str = "lru",
+        streaming: bool = False,
+        shuffle_buffer: int = 10000,
+        bucket_by_size: bool = False,
+        max_tokens_per_batch: Optional[int] = None,
+        shared_memory_collate: bool = False,
+        batch_transform: Optional[BatchAugment] = None,
+        resumable: bool = False,
+        share_datasets: Optional[bool] = None,
         # TODO: Add your data-specific parameters here
     ):
         """Initialize the data module.
@@ -30,18 +68,85 @@ class BaseDataModule(L.LightningDataModule):
         Args:
             batch_size: Batch size for dataloaders
             num_workers: Number of workers for data loading
+            prefetch_factor: Batches loaded in advance by each worker (None for the
+                PyTorch default). Tune with ``scripts/tune_dataloader.py``.
+            persistent_workers: Keep worker processes alive between epochs instead
+                of re-forking them every epoch
+            shard_dir: Directory with packed shards in ``train/``, ``val/`` and ``test/``
+                subdirectories (see ``scripts/write_shards.py``). When set, setup()
+                creates memory-mapped ShardedDatasets for every split that exists.
+            data_dir: Raw dataset directory. prepare_data() indexes its files once
+                (paths, sizes, labels, splits; see DatasetIndex) and setup() loads the
+                index as ``self.index`` instead of walking the directory again.
+            index_path: Where to keep the index (default: under ``paths.DATASET_INDEX``)
+            prefetch_batches: Stage this many training batches on the device in a
+                background thread while the current step runs (0 disables)
+            cache_bytes: Shared-memory budget for caching decoded training samples
+                across epochs and workers (0 disables). See CachedDataset.
+            cache_policy: Cache eviction policy, "lru" or "lfu"
+            streaming: Read the training shards sequentially as a
+                StreamingShardDataset instead of random access, for corpora that
+                don't fit on local disk. Any IterableDataset assigned to
+                train_dataset is loaded the same way.
+            shuffle_buffer: Per-worker shuffle buffer size in streaming mode
+            bucket_by_size: Batch training samples of similar size together to cut
+                padding (see BucketBatchSampler); samples are padded to the largest
+                in their batch
+            max_tokens_per_batch: With bucketing, size batches by this padded-size
+                budget (samples x largest sample size) instead of ``batch_size``
+            shared_memory_collate: Collate batches into preallocated shared-memory
+                buffers reused across batches instead of allocating new ones (see
+                SharedMemoryDataLoader). Needs equally shaped samples; not used with
+                size bucketing.
+            batch_transform: Augmentation applied to whole batches on the device
+                (see BatchAugment), replacing per-sample random transforms in the
+                dataset. Evaluation batches only get its deterministic steps
+            resumable: Save the position within the training epoch in checkpoints so
+                a resumed run continues with the next batch without reloading the
+                consumed ones (see ResumableDataLoader). Not combined with
+                ``prefetch_batches``.
+            share_datasets: Reuse the datasets of an earlier datamodule in this
+                process whose data-affecting arguments match (e.g. across HPO
+                trials) instead of loading them again; loader settings such as
+                ``batch_size`` may differ. Defaults to the
+                ``{{cookiecutter.package_name.upper()}}_SHARE_DATASETS`` environment variable.
         """
         super().__init__()
         self.save_hyperparameters()
 
         self.batch_size = batch_size
         self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
+        self.persistent_workers = persistent_workers
+        self.shard_dir = shard_dir
+        self.data_dir = data_dir
+        self.index_path = index_path
+        self.prefetch_batches = prefetch_batches
+        self.cache_bytes = cache_bytes
+        self.cache_policy = cache_policy
+        self.streaming = streaming
+        self.shuffle_buffer = shuffle_buffer
+        self.bucket_by_size = bucket_by_size
+        self.max_tokens_per_batch = max_tokens_per_batch
+        self.shared_memory_collate = shared_memory_collate
+        self.batch_transform = batch_transform
+        self.resumable = resumable
+        self.share_datasets = sharing_enabled() if share_datasets is None else share_datasets
+        self._sizes: Optional[Tuple[Dataset, np.ndarray]] = None
+        self._prefetcher: Optional[DevicePrefetcher] = None
+        self._train_cache: Optional[CachedDataset] = None
+        self.index: Optional[DatasetIndex] = None
 
         # Dataset placeholders
         self.train_dataset: Optional[Dataset] = None
         self.val_dataset: Optional[Dataset] = None
         self.test_dataset: Optional[Dataset] = None
 
+    def prepare_data(self):
+        """Build or refresh the file index of ``data_dir`` (once per node, before setup)."""
+        if self.data_dir is not None:
+            DatasetIndex.load_or_build(self.data_dir, self.index_path)
+
     def setup(self, stage: Optional[str] = None):
         """Setup datasets for each stage.
 
@@ -50,43 +155,230 @@ class BaseDataModule(L.LightningDataModule):
 
         TODO: Implement dataset creation
         """
+        if self.share_datasets:
+            shared = REGISTRY.get(dataset_key(type(self), self.hparams, stage))
+            if shared is not None:
+                for name, value in shared.items():
+                    setattr(self, name, value)
+                return
+
+        if self.data_dir is not None and self.index is None:
+            # Validated by prepare_data(), so skip stat-ing the directories again
+            self.index = DatasetIndex.load_or_build(
+                self.data_dir, self.index_path, check_stale=False
+            )
+
         if stage == "fit" or stage is None:
-            # TODO: Create training dataset
+            if self.shard_dir is not None:
+                self.train_dataset = self._shard_split("train", streaming=self.streaming)
+                self.val_dataset = self._shard_split("val")
+
+            # TODO: Otherwise create training dataset
             # self.train_dataset = YourDataset(split="train", ...)
+            #
+            # With data_dir set, build it from the file index instead of listing files:
+            # self.train_dataset = self.index.dataset("train", load_fn=read_image)
+            #
+            # Expensive deterministic preprocessing can be cached on disk once for
+            # all later runs and HPO trials (see FeatureCache):
+            # self.train_dataset = FeatureCache().get_or_build(
+            #     YourDataset(split="train", transform=preprocess),
+            #     source="train", transform_config={"resize": 224},
+            # )
 
             # TODO: Create validation dataset
             # self.val_dataset = YourDataset(split="val", ...)
-            pass
 
         if stage == "test" or stage is None:
-            # TODO: Create test dataset
+            if self.shard_dir is not None:
+                self.test_dataset = self._shard_split("test")
+
+            # TODO: Otherwise create test dataset
             # self.test_dataset = YourDataset(split="test", ...)
-            pass
 
-    def train_dataloader(self) -> DataLoader:
-        """Create training dataloader."""
-        if self.train_dataset is None:
-            raise RuntimeError("train_dataset not initialized. Call setup() first.")
+        if self.share_datasets:
+            attrs = {name: getattr(self, name) for name in SHARED_ATTRS}
+            REGISTRY.put(dataset_key(type(self), self.hparams, stage), attrs)
+
+    def on_after_batch_transfer(self, batch: Any, dataloader_idx: int) -> Any:
+        """Apply ``batch_transform`` on the device; its random steps only to training batches."""
+        if self.batch_transform is not None and self.trainer is not None:
+            batch = self.batch_transform.apply(batch, train=self.trainer.training)
+        return batch
+
+    def pipeline_stats(self) -> Dict[str, float]:
+        """Input-pipeline statistics for the current epoch.
 
-        return DataLoader(
-            self.train_dataset,
+        Logged periodically by ``callbacks.DataPipelineMonitor``.
+        """
+        stats: Dict[str, float] = {}
+        if self._prefetcher is not None:
+            stats.update({f"data/{k}": v for k, v in self._prefetcher.stats().items()})
+        if self._train_cache is not None:
+            stats.update({f"cache/{k}": v for k, v in self._train_cache.cache.stats().items()})
+        return stats
+
+    def _cached(self, dataset: Dataset) -> CachedDataset:
+        """Wrap ``dataset`` in the shared-memory cache, reusing it across dataloader rebuilds."""
+        if self._train_cache is None or self._train_cache.dataset is not dataset:
+            self._train_cache = CachedDataset(dataset, self.cache_bytes, self.cache_policy)
+        return self._train_cache
+
+    def _bucket_sampler(self, dataset: Dataset, per_rank: bool = False) -> BucketBatchSampler:
+        """Size-bucketed batches.
+
+        Lightning swaps in a per-rank sampler under DDP, but only for a DataLoader
+        it can see; ``per_rank=True`` shards across ranks here instead.
+        """
+        if self._sizes is None or self._sizes[0] is not dataset:
+            self._sizes = (dataset, sample_sizes(dataset))
+
+        if per_rank:
+            sampler = self._rank_sampler(dataset)
+        else:
+            sampler = DistributedSampler(
+                dataset, num_replicas=1, rank=0, shuffle=True, seed=_global_seed()
+            )
+        max_tokens = self.max_tokens_per_batch
+        return BucketBatchSampler(
+            sampler,
+            self._sizes[1],
+            batch_size=None if max_tokens else self.batch_size,
+            max_tokens=max_tokens,
+            drop_last=max_tokens is None,
+        )
+
+    def _resumable_sampler(self, dataset: Dataset) -> ResumableSampler:
+        """Shuffling sampler for this rank that can start mid-epoch."""
+        rank, world_size = self._rank()
+        return ResumableSampler(dataset, num_replicas=world_size, rank=rank, seed=_global_seed())
+
+    def _rank_sampler(self, dataset: Dataset) -> DistributedSampler:
+        """Shuffling sampler for this rank, as Lightning would inject under DDP."""
+        rank, world_size = self._rank()
+        return DistributedSampler(
+            dataset, num_replicas=world_size, rank=rank, shuffle=True, seed=_global_seed()
+        )
+
+    def _rank(self) -> Tuple[int, int]:
+        """This process's rank and the world size (0 and 1 outside a Trainer)."""
+        if self.trainer is not None:
+            return self.trainer.global_rank, self.trainer.world_size
+        return 0, 1
+
+    def _loader_cls(self, resumable: bool = False) -> type:
+        """DataLoader class for map-style datasets."""
+        if self.shared_memory_collate:
+            return _ResumableSharedMemoryDataLoader if resumable else SharedMemoryDataLoader
+        return ResumableDataLoader if resumable else DataLoader
+
+    def _worker_kwargs(self) -> Dict[str, Any]:
+        """DataLoader worker arguments shared by all splits."""
+        kwargs: Dict[str, Any] = {"num_workers": self.num_workers}
+        if self.num_workers > 0:
+            # Only valid with worker processes
+            kwargs["persistent_workers"] = self.persistent_workers
+            if self.prefetch_factor is not None:
+                kwargs["prefetch_factor"] = self.prefetch_factor
+        return kwargs
+
+    def _device(self) -> torch.device:
+        """Device the trainer runs on (CPU when used outside a Trainer)."""
+        if self.trainer is not None:
+            return self.trainer.strategy.root_device
+        return torch.device("cpu")
+
+    def _shard_split(self, split: str, streaming: bool = False) -> Optional[Dataset]:
+        """Open the packed shards for ``split``, or return None if it wasn't written."""
+        root = Path(self.shard_dir) / split
+        if not (root / MANIFEST_NAME).exists():
+            return None
+        if streaming:
+            return StreamingShardDataset.from_packed(root, shuffle_buffer=self.shuffle_buffer)
+        return ShardedDataset(root)
+
+    def _streaming_dataloader(self, dataset: IterableDataset) -> StreamingDataLoader:
+        """Training loader for an iterable dataset, partitioned across DDP ranks."""
+        if self.trainer is not None and hasattr(dataset, "set_distributed"):
+            dataset.set_distributed(self.trainer.global_rank, self.trainer.world_size)
+        if self.cache_bytes > 0 or self.prefetch_batches > 0:
+            # Both would hide the consumed-batch count Lightning checkpoints for resume
+            rank_zero_warn("cache_bytes and prefetch_batches are ignored in streaming mode")
+
+        kwargs = self._worker_kwargs()
+        kwargs.pop("persistent_workers", None)
+        return StreamingDataLoader(
+            dataset,
             batch_size=self.batch_size,
-            shuffle=True,
-            num_workers=self.num_workers,
+            **kwargs,
             pin_memory=True,
             drop_last=True,
         )
 
+    def train_dataloader(self) -> Union[DataLoader, DevicePrefetcher, StreamingDataLoader]:
+        """Create training dataloader."""
+        if self.train_dataset is None:
+            raise RuntimeError("train_dataset not initialized. Call setup() first.")
+
+        dataset = self.train_dataset
+        if isinstance(dataset, IterableDataset):
+            return self._streaming_dataloader(dataset)
+        if self.cache_bytes > 0:
+            dataset = self._cached(dataset)
+        prefetch = self.prefetch_batches > 0
+        if prefetch and self.resumable:
+            # The prefetcher reads ahead, hiding how many batches were actually consumed
+            rank_zero_warn("prefetch_batches is ignored when resumable=True")
+            prefetch = False
+        # Lightning can't inject its DistributedSampler into a loader the prefetcher
+        # wraps, so each rank would read the whole dataset; shard it here instead
+        per_rank = prefetch and self._rank()[1] > 1
+
+        loader_cls = self._loader_cls(self.resumable)
+        if self.bucket_by_size or self.max_tokens_per_batch is not None:
+            loader_cls = ResumableDataLoader if self.resumable else DataLoader
+            batching = {
+                "batch_sampler": self._bucket_sampler(dataset, per_rank),
+                "collate_fn": pad_collate,
+            }
+        elif self.resumable:
+            batching = {
+                "batch_size": self.batch_size,
+                "sampler": self._resumable_sampler(dataset),
+                "drop_last": True,
+            }
+        elif per_rank:
+            batching = {
+                "batch_size": self.batch_size,
+                "sampler": self._rank_sampler(dataset),
+                "drop_last": True,
+            }
+        else:
+            batching = {"batch_size": self.batch_size, "shuffle": True, "drop_last": True}
+
+        loader = loader_cls(
+            dataset,
+            **batching,
+            **self._worker_kwargs(),
+            # The prefetcher stages into its own reusable pinned buffers
+            pin_memory=not prefetch,
+        )
+
+        if prefetch:
+            self._prefetcher = DevicePrefetcher(loader, self._device(), self.prefetch_batches)
+            return self._prefetcher
+        return loader
+
     def val_dataloader(self) -> DataLoader:
         """Create validation dataloader."""
         if self.val_dataset is None:
             raise RuntimeError("val_dataset not initialized. Call setup() first.")
 
-        return DataLoader(
+        return self._loader_cls()(
             self.val_dataset,
             batch_size=self.batch_size,
             shuffle=False,
-            num_workers=self.num_workers,
+            **self._worker_kwargs(),
             pin_memory=True,
         )
 
@@ -95,10 +387,19 @@ class BaseDataModule(L.LightningDataModule):
         if self.test_dataset is None:
             raise RuntimeError("test_dataset not initialized. Call setup() first.")
 
-        return DataLoader(
+        return self._loader_cls()(
             self.test_dataset,
             batch_size=self.batch_size,
             shuffle=False,
-            num_workers=self.num_workers,
+            **self._worker_kwargs(),
             pin_memory=True,
         )
+
+
+class _ResumableSharedMemoryDataLoader(ResumableDataLoader, SharedMemoryDataLoader):
+    """SharedMemoryDataLoader that checkpoints its position within the epoch."""
+
+
+def _global_seed() -> int:
+    """Seed set by ``seed_everything`` (e.g. from the CLI config), or 0."""
+    return int(os.environ.get("PL_GLOBAL_SEED", 0))
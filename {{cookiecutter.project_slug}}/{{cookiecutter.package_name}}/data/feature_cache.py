@@ -0,0 +1,214 @@
+"""On-disk cache of preprocessed samples for {{cookiecutter.project_name}}.
+
+Expensive, deterministic preprocessing (resizing, tokenization, feature
+extraction) runs once per (dataset source, transform config) pair; the
+results are stored as packed shards under ``paths.FEATURE_CACHE`` and read
+back memory-mapped by every later run and HPO trial with the same inputs.
+
+Entries are content-addressed: the key is a hash of the source and the
+transform config, so changing either builds a new entry instead of reusing
+a stale one. Manage the cache with ``scripts/feature_cache.py``.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import torch
+from torch.utils.data import DataLoader, Dataset
+
+from .. import paths
+from .shards import MANIFEST_NAME, ShardedDataset, ShardWriter
+
+META_NAME = "cache_meta.json"
+
+# Bump to invalidate every entry when the stored layout changes
+CACHE_VERSION = 1
+
+
+def cache_key(source: Any, transform_config: Dict[str, Any]) -> str:
+    """Content address for ``source`` preprocessed with ``transform_config``.
+
+    Args:
+        source: Anything identifying the raw data (path, dataset name, split, ...)
+        transform_config: JSON-serializable description of the preprocessing
+
+    Returns:
+        Hex digest used as the entry's directory name
+    """
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "source": source, "transform": transform_config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+class FeatureCache:
+    """Content-addressed store of preprocessed datasets.
+
+    Usage:
+        cache = FeatureCache()
+        train = cache.get_or_build(
+            RawDataset("data/raw/train", transform=preprocess),
+            source="data/raw/train",
+            transform_config={"resize": 224, "normalize": "imagenet"},
+        )
+    """
+
+    def __init__(self, root: Union[str, Path, None] = None):
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory (default: ``paths.FEATURE_CACHE``)
+        """
+        self.root = Path(root) if root is not None else paths.FEATURE_CACHE
+
+    def get(self, source: Any, transform_config: Dict[str, Any]) -> Optional[ShardedDataset]:
+        """Open the cached entry for these inputs, or return None if it doesn't exist."""
+        entry = self.root / cache_key(source, transform_config)
+        if not (entry / MANIFEST_NAME).exists():
+            return None
+        _touch(entry / META_NAME)
+        return ShardedDataset(entry)
+
+    def get_or_build(
+        self,
+        dataset: Dataset,
+        source: Any,
+        transform_config: Dict[str, Any],
+        num_workers: int = 4,
+        shard_size_bytes: int = 256 * 1024 * 1024,
+    ) -> ShardedDataset:
+        """Return the cached entry, preprocessing ``dataset`` into it first if needed.
+
+        Samples are produced in parallel by ``num_workers`` DataLoader workers
+        and written in dataset order. Each sample must be an array/tensor or an
+        ``(array, int_label)`` pair.
+
+        Args:
+            dataset: Dataset yielding preprocessed samples
+            source: Identifies the raw data (part of the key)
+            transform_config: Describes the preprocessing (part of the key)
+            num_workers: Worker processes running the preprocessing
+            shard_size_bytes: Target shard size of the entry
+
+        Returns:
+            Memory-mapped dataset over the cached samples
+        """
+        cached = self.get(source, transform_config)
+        if cached is not None:
+            return cached
+
+        key = cache_key(source, transform_config)
+        entry = self.root / key
+        staging = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+
+        loader = DataLoader(dataset, batch_size=None, num_workers=num_workers)
+        with ShardWriter(staging, shard_size_bytes=shard_size_bytes) as writer:
+            for sample in loader:
+                writer.add(*_as_record(sample))
+
+        meta = {
+            "source": source,
+            "transform": transform_config,
+            "num_samples": writer.num_samples,
+            "created": time.time(),
+        }
+        (staging / META_NAME).write_text(json.dumps(meta, indent=2, default=str))
+        _touch(staging / META_NAME)
+
+        try:
+            staging.rename(entry)
+        except OSError:
+            # Another process (e.g. a parallel HPO trial) finished the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+        return ShardedDataset(entry)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Describe every complete entry, most recently used first."""
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry in self.root.iterdir():
+            meta_path = entry / META_NAME
+            if entry.name.startswith(".") or not meta_path.exists():
+                continue
+            meta = json.loads(meta_path.read_text())
+            entries.append(
+                {
+                    "key": entry.name,
+                    "path": str(entry),
+                    "size_bytes": sum(f.stat().st_size for f in entry.iterdir()),
+                    "last_used": meta_path.stat().st_mtime,
+                    **meta,
+                }
+            )
+        return sorted(entries, key=lambda e: e["last_used"], reverse=True)
+
+    def total_bytes(self) -> int:
+        """Disk space used by all entries."""
+        return sum(entry["size_bytes"] for entry in self.entries())
+
+    def prune(
+        self,
+        max_bytes: Optional[int] = None,
+        older_than_s: Optional[float] = None,
+        keys: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Delete entries, least recently used first.
+
+        Args:
+            max_bytes: Delete entries until the cache fits in this many bytes
+            older_than_s: Delete entries not used for this many seconds
+            keys: Delete these entries
+
+        Returns:
+            The deleted entries
+        """
+        entries = self.entries()
+        now = time.time()
+        removed = []
+
+        def remove(entry: Dict[str, Any]) -> None:
+            shutil.rmtree(entry["path"], ignore_errors=True)
+            removed.append(entry)
+
+        for entry in list(entries):
+            stale = older_than_s is not None and now - entry["last_used"] > older_than_s
+            if stale or (keys is not None and entry["key"] in keys):
+                remove(entry)
+                entries.remove(entry)
+
+        if max_bytes is not None:
+            total = sum(entry["size_bytes"] for entry in entries)
+            while entries and total > max_bytes:
+                entry = entries.pop()  # least recently used
+                total -= entry["size_bytes"]
+                remove(entry)
+        return removed
+
+
+def _touch(meta_path: Path) -> None:
+    """Record a use of the entry; its meta file's mtime is the last-used time for pruning."""
+    now = time.time_ns()  # explicit: the filesystem's own timestamps can be coarse
+    os.utime(meta_path, ns=(now, now))
+
+
+def _as_record(sample: Any) -> tuple:
+    """Split a sample into the (array, label) arguments of ``ShardWriter.add``."""
+    label = None
+    if isinstance(sample, (tuple, list)):
+        if len(sample) != 2:
+            raise ValueError("Cached samples must be an array or an (array, label) pair")
+        sample, label = sample
+        label = int(label)
+    if isinstance(sample, torch.Tensor):
+        sample = sample.numpy()
+    return np.asarray(sample), label
@@ -0,0 +1,329 @@
+"""Precomputed file index for {{cookiecutter.project_name}}.
+
+Walking a raw dataset directory and stat-ing every file takes minutes on
+network filesystems, and would otherwise happen in every run, DDP rank and
+HPO trial. DatasetIndex does the walk once and stores file paths, sizes,
+labels and split assignments as numpy arrays in a single ``.npz`` file that
+loads in milliseconds.
+
+The index also records the modification time of every directory it walked.
+Adding, removing or renaming files changes their directory's mtime, which
+marks the index stale so it's rebuilt; files rewritten in place are not
+detected.
+
+Directory layout conventions (both optional)::
+
+    <root>/train/<class>/...     # top-level train/val/test dirs fix the split
+    <root>/<class>/...           # otherwise files are split by a hash of their path
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from torch.utils.data import Dataset
+
+from .. import paths
+
+INDEX_VERSION = 1
+SPLITS = ("train", "val", "test")
+
+
+class DatasetIndex:
+    """Columnar listing of the files in a dataset directory.
+
+    Paths are stored relative to ``root`` as one UTF-8 buffer plus offsets;
+    sizes, labels (-1 when unlabeled) and split ids are parallel arrays.
+
+    Usage:
+        index = DatasetIndex.load_or_build("data/raw", val_fraction=0.1)
+        train_files = index.paths("train")
+        train = index.dataset("train", load_fn=read_image)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        arrays: Dict[str, np.ndarray],
+        classes: Sequence[str],
+        options: Dict[str, Any],
+    ):
+        self.root = Path(root)
+        self.arrays = arrays
+        self.classes = list(classes)
+        self.options = options
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """File sizes in bytes."""
+        return self.arrays["sizes"]
+
+    @property
+    def labels(self) -> np.ndarray:
+        """Class index of every file (-1 if it isn't inside a class directory)."""
+        return self.arrays["labels"]
+
+    @property
+    def splits(self) -> np.ndarray:
+        """Split id of every file, an index into ``SPLITS``."""
+        return self.arrays["splits"]
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def path(self, i: int) -> Path:
+        """Absolute path of file ``i``."""
+        offsets = self.arrays["path_offsets"]
+        raw = self.arrays["path_data"][offsets[i] : offsets[i + 1]].tobytes()
+        return self.root / raw.decode()
+
+    def indices(self, split: str) -> np.ndarray:
+        """Positions of the files in ``split``."""
+        return np.flatnonzero(self.splits == SPLITS.index(split))
+
+    def paths(self, split: Optional[str] = None) -> List[Path]:
+        """Absolute paths of the files in ``split`` (all files if None)."""
+        indices = range(len(self)) if split is None else self.indices(split)
+        return [self.path(i) for i in indices]
+
+    def dataset(
+        self,
+        split: str,
+        load_fn: Callable[[Path], Any],
+        transform: Optional[Callable[[Any], Any]] = None,
+    ) -> "IndexedFileDataset":
+        """Map-style dataset over the files of ``split``."""
+        return IndexedFileDataset(self, self.indices(split), load_fn, transform)
+
+    @classmethod
+    def build(
+        cls,
+        root: Union[str, Path],
+        extensions: Optional[Sequence[str]] = None,
+        val_fraction: float = 0.1,
+        test_fraction: float = 0.0,
+        num_threads: int = 16,
+    ) -> "DatasetIndex":
+        """Walk ``root`` and index every file.
+
+        Directories are listed by a thread pool, since on network filesystems
+        the walk is bound by round trips rather than CPU.
+
+        Args:
+            root: Raw dataset directory
+            extensions: Only index files with these suffixes (e.g. [".jpg", ".png"])
+            val_fraction: Share of files assigned to "val" when there are no split dirs
+            test_fraction: Share of files assigned to "test" when there are no split dirs
+            num_threads: Directories listed concurrently
+
+        Returns:
+            The index (not yet saved)
+        """
+        root = Path(root).resolve()
+        options = {
+            "extensions": sorted(e.lower() for e in extensions) if extensions else None,
+            "val_fraction": val_fraction,
+            "test_fraction": test_fraction,
+        }
+        files, dirs = _walk(root, options["extensions"], num_threads)
+        files.sort()
+
+        by_split = {p.split("/", 1)[0] for p, _ in files} & set(SPLITS)
+        class_names = sorted({_class_of(p, bool(by_split)) for p, _ in files} - {None})
+        class_ids = {name: i for i, name in enumerate(class_names)}
+
+        splits = np.empty(len(files), dtype=np.int8)
+        labels = np.empty(len(files), dtype=np.int32)
+        for i, (path, _) in enumerate(files):
+            top = path.split("/", 1)[0]
+            if by_split:
+                splits[i] = SPLITS.index(top) if top in by_split else -1
+            else:
+                splits[i] = _hash_split(path, val_fraction, test_fraction)
+            labels[i] = class_ids.get(_class_of(path, bool(by_split)), -1)
+
+        path_data, path_offsets = _pack([p for p, _ in files])
+        dir_data, dir_offsets = _pack([d for d, _ in dirs])
+        arrays = {
+            "path_data": path_data,
+            "path_offsets": path_offsets,
+            "sizes": np.array([size for _, size in files], dtype=np.int64),
+            "labels": labels,
+            "splits": splits,
+            "dir_data": dir_data,
+            "dir_offsets": dir_offsets,
+            "dir_mtimes": np.array([mtime for _, mtime in dirs], dtype=np.int64),
+        }
+        return cls(root, arrays, class_names, options)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the index to ``path`` atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "version": INDEX_VERSION,
+            "root": str(self.root),
+            "classes": self.classes,
+            "options": self.options,
+        }
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), **self.arrays)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DatasetIndex":
+        """Read an index written by ``save()``."""
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta["version"] != INDEX_VERSION:
+                raise ValueError(
+                    f"{path} has index version {meta['version']}, expected {INDEX_VERSION}"
+                )
+            arrays = {key: data[key] for key in data.files if key != "meta"}
+        return cls(meta["root"], arrays, meta["classes"], meta["options"])
+
+    def is_stale(self) -> bool:
+        """True if any indexed directory changed (or vanished) since the index was built."""
+        offsets = self.arrays["dir_offsets"]
+        data = self.arrays["dir_data"]
+        for i, mtime in enumerate(self.arrays["dir_mtimes"].tolist()):
+            relative = data[offsets[i] : offsets[i + 1]].tobytes().decode()
+            try:
+                if os.stat(self.root / relative).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    @classmethod
+    def load_or_build(
+        cls,
+        root: Union[str, Path],
+        path: Union[str, Path, None] = None,
+        check_stale: bool = True,
+        **build_kwargs: Any,
+    ) -> "DatasetIndex":
+        """Load the saved index for ``root``, (re)building it if missing or stale.
+
+        Args:
+            root: Raw dataset directory
+            path: Index file (default: ``default_index_path(root, ...)``)
+            check_stale: Stat the indexed directories to detect changes; skip
+                when the index was just validated (e.g. in ``prepare_data``)
+            **build_kwargs: Passed to ``build()``
+
+        Returns:
+            The up-to-date index
+        """
+        if path is None:
+            path = default_index_path(root, **build_kwargs)
+        if Path(path).exists():
+            try:
+                index = cls.load(path)
+            except (OSError, ValueError, KeyError):
+                index = None  # unreadable or from another index version
+            if index is not None and not (check_stale and index.is_stale()):
+                return index
+        index = cls.build(root, **build_kwargs)
+        index.save(path)
+        return index
+
+
+class IndexedFileDataset(Dataset):
+    """Dataset of ``(load_fn(path), label)`` pairs for a subset of an index."""
+
+    def __init__(
+        self,
+        index: DatasetIndex,
+        indices: np.ndarray,
+        load_fn: Callable[[Path], Any],
+        transform: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.index = index
+        self.indices = indices
+        self.load_fn = load_fn
+        self.transform = transform
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, idx: int) -> Tuple[Any, int]:
+        i = int(self.indices[idx])
+        sample = self.load_fn(self.index.path(i))
+        if self.transform is not None:
+            sample = self.transform(sample)
+        return sample, int(self.index.labels[i])
+
+    def sample_sizes(self) -> np.ndarray:
+        """File sizes, used by size bucketing without reading any file."""
+        return self.index.sizes[self.indices]
+
+
+def default_index_path(root: Union[str, Path], **build_kwargs: Any) -> Path:
+    """Index file for ``root`` under ``paths.DATASET_INDEX``, keyed by root and build options."""
+    payload = json.dumps(
+        {"root": str(Path(root).resolve()), "options": build_kwargs}, sort_keys=True, default=str
+    )
+    key = hashlib.sha256(payload.encode()).hexdigest()[:16]
+    return paths.DATASET_INDEX / f"{Path(root).name}-{key}.npz"
+
+
+def _walk(
+    root: Path, extensions: Optional[List[str]], num_threads: int
+) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """(relative path, size) of every file and (relative path, mtime_ns) of every directory."""
+    files: List[Tuple[str, int]] = []
+    dirs: List[Tuple[str, int]] = []
+
+    def scan(relative: str) -> List[str]:
+        directory = root / relative
+        dirs.append((relative, os.stat(directory).st_mtime_ns))
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                path = f"{relative}/{entry.name}" if relative else entry.name
+                if entry.is_dir():
+                    subdirs.append(path)
+                elif extensions is None or os.path.splitext(entry.name)[1].lower() in extensions:
+                    files.append((path, entry.stat().st_size))
+        return subdirs
+
+    with ThreadPoolExecutor(num_threads) as pool:
+        pending = [pool.submit(scan, "")]
+        while pending:
+            future = pending.pop()
+            pending.extend(pool.submit(scan, d) for d in future.result())
+    return files, dirs
+
+
+def _class_of(path: str, by_split: bool) -> Optional[str]:
+    """Class directory of ``path`` (the first directory below the split dir, if any)."""
+    parts = path.split("/")[1:] if by_split else path.split("/")
+    return parts[0] if len(parts) > 1 else None
+
+
+def _hash_split(path: str, val_fraction: float, test_fraction: float) -> int:
+    """Stable split for a file: the same path lands in the same split in every rebuild."""
+    u = zlib.crc32(path.encode()) / 2**32
+    if u < test_fraction:
+        return SPLITS.index("test")
+    if u < test_fraction + val_fraction:
+        return SPLITS.index("val")
+    return SPLITS.index("train")
+
+
+def _pack(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate UTF-8 strings into one byte array plus int64 offsets."""
+    encoded = [s.encode() for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(), offsets
@@ -0,0 +1,270 @@
+"""Background batch prefetching for {{cookiecutter.project_name}}.
+
+DevicePrefetcher pulls batches from a DataLoader in a background thread and
+stages them on the target device while the current step computes. Host-side
+staging buffers are allocated once per slot and reused, so steady-state
+prefetching does no per-batch allocation on the host.
+"""
+
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import torch
+
+# Batches the consumer may still be using after requesting the next one:
+# the current step's batch plus the one Lightning's fetcher holds ahead of it.
+CONSUMER_HELD_BATCHES = 2
+
+_END = object()
+
+
+class DevicePrefetcher:
+    """Wrap a DataLoader to prefetch and stage the next N batches on a device.
+
+    Each in-flight batch lives in a "slot" holding preallocated host buffers
+    (pinned when the target is CUDA). A background thread copies worker output
+    into a free slot, starts the host-to-device copy on a side stream and
+    queues the result; a slot is recycled once the consumer is
+    CONSUMER_HELD_BATCHES batches past it. Before refilling a recycled slot the
+    thread waits for that slot's previous host-to-device copy to finish, since
+    the consumer only orders the copy against its own stream, not the host.
+
+    On CPU-only hosts the staged host buffers *are* the batch, so the training
+    step must not keep references to a batch beyond the following step.
+
+    Usage:
+        loader = DevicePrefetcher(DataLoader(...), device="cuda", num_batches=2)
+        for batch in loader:
+            ...
+        print(loader.stats())
+    """
+
+    def __init__(
+        self,
+        loader: Iterable,
+        device: Union[str, torch.device] = "cpu",
+        num_batches: int = 2,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            loader: DataLoader (or any iterable of tensor collections)
+            device: Target device for staged batches
+            num_batches: Number of batches to stage ahead of the consumer
+        """
+        if num_batches < 1:
+            raise ValueError(f"num_batches must be >= 1, got {num_batches}")
+
+        self.loader = loader
+        self.device = torch.device(device)
+        self.num_batches = num_batches
+        self._pin = self.device.type == "cuda"
+
+        # One slot per queued batch, per batch held by the consumer, and one being filled
+        self._slots: List[Dict[int, torch.Tensor]] = [
+            {} for _ in range(num_batches + CONSUMER_HELD_BATCHES + 1)
+        ]
+        # Per slot, the event recorded after its last host-to-device copy (CUDA only)
+        self._events: List[Optional[torch.cuda.Event]] = [None] * len(self._slots)
+        self._thread: Optional[threading.Thread] = None
+        self._stop: Optional[threading.Event] = None
+        self._reset_stats()
+
+    def __len__(self) -> int:
+        return len(self.loader)
+
+    # Exposed so Lightning calls set_epoch on the wrapped loader's (distributed) sampler
+    @property
+    def sampler(self) -> Any:
+        return getattr(self.loader, "sampler", None)
+
+    @property
+    def batch_sampler(self) -> Any:
+        return getattr(self.loader, "batch_sampler", None)
+
+    def __iter__(self) -> Iterator[Any]:
+        self.close()
+        self._reset_stats()
+
+        ready: queue.Queue = queue.Queue(maxsize=self.num_batches)
+        free: queue.Queue = queue.Queue()
+        for slot in range(len(self._slots)):
+            free.put(slot)
+
+        self._stop = stop = threading.Event()
+        self._thread = thread = threading.Thread(
+            target=self._worker,
+            args=(iter(self.loader), ready, free, stop),
+            name="DevicePrefetcher",
+            daemon=True,
+        )
+        thread.start()
+        return self._consume(ready, free, thread, stop)
+
+    def close(self) -> None:
+        """Stop the background thread (called automatically on re-iteration)."""
+        if self._thread is not None:
+            _stop_thread(self._thread, self._stop)
+            self._thread = self._stop = None
+
+    def stats(self) -> Dict[str, float]:
+        """Data-wait statistics for the current pass over the loader.
+
+        Returns:
+            Dict with total and per-batch wait time and the fraction of wall-clock
+            time between batches that was spent waiting for data.
+        """
+        elapsed = (time.perf_counter() - self._first_request) if self._first_request else 0.0
+        batches = max(self._batches, 1)
+        return {
+            "wait_s": self._wait_s,
+            "wait_ms_per_batch": 1000.0 * self._wait_s / batches,
+            "wait_fraction": self._wait_s / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _reset_stats(self) -> None:
+        self._wait_s = 0.0
+        self._batches = 0
+        self._first_request: Optional[float] = None
+
+    def _consume(
+        self,
+        ready: queue.Queue,
+        free: queue.Queue,
+        thread: threading.Thread,
+        stop: threading.Event,
+    ) -> Iterator[Any]:
+        held: List[int] = []
+        try:
+            while True:
+                start = time.perf_counter()
+                if self._first_request is None:
+                    self._first_request = start
+                item = ready.get()
+                self._wait_s += time.perf_counter() - start
+
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+
+                slot, batch, event = item
+                if event is not None:
+                    current = torch.cuda.current_stream(self.device)
+                    current.wait_event(event)
+                    _map_tensors(lambda t: t.record_stream(current), batch)
+
+                # Recycle the oldest slot once the consumer has moved far enough past it
+                held.append(slot)
+                if len(held) > CONSUMER_HELD_BATCHES:
+                    free.put(held.pop(0))
+
+                self._batches += 1
+                yield batch
+        finally:
+            # Only stop this pass's thread; a newer pass may already be running
+            _stop_thread(thread, stop)
+
+    def _worker(
+        self,
+        iterator: Iterator[Any],
+        ready: queue.Queue,
+        free: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        stream = torch.cuda.Stream(self.device) if self.device.type == "cuda" else None
+        try:
+            for batch in iterator:
+                slot = _get_or_stop(free, stop)
+                if slot is None:
+                    return
+
+                # A non_blocking copy may still be reading this slot's pinned buffers
+                pending = self._events[slot]
+                if pending is not None:
+                    pending.synchronize()
+
+                staged = self._stage(self._slots[slot], batch)
+                event = None
+                if stream is not None:
+                    with torch.cuda.stream(stream):
+                        staged = _map_tensors(
+                            lambda t: t.to(self.device, non_blocking=True), staged
+                        )
+                        event = torch.cuda.Event()
+                        event.record(stream)
+                    self._events[slot] = event
+
+                if not _put_or_stop(ready, (slot, staged, event), stop):
+                    return
+            _put_or_stop(ready, _END, stop)
+        except BaseException as exc:  # re-raised in the consuming thread
+            _put_or_stop(ready, exc, stop)
+
+    def _stage(self, buffers: Dict[int, torch.Tensor], batch: Any) -> Any:
+        """Copy ``batch`` into the slot's reusable host buffers."""
+        counter = itertools.count()
+
+        def copy_into(tensor: torch.Tensor) -> torch.Tensor:
+            buf = buffers.get(key := next(counter))
+            if buf is not None and _fits(buf, tensor):
+                # Smaller final batches reuse the front of the buffer
+                target = buf[: tensor.shape[0]] if tensor.dim() else buf
+                return target.copy_(tensor)
+            buf = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=self._pin)
+            buffers[key] = buf
+            return buf.copy_(tensor)
+
+        return _map_tensors(copy_into, batch)
+
+    def __del__(self):
+        self.close()
+
+
+def _stop_thread(thread: threading.Thread, stop: threading.Event) -> None:
+    stop.set()
+    thread.join(timeout=5.0)
+
+
+def _get_or_stop(q: queue.Queue, stop: threading.Event) -> Optional[int]:
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+def _put_or_stop(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _fits(buf: torch.Tensor, tensor: torch.Tensor) -> bool:
+    """Whether ``tensor`` can be copied into (a leading slice of) ``buf``."""
+    if buf.dtype != tensor.dtype or buf.dim() != tensor.dim():
+        return False
+    if tensor.dim() == 0:
+        return True
+    return buf.shape[1:] == tensor.shape[1:] and buf.shape[0] >= tensor.shape[0]
+
+
+def _map_tensors(fn, data: Any) -> Any:
+    """Apply ``fn`` to every tensor in a (nested) dict/list/tuple, preserving structure."""
+    if isinstance(data, torch.Tensor):
+        return fn(data)
+    if isinstance(data, dict):
+        return type(data)((k, _map_tensors(fn, v)) for k, v in data.items())
+    if isinstance(data, tuple) and hasattr(data, "_fields"):  # namedtuple
+        return type(data)(*(_map_tensors(fn, v) for v in data))
+    if isinstance(data, (list, tuple)):
+        return type(data)(_map_tensors(fn, v) for v in data)
+    return data
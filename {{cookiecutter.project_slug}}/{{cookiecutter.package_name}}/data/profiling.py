@@ -0,0 +1,176 @@
+"""Input-pipeline measurement helpers for {{cookiecutter.project_name}}."""
+
+import multiprocessing
+import queue
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, get_worker_info
+
+from ..utils.procfs import rss_bytes
+
+# Seconds spent in dataset __getitem__ since the last collate, per process
+_fetch_s = 0.0
+
+
+def batch_size_of(batch: Any) -> int:
+    """Leading dimension of the first tensor found in a (nested) batch."""
+    if isinstance(batch, torch.Tensor):
+        return int(batch.shape[0]) if batch.dim() else 1
+    if isinstance(batch, dict):
+        batch = list(batch.values())
+    if isinstance(batch, (list, tuple)):
+        for item in batch:
+            size = batch_size_of(item)
+            if size:
+                return size
+    return 0
+
+
+def measure_loader(
+    loader: Iterable,
+    max_batches: Optional[int] = None,
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> Dict[str, float]:
+    """Iterate a loader without a model and time it.
+
+    The first batch is reported separately (worker startup, warm caches) and
+    excluded from the steady-state rates.
+
+    Args:
+        loader: DataLoader or any iterable of batches
+        max_batches: Stop after this many batches (None for a full pass)
+        on_batch: Called with the number of batches so far after every batch
+
+    Returns:
+        Dict with time_to_first_batch_s, total_s, batches, samples,
+        samples_per_s and batches_per_s
+    """
+    start = time.perf_counter()
+    first_batch_s = 0.0
+    batches = samples = steady_samples = 0
+
+    for batch in loader:
+        size = batch_size_of(batch)
+        if batches == 0:
+            first_batch_s = time.perf_counter() - start
+        else:
+            steady_samples += size
+        batches += 1
+        samples += size
+        if on_batch is not None:
+            on_batch(batches)
+        if max_batches is not None and batches >= max_batches:
+            break
+
+    total_s = time.perf_counter() - start
+    steady_s = total_s - first_batch_s
+    return {
+        "time_to_first_batch_s": first_batch_s,
+        "total_s": total_s,
+        "batches": batches,
+        "samples": samples,
+        "samples_per_s": steady_samples / steady_s if steady_s > 0 else 0.0,
+        "batches_per_s": (batches - 1) / steady_s if steady_s > 0 and batches > 1 else 0.0,
+    }
+
+
+class WorkerLatencyRecorder:
+    """Per-worker time to produce each batch, measured inside DataLoader workers.
+
+    Wrap the dataset (sample fetch time) and the loader's collate_fn (adds
+    collate time and reports the batch); idle time waiting for work is not
+    counted. Batches themselves are passed through untouched.
+
+    Usage:
+        recorder = WorkerLatencyRecorder()
+        loader = DataLoader(recorder.wrap_dataset(dataset), batch_size=64, num_workers=4)
+        loader.collate_fn = recorder.wrap_collate(loader.collate_fn)
+        for batch in loader:
+            ...
+        print(recorder.summary())
+    """
+
+    def __init__(self):
+        self._queue = multiprocessing.Queue()
+        self._latencies: Dict[int, List[float]] = {}
+
+    def wrap_dataset(self, dataset: Dataset) -> Dataset:
+        return _TimedDataset(dataset)
+
+    def wrap_collate(self, collate_fn: Callable[[List[Any]], Any]) -> Callable[[List[Any]], Any]:
+        return _TimedCollate(collate_fn, self._queue, self._latencies.setdefault(-1, []))
+
+    def latencies(self) -> Dict[int, List[float]]:
+        """Batch latencies in seconds by worker id (-1 for the main process)."""
+        while True:
+            try:
+                # Queued items reach the pipe through a feeder thread; give them a moment
+                worker, seconds = self._queue.get(timeout=0.05)
+            except queue.Empty:
+                break
+            self._latencies.setdefault(worker, []).append(seconds)
+        return {worker: values for worker, values in self._latencies.items() if values}
+
+    def summary(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[str, Dict[str, float]]:
+        """Latency percentiles in milliseconds per worker."""
+        summary = {}
+        for worker, values in sorted(self.latencies().items()):
+            ms = np.asarray(values) * 1000.0
+            stats = {f"p{q:g}_ms": float(np.percentile(ms, q)) for q in percentiles}
+            stats.update(mean_ms=float(ms.mean()), max_ms=float(ms.max()), batches=len(ms))
+            summary["main" if worker < 0 else f"worker_{worker}"] = stats
+        return summary
+
+
+class _TimedDataset(Dataset):
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def __getitem__(self, idx: int) -> Any:
+        global _fetch_s
+        start = time.perf_counter()
+        sample = self.dataset[idx]
+        _fetch_s += time.perf_counter() - start
+        return sample
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "dataset":
+            raise AttributeError(name)
+        return getattr(self.dataset, name)
+
+
+class _TimedCollate:
+    def __init__(
+        self,
+        collate_fn: Callable[[List[Any]], Any],
+        results: multiprocessing.Queue,
+        main_results: List[float],
+    ):
+        self.collate_fn = collate_fn
+        self.results = results
+        self.main_results = main_results
+
+    def __call__(self, samples: List[Any]) -> Any:
+        global _fetch_s
+        start = time.perf_counter()
+        batch = self.collate_fn(samples)
+        elapsed = _fetch_s + time.perf_counter() - start
+        _fetch_s = 0.0
+
+        info = get_worker_info()
+        if info is None:
+            self.main_results.append(elapsed)
+        else:
+            self.results.put((info.id, elapsed))
+        return batch
+
+
+def worker_rss_bytes() -> int:
+    """Combined resident set size of this process's multiprocessing children."""
+    return sum(rss_bytes(child.pid) or 0 for child in multiprocessing.active_children())
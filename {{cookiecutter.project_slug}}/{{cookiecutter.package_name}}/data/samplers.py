@@ -0,0 +1,380 @@
+"""Batch samplers for {{cookiecutter.project_name}}.
+
+BucketBatchSampler groups samples of similar size (sequence length, pixel
+count, ...) into the same batch so padding stays small, either with a fixed
+number of samples per batch or with a padded-size budget per batch.
+
+ResumableSampler and ResumableDataLoader record the position within the
+epoch in checkpoints, so a resumed run continues with the next batch instead
+of replaying (loading and decoding) the batches it already trained on.
+"""
+
+import itertools
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+from torch.utils.data import BatchSampler, DataLoader, Dataset, Sampler, SequentialSampler
+from torch.utils.data.dataloader import default_collate
+from torch.utils.data.distributed import DistributedSampler
+
+# Pool size, in batches, within which samples are sorted by size. Larger pools
+# mean less padding but less randomness in which samples meet in a batch.
+DEFAULT_POOL_BATCHES = 100
+
+
+class BucketBatchSampler(BatchSampler):
+    """Batch sampler that batches samples of similar size together.
+
+    Every epoch, the indices are shuffled, cut into pools of
+    ``pool_batches`` batches, sorted by size within each pool, split into
+    batches and the batches shuffled again. The plan depends only on the
+    seed and the epoch, and all ranks derive the same plan before taking
+    their share, so every rank gets the same number of batches.
+
+    ``sampler`` decides shuffling and distribution rather than the order:
+    pass a ``DistributedSampler`` (Lightning injects one under DDP) and its
+    rank, seed and epoch are used; with a ``SequentialSampler`` nothing is
+    shuffled. With ``max_tokens`` the number of batches varies slightly from
+    epoch to epoch.
+
+    Usage:
+        sizes = sample_sizes(dataset)
+        sampler = DistributedSampler(dataset, num_replicas=1, rank=0, seed=42)
+        batches = BucketBatchSampler(sampler, sizes, max_tokens=16384)
+        loader = DataLoader(dataset, batch_sampler=batches, collate_fn=pad_collate)
+    """
+
+    def __init__(
+        self,
+        sampler: Sampler,
+        sizes: Union[np.ndarray, Sequence[int]],
+        batch_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        drop_last: bool = False,
+        pool_batches: int = DEFAULT_POOL_BATCHES,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the sampler.
+
+        Args:
+            sampler: Sampler providing shuffle/rank/epoch settings (see class docstring)
+            sizes: Size of every sample in the dataset (e.g. from ``sample_sizes``)
+            batch_size: Samples per batch; also caps batches when ``max_tokens`` is set
+            max_tokens: Budget per batch as ``num_samples * largest_size``, i.e. the
+                padded batch size
+            drop_last: Drop incomplete batches (fixed ``batch_size`` only) and, under
+                DDP, the trailing batches that don't divide evenly across ranks
+                instead of repeating batches to fill them
+            pool_batches: Pool size in batches for sorting by size
+            seed: Shuffle seed when ``sampler`` isn't a DistributedSampler; defaults
+                to the seed set by ``seed_everything``
+        """
+        if batch_size is None and max_tokens is None:
+            raise ValueError("BucketBatchSampler needs batch_size, max_tokens or both")
+
+        # BatchSampler.__init__ insists on a fixed batch_size, so set its fields directly
+        self.sampler = sampler
+        self.batch_size = batch_size
+        self.drop_last = drop_last
+        self.sizes = np.asarray(sizes)
+        self.max_tokens = max_tokens
+        self.pool_batches = pool_batches
+        self.seed = seed
+        self.epoch = 0
+        self.start = 0
+        self._plan_cache: Optional[Tuple[Tuple[int, ...], List[List[int]]]] = None
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch for samplers that aren't DistributedSamplers."""
+        self.epoch = epoch
+        if callable(getattr(self.sampler, "set_epoch", None)):
+            self.sampler.set_epoch(epoch)
+
+    def set_start(self, batch: int) -> None:
+        """Begin the next pass at this rank's ``batch``-th batch of the epoch."""
+        self.start = batch
+
+    def __iter__(self) -> Iterator[List[int]]:
+        # A generator, so the epoch and start are only taken once iteration begins:
+        # DataLoader's worker iterator calls iter() twice on its first pass
+        batches = self._plan()
+        if not isinstance(self.sampler, DistributedSampler):
+            # Advance now: Lightning may stop at len() without exhausting the iterator
+            self.epoch += 1
+        start, self.start = self.start, 0
+        yield from batches[start:]
+
+    def __len__(self) -> int:
+        return len(self._plan())
+
+    def _settings(self) -> Tuple[int, int, int, int, bool]:
+        """(seed, epoch, rank, num_replicas, shuffle) for the next epoch."""
+        if isinstance(self.sampler, DistributedSampler):
+            s = self.sampler
+            return s.seed, s.epoch, s.rank, s.num_replicas, s.shuffle
+        seed = self.seed if self.seed is not None else int(os.environ.get("PL_GLOBAL_SEED", 0))
+        shuffle = not isinstance(self.sampler, SequentialSampler)
+        return seed, self.epoch, 0, 1, shuffle
+
+    def _plan(self) -> List[List[int]]:
+        """This rank's batches for the current epoch, computed once per epoch."""
+        settings = self._settings()
+        if self._plan_cache is not None and self._plan_cache[0] == settings:
+            return self._plan_cache[1]
+
+        seed, epoch, rank, num_replicas, shuffle = settings
+        rng = np.random.default_rng([seed, epoch])
+        n = len(self.sizes)
+        order = rng.permutation(n) if shuffle else np.arange(n)
+
+        pool = self.pool_batches * self._typical_batch_size()
+        batches: List[List[int]] = []
+        for start in range(0, n, pool):
+            chunk = order[start : start + pool]
+            chunk = chunk[np.argsort(self.sizes[chunk], kind="stable")]
+            batches.extend(self._split(chunk))
+
+        if shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+
+        # Every rank must see the same number of batches
+        if num_replicas > 1:
+            if self.drop_last:
+                batches = batches[: len(batches) // num_replicas * num_replicas]
+            else:
+                padding = -len(batches) % num_replicas
+                batches = batches + batches[:padding]
+            batches = batches[rank::num_replicas]
+
+        self._plan_cache = (settings, batches)
+        return batches
+
+    def _split(self, chunk: np.ndarray) -> List[List[int]]:
+        """Cut size-sorted indices into batches."""
+        if self.max_tokens is None:
+            step = self.batch_size
+            batches = [chunk[i : i + step].tolist() for i in range(0, len(chunk), step)]
+            if self.drop_last and batches and len(batches[-1]) < self.batch_size:
+                batches.pop()
+            return batches
+
+        batches, current = [], []
+        for idx, size in zip(chunk.tolist(), self.sizes[chunk].tolist()):
+            # Sorted ascending, so the newest sample is the largest in the batch
+            full = self.batch_size is not None and len(current) >= self.batch_size
+            if current and (full or (len(current) + 1) * size > self.max_tokens):
+                batches.append(current)
+                current = []
+            current.append(idx)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _typical_batch_size(self) -> int:
+        if self.max_tokens is None:
+            return self.batch_size
+        median = max(int(np.median(self.sizes)), 1) if len(self.sizes) else 1
+        typical = max(self.max_tokens // median, 1)
+        return min(typical, self.batch_size) if self.batch_size is not None else typical
+
+
+class ResumableSampler(DistributedSampler):
+    """DistributedSampler that can begin an epoch part-way through.
+
+    The order is a function of seed and epoch alone, exactly as in
+    DistributedSampler, so resuming needs only the position: after
+    ``set_start(n)`` the next pass skips this rank's first ``n`` indices
+    without touching the dataset. Being a DistributedSampler, Lightning keeps
+    it under DDP instead of swapping in its own; pass the rank and world size.
+
+    Usage:
+        sampler = ResumableSampler(dataset, num_replicas=world_size, rank=rank)
+        loader = ResumableDataLoader(dataset, batch_size=64, sampler=sampler)
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        num_replicas: int = 1,
+        rank: int = 0,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+        drop_last: bool = False,
+    ):
+        """Initialize the sampler.
+
+        Args:
+            dataset: Map-style dataset to sample from
+            num_replicas: Number of DDP ranks
+            rank: This process's rank
+            shuffle: Shuffle indices every epoch
+            seed: Shuffle seed; defaults to the seed set by ``seed_everything``
+            drop_last: Drop the tail that doesn't divide evenly across ranks
+                instead of repeating indices to fill it
+        """
+        if seed is None:
+            seed = int(os.environ.get("PL_GLOBAL_SEED", 0))
+        super().__init__(
+            dataset,
+            num_replicas=num_replicas,
+            rank=rank,
+            shuffle=shuffle,
+            seed=seed,
+            drop_last=drop_last,
+        )
+        self.start = 0
+
+    def set_start(self, index: int) -> None:
+        """Begin the next pass at this rank's ``index``-th sample of the epoch."""
+        self.start = index
+
+    def __iter__(self) -> Iterator[int]:
+        start, self.start = self.start, 0
+        return itertools.islice(super().__iter__(), start, None)
+
+
+class ResumableDataLoader(DataLoader):
+    """DataLoader that checkpoints its position within the epoch.
+
+    ``state_dict()`` records the sampler's seed and epoch and how many
+    batches of the epoch were consumed; Lightning stores it with every
+    checkpoint. After ``load_state_dict()`` the next pass tells the sampler
+    to start right after the last consumed batch, so skipped samples are
+    never loaded. ``len()`` stays the full epoch, which is what Lightning
+    expects when it resumes mid-epoch.
+
+    Needs a ResumableSampler as ``sampler`` or a BucketBatchSampler as
+    ``batch_sampler``.
+
+    Usage:
+        loader = ResumableDataLoader(dataset, batch_size=64, sampler=ResumableSampler(dataset))
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._consumed = 0
+        self._resume_at = 0
+        self._resume_epoch: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        start, self._resume_at = self._resume_at, 0
+        if start >= len(self):
+            # Saved after the last batch of an epoch but before the loop moved on
+            # (Lightning then replays the epoch number); start the next one fresh
+            sampler = self._order_sampler()
+            if getattr(sampler, "epoch", None) == self._resume_epoch:
+                sampler.set_epoch(self._resume_epoch + 1)
+            start = 0
+        self._resume_epoch = None
+        if start:
+            self._skip(start)
+        self._consumed = start
+        return self._track(super().__iter__())
+
+    def _track(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        for batch in iterator:
+            self._consumed += 1
+            yield batch
+
+    def _skip(self, batches: int) -> None:
+        if isinstance(self.batch_sampler, BucketBatchSampler):
+            self.batch_sampler.set_start(batches)
+        elif isinstance(self._order_sampler(), ResumableSampler):
+            self._order_sampler().set_start(batches * self.batch_sampler.batch_size)
+        else:
+            raise TypeError(
+                "ResumableDataLoader needs a ResumableSampler or a BucketBatchSampler to resume"
+            )
+
+    def _order_sampler(self) -> Any:
+        """The sampler whose seed and epoch determine the order."""
+        # Loaders built from a batch_sampler (e.g. SharedMemoryDataLoader) keep a default .sampler
+        return getattr(self.batch_sampler, "sampler", self.sampler)
+
+    def state_dict(self) -> Dict[str, int]:
+        sampler = self._order_sampler()
+        return {
+            "seed": getattr(sampler, "seed", 0),
+            "epoch": getattr(sampler, "epoch", 0),
+            "batches_consumed": self._consumed,
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, int]) -> None:
+        sampler = self._order_sampler()
+        if isinstance(sampler, DistributedSampler):
+            # The saved seed reproduces the saved order even if the run's seed changed
+            sampler.seed = state_dict["seed"]
+            sampler.set_epoch(state_dict["epoch"])
+        self._consumed = self._resume_at = state_dict["batches_consumed"]
+        self._resume_epoch = state_dict["epoch"]
+
+
+def sample_sizes(
+    dataset: Dataset,
+    size_fn: Optional[Callable[[Any], int]] = None,
+) -> np.ndarray:
+    """Size of every sample in ``dataset`` as a compact integer array.
+
+    Uses ``dataset.sample_sizes()`` when available (e.g. ShardedDataset reads
+    it from the shard index without decoding anything); otherwise loads every
+    sample once and measures it with ``size_fn``.
+
+    Args:
+        dataset: Map-style dataset
+        size_fn: Size of one sample; defaults to ``numel()`` of its first tensor
+
+    Returns:
+        int32 array (int64 if sizes don't fit) of length ``len(dataset)``
+    """
+    if size_fn is None and callable(getattr(dataset, "sample_sizes", None)):
+        sizes = np.asarray(dataset.sample_sizes())
+    else:
+        size_fn = size_fn or _numel
+        sizes = np.fromiter((size_fn(dataset[i]) for i in range(len(dataset))), dtype=np.int64)
+
+    if len(sizes) and sizes.max() < np.iinfo(np.int32).max:
+        return sizes.astype(np.int32)
+    return sizes.astype(np.int64)
+
+
+def pad_collate(batch: List[Any], padding_value: float = 0) -> Any:
+    """Collate samples whose tensors differ in shape by padding them to the largest.
+
+    Tensors are padded at the end of every dimension; everything else is
+    collated as usual. Write your own collate_fn if the model needs masks or
+    lengths.
+    """
+    elem = batch[0]
+    if isinstance(elem, torch.Tensor):
+        return _pad_stack(batch, padding_value)
+    if isinstance(elem, dict):
+        return {key: pad_collate([sample[key] for sample in batch], padding_value) for key in elem}
+    if isinstance(elem, (list, tuple)) and not isinstance(elem, str):
+        fields = [pad_collate(list(field), padding_value) for field in zip(*batch)]
+        return type(elem)(*fields) if hasattr(elem, "_fields") else type(elem)(fields)
+    return default_collate(batch)
+
+
+def _pad_stack(tensors: List[torch.Tensor], padding_value: float) -> torch.Tensor:
+    shape = [max(sizes) for sizes in zip(*(t.shape for t in tensors))]
+    if all(list(t.shape) == shape for t in tensors):
+        return torch.stack(tensors)
+    out = tensors[0].new_full([len(tensors), *shape], padding_value)
+    for i, t in enumerate(tensors):
+        out[(i, *(slice(0, d) for d in t.shape))] = t
+    return out
+
+
+def _numel(sample: Any) -> int:
+    if isinstance(sample, torch.Tensor):
+        return sample.numel()
+    if isinstance(sample, np.ndarray):
+        return sample.size
+    if isinstance(sample, dict):
+        sample = list(sample.values())
+    if isinstance(sample, (list, tuple)) and sample:
+        return _numel(sample[0])
+    raise TypeError(f"Can't infer the size of a {type(sample).__name__}; pass size_fn")
+
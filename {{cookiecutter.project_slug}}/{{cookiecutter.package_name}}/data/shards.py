@@ -0,0 +1,268 @@
+"""Packed shard format and memory-mapped dataset for {{cookiecutter.project_name}}.
+
+Samples are packed back-to-back into large ``.bin`` shard files with a small
+offset index per shard, so workers read records straight out of the page cache
+instead of opening and decoding one file per sample.
+
+On-disk layout::
+
+    <root>/
+        manifest.json              # dtype, record shape, shard list, class names
+        shard-00000.bin            # packed records (each aligned to RECORD_ALIGNMENT bytes)
+        shard-00000.idx.npy        # int64 [num_samples, 2] -> (byte offset, byte length)
+        shard-00000.labels.npy     # optional int64 [num_samples]
+"""
+
+import bisect
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_NAME = "lightbox-shards"
+FORMAT_VERSION = 1
+
+# Records start on a cache-line boundary so typed views are always aligned
+RECORD_ALIGNMENT = 64
+
+
+class ShardWriter:
+    """Write samples into packed, memory-mappable shards.
+
+    All samples must share one dtype. If every sample also has the same shape,
+    it is recorded in the manifest and records are read back with that shape;
+    otherwise records are returned as flat 1-D tensors.
+
+    Usage:
+        with ShardWriter("data/shards/train") as writer:
+            for array, label in samples:
+                writer.add(array, label=label)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        shard_size_bytes: int = 256 * 1024 * 1024,
+        classes: Optional[Sequence[str]] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            root: Output directory (created if missing)
+            shard_size_bytes: Start a new shard once the current one exceeds this size
+            classes: Optional class names, stored in the manifest for label lookup
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.shard_size_bytes = shard_size_bytes
+        self.classes = list(classes) if classes is not None else None
+
+        self.dtype: Optional[np.dtype] = None
+        self.record_shape: Optional[Tuple[int, ...]] = None
+        self._uniform_shape = True
+
+        self._shards: List[Dict[str, Any]] = []
+        self._file = None
+        self._index: List[Tuple[int, int]] = []
+        self._labels: List[int] = []
+        self._has_labels: Optional[bool] = None
+        self._current_name = ""
+        self._position = 0
+        self.num_samples = 0
+
+    def __enter__(self) -> "ShardWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add(
+        self,
+        sample: Union[np.ndarray, torch.Tensor, bytes],
+        label: Optional[int] = None,
+    ) -> None:
+        """Append one sample.
+
+        Args:
+            sample: Array, tensor or raw bytes (stored as uint8)
+            label: Optional integer label; either all or no samples must have one
+        """
+        array = _as_array(sample)
+
+        if self.dtype is None:
+            self.dtype = array.dtype
+            self.record_shape = array.shape
+        elif array.dtype != self.dtype:
+            raise ValueError(f"Sample dtype {array.dtype} does not match shard dtype {self.dtype}")
+        elif array.shape != self.record_shape:
+            self._uniform_shape = False
+
+        if self._has_labels is None:
+            self._has_labels = label is not None
+        elif self._has_labels != (label is not None):
+            raise ValueError("Either all samples or none must have a label")
+
+        if self._file is None:
+            self._open_shard()
+
+        data = np.ascontiguousarray(array).tobytes()
+        padding = -self._position % RECORD_ALIGNMENT
+        if padding:
+            self._file.write(b"\0" * padding)
+            self._position += padding
+
+        self._index.append((self._position, len(data)))
+        self._file.write(data)
+        self._position += len(data)
+        if label is not None:
+            self._labels.append(int(label))
+        self.num_samples += 1
+
+        if self._position >= self.shard_size_bytes:
+            self._close_shard()
+
+    def close(self) -> Path:
+        """Flush the current shard and write the manifest.
+
+        Returns:
+            Path to the written manifest
+        """
+        self._close_shard()
+        uniform = self._uniform_shape and self.record_shape is not None
+        manifest = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "dtype": np.dtype(self.dtype or np.uint8).str,
+            "record_shape": list(self.record_shape) if uniform else None,
+            "num_samples": self.num_samples,
+            "classes": self.classes,
+            "shards": self._shards,
+        }
+        manifest_path = self.root / MANIFEST_NAME
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+        return manifest_path
+
+    def _open_shard(self) -> None:
+        name = f"shard-{len(self._shards):05d}"
+        self._file = open(self.root / f"{name}.bin", "wb")
+        self._current_name = name
+        self._index = []
+        self._labels = []
+        self._position = 0
+
+    def _close_shard(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+
+        name = self._current_name
+        index = np.asarray(self._index, dtype=np.int64).reshape(-1, 2)
+        np.save(self.root / f"{name}.idx.npy", index)
+        shard = {"data": f"{name}.bin", "index": f"{name}.idx.npy", "num_samples": len(self._index)}
+        if self._has_labels:
+            np.save(self.root / f"{name}.labels.npy", np.asarray(self._labels, dtype=np.int64))
+            shard["labels"] = f"{name}.labels.npy"
+        self._shards.append(shard)
+
+
+class ShardedDataset(Dataset):
+    """Map-style dataset reading samples zero-copy from packed shards.
+
+    Shards are memory-mapped lazily in each process (so DataLoader workers never
+    share file handles) and every ``__getitem__`` returns a tensor view onto the
+    mapped pages. Mappings are copy-on-write: in-place transforms never touch
+    the files on disk.
+
+    Returns ``tensor`` or ``(tensor, label)`` when the shards carry labels.
+    """
+
+    def __init__(self, root: Union[str, Path], transform: Optional[Callable[[Any], Any]] = None):
+        """Initialize the dataset.
+
+        Args:
+            root: Directory containing ``manifest.json`` and the shard files
+            transform: Optional callable applied to each sample
+        """
+        self.root = Path(root)
+        self.transform = transform
+
+        manifest_path = self.root / MANIFEST_NAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No shard manifest found at {manifest_path}")
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("format") != FORMAT_NAME:
+            raise ValueError(f"{manifest_path} is not a {FORMAT_NAME} manifest")
+
+        self.manifest = manifest
+        self.dtype = np.dtype(manifest["dtype"])
+        record_shape = manifest["record_shape"]
+        self.record_shape = tuple(record_shape) if record_shape is not None else None
+        self.classes: Optional[List[str]] = manifest.get("classes")
+
+        shards = manifest["shards"]
+        self._data_paths = [self.root / s["data"] for s in shards]
+        self._index = [np.load(self.root / s["index"]) for s in shards]
+        self._starts = np.cumsum([0] + [s["num_samples"] for s in shards]).tolist()
+        self._labels = None
+        if shards and all("labels" in s for s in shards):
+            self._labels = np.concatenate([np.load(self.root / s["labels"]) for s in shards])
+
+        self._maps: Optional[List[np.memmap]] = None
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def __getitem__(self, idx: int) -> Any:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Index {idx} out of range for dataset of size {len(self)}")
+
+        shard = bisect.bisect_right(self._starts, idx) - 1
+        offset, length = self._index[shard][idx - self._starts[shard]]
+        sample = torch.from_numpy(self._record(shard, int(offset), int(length)))
+
+        if self._labels is not None:
+            sample = (sample, int(self._labels[idx]))
+        if self.transform is not None:
+            sample = self.transform(sample)
+        return sample
+
+    def sample_sizes(self) -> np.ndarray:
+        """Number of elements in each sample, without reading any records."""
+        if not self._index:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate([index[:, 1] for index in self._index]) // self.dtype.itemsize
+
+    def read_raw(self, idx: int) -> np.ndarray:
+        """Return the record for ``idx`` as a NumPy view, skipping label and transform."""
+        shard = bisect.bisect_right(self._starts, idx) - 1
+        offset, length = self._index[shard][idx - self._starts[shard]]
+        return self._record(shard, int(offset), int(length))
+
+    def _record(self, shard: int, offset: int, length: int) -> np.ndarray:
+        if self._maps is None:
+            self._maps = [np.memmap(path, dtype=np.uint8, mode="c") for path in self._data_paths]
+        array = self._maps[shard][offset : offset + length].view(self.dtype)
+        if self.record_shape is not None:
+            array = array.reshape(self.record_shape)
+        return array
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memory maps are reopened per process instead of being pickled into workers
+        state = self.__dict__.copy()
+        state["_maps"] = None
+        return state
+
+
+def _as_array(sample: Union[np.ndarray, torch.Tensor, bytes]) -> np.ndarray:
+    if isinstance(sample, (bytes, bytearray, memoryview)):
+        return np.frombuffer(sample, dtype=np.uint8)
+    if isinstance(sample, torch.Tensor):
+        return sample.detach().cpu().numpy()
+    return np.asarray(sample)
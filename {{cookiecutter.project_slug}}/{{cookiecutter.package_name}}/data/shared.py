@@ -0,0 +1,90 @@
+"""Datasets shared between datamodules for {{cookiecutter.project_name}}.
+
+HPO trials in one process each build a new datamodule, and by default each
+loads and preprocesses its datasets again, even when a trial only changes
+the learning rate. With sharing enabled, the first datamodule publishes its
+datasets under a key derived from the init args that affect the data, and
+later datamodules with the same key attach to them instead. Loader-only
+settings (batch size, workers, prefetching, ...) are not part of the key, so
+changing them reuses the loaded datasets.
+
+Memory-mapped datasets (ShardedDataset, FeatureCache entries, the dataset
+index) are additionally shared between processes through the page cache.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Mapping, Optional
+
+# Set to 1 to share datasets by default (the HPO script's --share-datasets does this)
+SHARE_ENV = "{{cookiecutter.package_name.upper()}}_SHARE_DATASETS"
+
+# BaseDataModule init args that only change how batches are drawn, not the datasets
+LOADER_ARGS = frozenset(
+    {
+        "batch_size",
+        "num_workers",
+        "prefetch_factor",
+        "persistent_workers",
+        "prefetch_batches",
+        "cache_bytes",
+        "cache_policy",
+        "bucket_by_size",
+        "max_tokens_per_batch",
+        "shared_memory_collate",
+        "batch_transform",
+        "resumable",
+        "share_datasets",
+    }
+)
+
+# Attributes setup() fills in and that are published/attached as a unit
+SHARED_ATTRS = ("train_dataset", "val_dataset", "test_dataset", "index")
+
+
+class DatasetRegistry:
+    """Process-wide store of loaded datasets, keyed by what produced them.
+
+    Usage:
+        key = dataset_key(type(dm), dm.hparams, stage)
+        if (entry := REGISTRY.get(key)) is None:
+            dm.setup(stage)
+            REGISTRY.put(key, {"train_dataset": dm.train_dataset})
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def put(self, key: str, attrs: Dict[str, Any]) -> None:
+        self._entries[key] = attrs
+
+    def clear(self) -> None:
+        """Drop every entry (the datasets are freed once no datamodule uses them)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+REGISTRY = DatasetRegistry()
+
+
+def dataset_key(cls: type, hparams: Mapping[str, Any], stage: Optional[str]) -> str:
+    """Key identifying the datasets ``cls`` builds from ``hparams`` for ``stage``."""
+    data_args = {k: v for k, v in hparams.items() if k not in LOADER_ARGS}
+    payload = json.dumps(
+        {"class": f"{cls.__module__}.{cls.__qualname__}", "args": data_args, "stage": stage},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def sharing_enabled() -> bool:
+    """Whether datamodules share datasets when ``share_datasets`` isn't given."""
+    return os.environ.get(SHARE_ENV, "0").lower() in ("1", "true", "yes")
+
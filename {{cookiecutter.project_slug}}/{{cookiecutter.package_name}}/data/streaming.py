@@ -0,0 +1,255 @@
+"""Streaming dataset mode for {{cookiecutter.project_name}}.
+
+StreamingShardDataset reads a list of shards sequentially instead of indexing
+samples randomly, so corpora larger than local disk (or shards that arrive
+over the network) can be trained on. Shards are split disjointly across DDP
+ranks and DataLoader workers, samples are shuffled within a bounded buffer,
+and the order is a pure function of (seed, epoch, rank, worker), so a
+resumed run replays exactly the same stream.
+
+StreamingDataLoader tracks the epoch and the number of batches consumed and
+exposes them through ``state_dict()``; Lightning stores that in every
+checkpoint (including LightningReflow pause checkpoints) and restores it on
+resume, so training continues at the next unseen batch.
+"""
+
+import os
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from torch.utils.data import DataLoader, IterableDataset, get_worker_info
+
+from .shards import ShardedDataset
+
+
+class StreamingShardDataset(IterableDataset):
+    """Iterable dataset over shards, partitioned across ranks and workers.
+
+    With at least as many shards as ``world_size * num_workers``, each shard
+    is read by exactly one worker. With fewer shards every worker reads all of
+    them and keeps every N-th sample, which avoids duplicates at the cost of
+    extra reads, so prefer many shards.
+
+    Keep shard sizes similar: under DDP every rank must produce the same
+    number of batches, or the ranks with more data wait on the others.
+
+    Usage:
+        # Packed shards written by scripts/write_shards.py
+        dataset = StreamingShardDataset.from_packed("data/shards/train")
+
+        # Any shard source, e.g. remote files
+        dataset = StreamingShardDataset(urls, open_shard=read_remote_shard)
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[Any],
+        open_shard: Callable[[Any], Iterable[Any]],
+        shuffle_buffer: int = 10000,
+        shuffle_shards: bool = True,
+        seed: Optional[int] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        num_samples: Optional[int] = None,
+    ):
+        """Initialize the dataset.
+
+        Args:
+            shards: Shard identifiers (paths, URLs, indices, ...)
+            open_shard: Callable returning an iterable of samples for one shard
+            shuffle_buffer: Size of the per-worker shuffle buffer (0 or 1 disables)
+            shuffle_shards: Shuffle the shard order every epoch
+            seed: Base seed; defaults to the seed set by ``seed_everything``
+            transform: Optional callable applied to each sample after shuffling
+            num_samples: Total number of samples, if known (enables ``len()``)
+        """
+        self.shards = list(shards)
+        self.open_shard = open_shard
+        self.shuffle_buffer = shuffle_buffer
+        self.shuffle_shards = shuffle_shards
+        self.seed = seed
+        self.transform = transform
+        self.num_samples = num_samples
+
+        self.epoch = 0
+        self.rank = int(os.environ.get("RANK", 0))
+        self.world_size = int(os.environ.get("WORLD_SIZE", 1))
+        self._resume_batches = 0
+        self._resume_batch_size = 1
+        self._resume_num_workers = 1
+
+    @classmethod
+    def from_packed(cls, root: Union[str, Path], **kwargs: Any) -> "StreamingShardDataset":
+        """Stream the packed shards written by ``ShardWriter`` in ``root``."""
+        packed = ShardedDataset(root)
+        return cls(
+            shards=list(range(len(packed.manifest["shards"]))),
+            open_shard=_PackedShardReader(packed),
+            num_samples=len(packed),
+            **kwargs,
+        )
+
+    def set_epoch(self, epoch: int) -> None:
+        """Select the epoch whose shard and sample order is produced next."""
+        self.epoch = epoch
+
+    def set_distributed(self, rank: int, world_size: int) -> None:
+        """Set this process's DDP rank (must be called before workers start)."""
+        self.rank = rank
+        self.world_size = world_size
+
+    def resume_from(self, batches_consumed: int, batch_size: int, num_workers: int) -> None:
+        """Skip the first ``batches_consumed`` batches of the current epoch.
+
+        The DataLoader hands out batches from its workers round-robin, so each
+        worker skips the samples of the batches it produced, and worker roles
+        are rotated so the restarted round-robin begins with the worker that
+        owns the next batch. Skipped samples are not transformed.
+        """
+        self._resume_batches = batches_consumed
+        self._resume_batch_size = batch_size
+        self._resume_num_workers = max(num_workers, 1)
+
+    def __len__(self) -> int:
+        if self.num_samples is None:
+            raise TypeError("Length unknown: pass num_samples to StreamingShardDataset")
+        return self.num_samples // self.world_size
+
+    def __iter__(self) -> Iterator[Any]:
+        info = get_worker_info()
+        worker_id, num_workers = (info.id, info.num_workers) if info is not None else (0, 1)
+        if self._resume_num_workers == num_workers:
+            worker_id = (worker_id + self._resume_batches) % num_workers
+        consumer = self.rank * num_workers + worker_id
+        num_consumers = self.world_size * num_workers
+        seed = self._base_seed()
+
+        # Same shard order on every rank and worker so the partition is disjoint
+        order = list(range(len(self.shards)))
+        if self.shuffle_shards:
+            random.Random(f"{seed}-{self.epoch}").shuffle(order)
+
+        if len(order) >= num_consumers:
+            samples = self._read(order[consumer::num_consumers])
+        else:
+            samples = _every_nth(self._read(order), consumer, num_consumers)
+
+        rng = random.Random(f"{seed}-{self.epoch}-{consumer}")
+        stream = _shuffled(samples, self.shuffle_buffer, rng)
+
+        skip = self._samples_to_skip(worker_id)
+        for i, sample in enumerate(stream):
+            if i < skip:
+                continue
+            yield self.transform(sample) if self.transform is not None else sample
+
+    def _read(self, shard_positions: List[int]) -> Iterator[Any]:
+        for position in shard_positions:
+            yield from self.open_shard(self.shards[position])
+
+    def _samples_to_skip(self, worker_id: int) -> int:
+        consumed, workers = self._resume_batches, self._resume_num_workers
+        if consumed <= worker_id:
+            return 0
+        return ((consumed - worker_id + workers - 1) // workers) * self._resume_batch_size
+
+    def _base_seed(self) -> int:
+        if self.seed is not None:
+            return self.seed
+        return int(os.environ.get("PL_GLOBAL_SEED", 0))
+
+
+class StreamingDataLoader(DataLoader):
+    """DataLoader that advances the stream's epoch and supports mid-epoch resume.
+
+    Every new pass starts the next epoch, whether the previous pass ran to
+    exhaustion or was cut off at ``len()`` as Lightning does. ``state_dict()``
+    records the epoch and how many of its batches were consumed; after
+    ``load_state_dict()`` the next pass resumes right after the last consumed
+    batch.
+
+    Workers are never persistent: epoch and resume position are handed to
+    freshly started workers at the start of every pass.
+    """
+
+    def __init__(self, dataset: StreamingShardDataset, *args: Any, **kwargs: Any):
+        kwargs["persistent_workers"] = False
+        super().__init__(dataset, *args, **kwargs)
+        self._epoch = 0
+        self._consumed = 0
+        self._started = False
+        self._restored = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._restored:
+            self._restored = False
+            if self._consumed >= self._batches_per_epoch():
+                self._next_epoch()
+        elif self._started:
+            self._next_epoch()
+        self._started = True
+
+        self.dataset.set_epoch(self._epoch)
+        self.dataset.resume_from(self._consumed, self.batch_size or 1, self.num_workers)
+        return self._track(super().__iter__())
+
+    def _track(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        for batch in iterator:
+            self._consumed += 1
+            yield batch
+        self._next_epoch()
+        self._started = False
+
+    def _next_epoch(self) -> None:
+        self._epoch += 1
+        self._consumed = 0
+
+    def _batches_per_epoch(self) -> float:
+        try:
+            return len(self)
+        except TypeError:
+            return float("inf")
+
+    def state_dict(self) -> Dict[str, int]:
+        return {"epoch": self._epoch, "batches_consumed": self._consumed}
+
+    def load_state_dict(self, state_dict: Dict[str, int]) -> None:
+        self._epoch = state_dict["epoch"]
+        self._consumed = state_dict["batches_consumed"]
+        self._restored = True
+
+
+class _PackedShardReader:
+    """Picklable ``open_shard`` callable for one packed shard set."""
+
+    def __init__(self, packed: ShardedDataset):
+        self.packed = packed
+
+    def __call__(self, shard: int) -> Iterator[Any]:
+        start, end = self.packed._starts[shard], self.packed._starts[shard + 1]
+        for idx in range(start, end):
+            yield self.packed[idx]
+
+
+def _every_nth(samples: Iterable[Any], offset: int, n: int) -> Iterator[Any]:
+    for i, sample in enumerate(samples):
+        if i % n == offset:
+            yield sample
+
+
+def _shuffled(samples: Iterable[Any], buffer_size: int, rng: random.Random) -> Iterator[Any]:
+    """Approximate shuffle with a bounded reservoir of ``buffer_size`` samples."""
+    if buffer_size <= 1:
+        yield from samples
+        return
+
+    buffer: List[Any] = []
+    for sample in samples:
+        if len(buffer) < buffer_size:
+            buffer.append(sample)
+            continue
+        j = rng.randrange(buffer_size)
+        yield buffer[j]
+        buffer[j] = sample
+    rng.shuffle(buffer)
+    yield from buffer
@@ -0,0 +1,154 @@
+"""Batch-level augmentation for {{cookiecutter.project_name}}.
+
+BatchAugment applies random crops, flips, noise and normalization to a whole
+batch with a handful of tensor ops, on whatever device the batch is on,
+instead of looping over samples in ``Dataset.__getitem__``. BaseDataModule
+runs it on every batch right after it reaches the device: the full random
+pipeline while training, only the deterministic part (float conversion,
+center crop, normalization) otherwise.
+"""
+
+import os
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import torch
+import torch.nn.functional as F
+from lightning.fabric.utilities.rank_zero import rank_zero_only
+
+
+class BatchAugment:
+    """Vectorized random augmentation of image batches of shape (N, C, H, W).
+
+    Every sample gets its own crop offset, flip decision and noise, all drawn
+    from a generator seeded once per device and rank, so ranks draw different
+    augmentations and a fresh run repeats them under ``seed_everything``. The
+    generator state isn't checkpointed: a resumed run draws new ones. Integer
+    batches are converted to floats in [0, 1] first. Ops run in this order:
+    crop, flips, noise, normalize. With ``train=False`` only the deterministic
+    steps run: the crop is taken from the center and there are no flips or noise.
+
+    Usage:
+        augment = BatchAugment(crop_size=32, padding=4, hflip_p=0.5,
+                               mean=[0.49, 0.48, 0.45], std=[0.25, 0.24, 0.26])
+        images = augment(images)
+        eval_images = augment(images, train=False)
+    """
+
+    def __init__(
+        self,
+        crop_size: Optional[Union[int, Tuple[int, int]]] = None,
+        padding: int = 0,
+        padding_mode: str = "constant",
+        hflip_p: float = 0.0,
+        vflip_p: float = 0.0,
+        noise_std: float = 0.0,
+        mean: Optional[Sequence[float]] = None,
+        std: Optional[Sequence[float]] = None,
+        key: Union[int, str] = 0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the augmentation.
+
+        Args:
+            crop_size: Output size of random crops (None disables cropping)
+            padding: Pixels padded on every side before cropping
+            padding_mode: ``F.pad`` mode: "constant", "reflect", "replicate", ...
+            hflip_p: Probability of a horizontal flip per sample
+            vflip_p: Probability of a vertical flip per sample
+            noise_std: Standard deviation of additive Gaussian noise (0 disables)
+            mean: Per-channel mean to subtract (None disables normalization)
+            std: Per-channel standard deviation to divide by
+            key: Which element of a (tuple/list/dict) batch holds the images
+            seed: Generator seed, offset by the global rank; defaults to the seed
+                set by ``seed_everything``
+        """
+        if isinstance(crop_size, int):
+            crop_size = (crop_size, crop_size)
+        if (mean is None) != (std is None):
+            raise ValueError("Normalization needs both mean and std")
+
+        self.crop_size = crop_size
+        self.padding = padding
+        self.padding_mode = padding_mode
+        self.hflip_p = hflip_p
+        self.vflip_p = vflip_p
+        self.noise_std = noise_std
+        self.mean = mean
+        self.std = std
+        self.key = key
+        self.seed = seed
+        self._generators: Dict[torch.device, torch.Generator] = {}
+
+    def __call__(self, x: torch.Tensor, train: bool = True) -> torch.Tensor:
+        if not x.is_floating_point():
+            x = x.float().div_(255)
+        generator = self._generator(x.device) if train else None
+
+        if self.crop_size is not None:
+            x = self._crop(x, generator)
+        if not train:
+            return self._normalize(x)
+        if self.hflip_p > 0:
+            x = torch.where(self._coin(x, self.hflip_p, generator), x.flip(-1), x)
+        if self.vflip_p > 0:
+            x = torch.where(self._coin(x, self.vflip_p, generator), x.flip(-2), x)
+        if self.noise_std > 0:
+            noise = torch.randn(x.shape, generator=generator, device=x.device, dtype=x.dtype)
+            x = x + self.noise_std * noise
+        return self._normalize(x)
+
+    def apply(self, batch: Any, train: bool = True) -> Any:
+        """Augment the image element of ``batch`` (selected by ``key``), keeping the rest."""
+        if isinstance(batch, torch.Tensor):
+            return self(batch, train)
+        if isinstance(batch, dict):
+            return {**batch, self.key: self(batch[self.key], train)}
+        items = list(batch)
+        items[self.key] = self(items[self.key], train)
+        return type(batch)(*items) if hasattr(batch, "_fields") else type(batch)(items)
+
+    def _normalize(self, x: torch.Tensor) -> torch.Tensor:
+        if self.mean is None:
+            return x
+        shape = (1, -1) + (1,) * (x.dim() - 2)
+        mean = torch.as_tensor(self.mean, device=x.device, dtype=x.dtype).view(shape)
+        std = torch.as_tensor(self.std, device=x.device, dtype=x.dtype).view(shape)
+        return (x - mean) / std
+
+    def _crop(self, x: torch.Tensor, generator: Optional[torch.Generator]) -> torch.Tensor:
+        """Crop every sample at its own random offset with one gather, or centered."""
+        if self.padding > 0:
+            x = F.pad(x, [self.padding] * 4, mode=self.padding_mode)
+        n, height, width = x.shape[0], x.shape[-2], x.shape[-1]
+        crop_h, crop_w = self.crop_size
+        if crop_h > height or crop_w > width:
+            raise ValueError(f"Crop {self.crop_size} exceeds the (padded) input {height}x{width}")
+        if generator is None:
+            top, left = (height - crop_h) // 2, (width - crop_w) // 2
+            return x[..., top : top + crop_h, left : left + crop_w].contiguous()
+
+        top = torch.randint(0, height - crop_h + 1, (n, 1), generator=generator, device=x.device)
+        left = torch.randint(0, width - crop_w + 1, (n, 1), generator=generator, device=x.device)
+        rows = top + torch.arange(crop_h, device=x.device)  # (N, crop_h)
+        cols = left + torch.arange(crop_w, device=x.device)  # (N, crop_w)
+        samples = torch.arange(n, device=x.device)[:, None, None]
+        # Advanced indices around the channel slice put the channel dim last
+        crops = x[samples, :, rows[:, :, None], cols[:, None, :]]
+        return crops.permute(0, 3, 1, 2).contiguous()
+
+    def _coin(self, x: torch.Tensor, p: float, generator: torch.Generator) -> torch.Tensor:
+        """Per-sample Bernoulli(p) mask broadcastable against ``x``."""
+        draw = torch.rand(x.shape[0], generator=generator, device=x.device)
+        return (draw < p).view((-1,) + (1,) * (x.dim() - 1))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Generators can't be pickled (e.g. into checkpoint hyperparameters)
+        return {**self.__dict__, "_generators": {}}
+
+    def _generator(self, device: torch.device) -> torch.Generator:
+        if device not in self._generators:
+            seed = self.seed if self.seed is not None else int(os.environ.get("PL_GLOBAL_SEED", 0))
+            # Offset by rank so DDP ranks don't apply identical augmentations
+            seed += rank_zero_only.rank
+            self._generators[device] = torch.Generator(device=device).manual_seed(seed)
+        return self._generators[device]
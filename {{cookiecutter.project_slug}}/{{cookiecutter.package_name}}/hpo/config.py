@@ -10,6 +10,7 @@ class HPODefaults:
     These values ensure consistency and provide documentation of baseline settings.
     """
     # TODO: Define your model-specific defaults
+    # Measure the largest batch that fits with scripts/find_batch_size.py
     BATCH_SIZE = 128
     VAL_CHECK_INTERVAL = 500
 
@@ -22,7 +23,9 @@ EXCLUDED_CLI_PARAMS: Set[str] = {
 }
 
 # Production training defaults (for generating best config command)
-# Override HPO trial settings with production-appropriate values
+# Override HPO trial settings with production-appropriate values.
+# Measure data.num_workers on the production host with scripts/tune_dataloader.py
+# and data.batch_size with scripts/find_batch_size.py.
 PRODUCTION_DEFAULTS: Dict[str, Any] = {
     "data.batch_size": 128,
     "data.num_workers": 16,
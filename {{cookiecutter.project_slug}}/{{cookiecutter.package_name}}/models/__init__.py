@@ -1,5 +1,16 @@
 """Model implementations for {{cookiecutter.project_name}}."""
 
-from .base import BaseModel
+from typing import TYPE_CHECKING
 
-__all__ = ["BaseModel"]
+from .._lazy import attach
+
+# Public name -> defining submodule; imported on first access (see _lazy.py)
+_EXPORTS = {
+    "BaseModel": "base",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .base import BaseModel
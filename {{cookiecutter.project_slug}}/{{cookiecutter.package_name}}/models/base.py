@@ -4,12 +4,16 @@ This module provides a skeleton LightningModule that you can extend
 with your own architecture.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import lightning as L
 import torch
 import torch.nn as nn
 
+from .checkpointing import StepMeter, apply_activation_checkpointing
+from .compile import compile_forward, compile_stats
+from .optim import build_optimizer, scheduler_config
+
 
 class BaseModel(L.LightningModule):
     """Base model skeleton for {{cookiecutter.project_name}}.
@@ -25,6 +29,11 @@ class BaseModel(L.LightningModule):
         self,
         learning_rate: float = 1e-4,
         weight_decay: float = 1e-5,
+        compile: Optional[Dict[str, Any]] = None,
+        activation_checkpointing: Optional[Dict[str, Any]] = None,
+        log_step_stats: bool = False,
+        optimizer_impl: str = "auto",
+        lr_scheduler: Optional[Dict[str, Any]] = None,
         # TODO: Add your model-specific parameters here
     ):
         """Initialize the model.
@@ -32,12 +41,36 @@ class BaseModel(L.LightningModule):
         Args:
             learning_rate: Learning rate for optimizer
             weight_decay: Weight decay for optimizer
+            compile: torch.compile forward() with these arguments (``mode``,
+                ``dynamic``, ``fullgraph``, ``backend``, ``options``); ``{}`` uses
+                the defaults and None runs eagerly. Compiled artifacts are cached
+                under ``paths.COMPILE_CACHE``; graph, graph-break and recompile
+                counts are logged under ``compile/``.
+            activation_checkpointing: Recompute the activations of selected
+                submodules in backward instead of storing them, e.g.
+                ``{"modules": ["encoder.layers.*"], "every_n": 2}``; see
+                ``models/checkpointing.py``
+            log_step_stats: Log per-step time and peak GPU memory under ``perf/``
+                (synchronizes CUDA every step)
+            optimizer_impl: AdamW implementation: ``auto``, ``fused``, ``foreach``
+                or ``for-loop`` (see ``models/optim.py``)
+            lr_scheduler: Warmup + decay schedule stepped every optimizer step, e.g.
+                ``{"name": "cosine", "warmup_steps": 500, "min_lr_ratio": 0.1}``;
+                None keeps the learning rate constant
         """
         super().__init__()
         self.save_hyperparameters()
 
         self.learning_rate = learning_rate
         self.weight_decay = weight_decay
+        self.compile_config = compile
+        self._compiled_frames: Optional[float] = None
+        self.checkpointing_config = activation_checkpointing
+        self.checkpointed_modules: List[str] = []
+        self.step_meter = StepMeter() if log_step_stats else None
+        self.optimizer_impl = optimizer_impl
+        self.lr_scheduler_config = lr_scheduler
+        self._compiled_step = False
 
         # TODO: Define your model layers here
         # Example:
@@ -85,20 +118,51 @@ class BaseModel(L.LightningModule):
         """
         raise NotImplementedError("Implement validation_step() in your model subclass")
 
+    def configure_model(self) -> None:
+        """Apply activation checkpointing and compile forward() if configured.
+
+        Lightning calls this before every stage, after the subclass built its layers.
+        """
+        if self.checkpointing_config is not None:
+            self.checkpointed_modules = apply_activation_checkpointing(
+                self, self.checkpointing_config
+            )
+        if self.compile_config is not None and "forward" not in self.__dict__:
+            self.forward = compile_forward(self, self.compile_config)
+
+    def on_train_batch_start(self, batch: Any, batch_idx: int) -> None:
+        if self.step_meter is not None:
+            self.step_meter.start()
+        # Callbacks run first and may run a step eagerly (e.g. ThroughputMonitor)
+        self._compiled_step = "forward" in self.__dict__
+
+    def on_train_batch_end(self, outputs: Any, batch: Any, batch_idx: int) -> None:
+        if self.step_meter is not None:
+            self.log_dict(self.step_meter.stop())
+        if self.compile_config is None or not self._compiled_step:
+            return
+        if self._compiled_frames is None:
+            # Warm after the first compiled step; anything compiled later is a recompile
+            self._compiled_frames = compile_stats()["compile/frames"]
+        self.log_dict(compile_stats(self._compiled_frames))
+
     def configure_optimizers(self) -> Dict[str, Any]:
         """Configure optimizer and learning rate scheduler.
 
+        Biases, norm-layer scales and embeddings are excluded from weight decay.
+
         Returns:
             Optimizer configuration dict
         """
-        optimizer = torch.optim.AdamW(
-            self.parameters(),
+        optimizer = build_optimizer(
+            self,
             lr=self.learning_rate,
             weight_decay=self.weight_decay,
+            implementation=self.optimizer_impl,
         )
-
-        # TODO: Optionally add learning rate scheduler
-        # scheduler = torch.optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=100)
-        # return {"optimizer": optimizer, "lr_scheduler": scheduler}
-
-        return {"optimizer": optimizer}
+        if self.lr_scheduler_config is None:
+            return {"optimizer": optimizer}
+        scheduler = scheduler_config(
+            optimizer, self.lr_scheduler_config, self.trainer.estimated_stepping_batches
+        )
+        return {"optimizer": optimizer, "lr_scheduler": scheduler}
@@ -0,0 +1,117 @@
+"""Activation checkpointing for {{cookiecutter.project_name}} models.
+
+Checkpointed submodules drop their intermediate activations after the
+forward pass and recompute them during backward, trading roughly one extra
+forward of those blocks for activation memory that no longer grows with
+their depth. BaseModel applies it from a declarative ``activation_checkpointing``
+config, so it can be switched per run or per HPO trial without code changes::
+
+    activation_checkpointing:
+      modules: ["encoder.layers.*"]   # fnmatch patterns over named_modules()
+      every_n: 2                      # checkpoint every 2nd match (1 = all)
+
+Only the wrapped module's ``forward`` is replaced, so parameter names and
+checkpoints are unchanged. ``StepMeter`` measures per-step time and peak
+memory to make the tradeoff visible.
+"""
+
+import fnmatch
+import functools
+import time
+from typing import Any, Callable, Dict, List
+
+import torch
+import torch.nn as nn
+from torch.utils.checkpoint import checkpoint
+
+# Keys accepted in BaseModel's ``activation_checkpointing`` config
+CHECKPOINT_OPTIONS = ("modules", "every_n")
+
+
+def select_modules(module: nn.Module, patterns: List[str], every_n: int = 1) -> List[str]:
+    """Names of the submodules of ``module`` to checkpoint.
+
+    Args:
+        module: Root module
+        patterns: fnmatch patterns over ``named_modules()`` names, e.g. ``"blocks.*"``
+        every_n: Keep every n-th match in definition order, starting with the first
+
+    Returns:
+        Qualified names of the selected submodules
+    """
+    if every_n < 1:
+        raise ValueError(f"every_n must be >= 1, got {every_n}")
+    matches = []
+    for name, _ in module.named_modules():
+        if not name or any(name.startswith(f"{m}.") for m in matches):
+            continue  # skip the root and anything inside an already matched module
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+            matches.append(name)
+    return matches[::every_n]
+
+
+def apply_activation_checkpointing(module: nn.Module, config: Dict[str, Any]) -> List[str]:
+    """Checkpoint the submodules of ``module`` selected by ``config``.
+
+    Args:
+        module: Root module (usually the LightningModule)
+        config: ``{"modules": [patterns], "every_n": n}``
+
+    Returns:
+        Names of the checkpointed submodules
+    """
+    unknown = set(config) - set(CHECKPOINT_OPTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown activation_checkpointing options {sorted(unknown)}; "
+            f"expected {CHECKPOINT_OPTIONS}"
+        )
+    patterns = config.get("modules") or []
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    names = select_modules(module, patterns, config.get("every_n", 1))
+    if not names:
+        raise ValueError(f"activation_checkpointing.modules {patterns} matched no submodule")
+    for name in names:
+        submodule = module.get_submodule(name)
+        if "forward" not in submodule.__dict__:
+            submodule.forward = functools.partial(_checkpointed, submodule, submodule.forward)
+    return names
+
+
+def _checkpointed(module: nn.Module, forward: Callable[..., Any], *args: Any, **kwargs: Any):
+    """Run ``forward`` under checkpointing while training, directly otherwise."""
+    if module.training and torch.is_grad_enabled():
+        return checkpoint(forward, *args, use_reentrant=False, **kwargs)
+    return forward(*args, **kwargs)
+
+
+class StepMeter:
+    """Wall time and peak accelerator memory of a training step.
+
+    Timing synchronizes CUDA so it covers the queued kernels; on CPU only
+    the time is reported.
+
+    Usage:
+        meter = StepMeter()
+        meter.start()
+        ...  # forward, backward, optimizer step
+        stats = meter.stop()  # {"perf/step_time_ms": ..., "perf/peak_memory_mb": ...}
+    """
+
+    def __init__(self):
+        self._start = 0.0
+
+    def start(self) -> None:
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+            torch.cuda.reset_peak_memory_stats()
+        self._start = time.perf_counter()
+
+    def stop(self) -> Dict[str, float]:
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+        stats = {"perf/step_time_ms": (time.perf_counter() - self._start) * 1e3}
+        if torch.cuda.is_available():
+            stats["perf/peak_memory_mb"] = torch.cuda.max_memory_allocated() / 2**20
+        return stats
@@ -0,0 +1,86 @@
+"""torch.compile support for {{cookiecutter.project_name}} models.
+
+BaseModel compiles its ``forward`` when given a ``compile`` config. Compiled
+artifacts (Inductor FX graphs, AOTAutograd graphs, Triton kernels) are cached
+under ``paths.COMPILE_CACHE``, so restarts, resumes and HPO trials reuse them
+instead of compiling from scratch. ``compile_stats()`` summarizes Dynamo's
+counters (graphs, graph breaks, recompiles, cache hits) for logging.
+"""
+
+import os
+from typing import Any, Callable, Dict, Optional
+
+import torch
+from torch._dynamo.utils import counters
+
+from .. import paths
+
+# Keys accepted in BaseModel's ``compile`` config, passed to torch.compile
+COMPILE_OPTIONS = ("mode", "dynamic", "fullgraph", "backend", "options")
+
+
+def compile_forward(module: torch.nn.Module, config: Dict[str, Any]) -> Callable[..., Any]:
+    """Compile ``module.forward`` with the persistent cache enabled.
+
+    Args:
+        module: Module whose forward to compile
+        config: torch.compile arguments, e.g. ``{"mode": "max-autotune", "dynamic": False}``
+
+    Returns:
+        The compiled forward, to assign to ``module.forward``
+    """
+    unknown = set(config) - set(COMPILE_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown compile options {sorted(unknown)}; expected {COMPILE_OPTIONS}")
+    enable_compile_cache()
+    return torch.compile(module.forward, **config)
+
+
+def enable_compile_cache() -> None:
+    """Turn on Inductor's on-disk caches, stored under ``paths.COMPILE_CACHE``.
+
+    A ``TORCHINDUCTOR_CACHE_DIR`` set by the user is kept. Importing Lightning or
+    ``torch._inductor`` sets it to Inductor's default under /tmp when unset, so that
+    default is replaced too. Triton kernels are cached in its ``triton/`` subdirectory.
+    """
+    paths.setup_compile_cache()
+
+    import torch._functorch.config as functorch_config
+    import torch._inductor.config as inductor_config
+
+    try:
+        from torch._inductor.runtime.cache_dir_utils import default_cache_dir
+    except ImportError:  # torch < 2.5
+        from torch._inductor.runtime.runtime_utils import default_cache_dir
+
+    if os.path.abspath(os.environ["TORCHINDUCTOR_CACHE_DIR"]) == default_cache_dir():
+        os.environ["TORCHINDUCTOR_CACHE_DIR"] = str(paths.COMPILE_CACHE.resolve())
+    paths.COMPILE_CACHE.mkdir(parents=True, exist_ok=True)
+    inductor_config.fx_graph_cache = True
+    if hasattr(functorch_config, "enable_autograd_cache"):
+        functorch_config.enable_autograd_cache = True
+
+
+def compile_stats(baseline_frames: Optional[int] = None) -> Dict[str, float]:
+    """Dynamo compilation statistics for this process.
+
+    Args:
+        baseline_frames: Frames compiled when the model was warm (e.g. after the
+            first training step); frames compiled since count as recompiles
+
+    Returns:
+        Dict of ``compile/*`` metrics
+    """
+    # Older releases count breaks under "graph_break", newer ones under "unimplemented"
+    graph_breaks = sum(counters["graph_break"].values()) or sum(counters["unimplemented"].values())
+    frames = counters["frames"]["total"]
+    stats = {
+        "compile/graphs": float(counters["stats"]["unique_graphs"]),
+        "compile/graph_breaks": float(graph_breaks),
+        "compile/frames": float(frames),
+        "compile/cache_hits": float(counters["inductor"]["fxgraph_cache_hit"]),
+        "compile/cache_misses": float(counters["inductor"]["fxgraph_cache_miss"]),
+    }
+    if baseline_frames is not None:
+        stats["compile/recompiles"] = float(frames - baseline_frames)
+    return stats
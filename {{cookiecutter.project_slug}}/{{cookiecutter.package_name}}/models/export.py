@@ -0,0 +1,189 @@
+"""Model export and inference benchmarking for {{cookiecutter.project_name}}.
+
+Exports a trained model to TorchScript (``torch.jit.trace``) and ONNX (the
+``torch.export``-based exporter, with a dynamic batch dimension), checks
+that every export reproduces the eager outputs, and measures latency
+percentiles and throughput per batch size.
+
+ONNX needs the optional ``export`` dependencies (``pip install -e .[export]``:
+onnx, onnxscript and onnxruntime); TorchScript needs nothing extra.
+"""
+
+import importlib
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import torch
+import torch.nn as nn
+from lightning.pytorch.core.module import _jit_is_scripting
+
+EXPORT_FORMATS = ("torchscript", "onnx")
+
+# Inference callable: a CPU float tensor batch in, a CPU tensor out
+Runner = Callable[[torch.Tensor], torch.Tensor]
+
+
+def load_checkpoint(class_path: str, checkpoint: Union[str, Path], ema: bool = False) -> nn.Module:
+    """Load a Lightning checkpoint into its model class, in eval mode on CPU.
+
+    The model runs eagerly even if it was trained with ``compile``: tracing,
+    ONNX export and quantization can't handle a compiled forward.
+
+    Args:
+        class_path: Model class, e.g. ``config["model"]["class_path"]``
+        checkpoint: Lightning ``.ckpt`` file
+        ema: Load the EMA callback's shadow weights instead of the trained ones
+
+    Returns:
+        The model
+    """
+    module_name, _, class_name = class_path.rpartition(".")
+    cls = getattr(importlib.import_module(module_name), class_name)
+    model = cls.load_from_checkpoint(checkpoint, map_location="cpu", compile=None)
+    if ema:
+        state = torch.load(checkpoint, map_location="cpu", weights_only=False)
+        shadows = [
+            s["shadow"] for key, s in state.get("callbacks", {}).items() if key.startswith("EMA")
+        ]
+        if not shadows:
+            raise KeyError(f"{checkpoint} has no EMA callback state")
+        model.load_state_dict(shadows[0], strict=False)
+    return model.eval()
+
+
+def export_torchscript(model: nn.Module, example: torch.Tensor, path: Union[str, Path]) -> Path:
+    """Trace ``model`` on ``example`` and save the TorchScript module."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Tracing reads every attribute; Lightning's flag keeps `trainer` from raising when detached
+    with torch.no_grad(), _jit_is_scripting():
+        traced = torch.jit.trace(model, example)
+    traced.save(str(path))
+    return path
+
+
+def export_onnx(
+    model: nn.Module,
+    example: torch.Tensor,
+    path: Union[str, Path],
+    opset_version: Optional[int] = None,
+) -> Path:
+    """Export ``model`` to ONNX with a dynamic batch dimension.
+
+    ``example`` needs a batch of at least 2, or the exporter specializes
+    the batch dimension to the example's size.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (example,),
+            str(path),
+            input_names=["input"],
+            output_names=["output"],
+            dynamic_shapes=({0: torch.export.Dim("batch")},),
+            opset_version=opset_version,
+        )
+    return path
+
+
+def eager_runner(model: nn.Module) -> Runner:
+    def run(x: torch.Tensor) -> torch.Tensor:
+        with torch.no_grad():
+            return model(x)
+
+    return run
+
+
+def torchscript_runner(path: Union[str, Path]) -> Runner:
+    module = torch.jit.load(str(path), map_location="cpu").eval()
+    return eager_runner(module)
+
+
+def onnx_runner(path: Union[str, Path], num_threads: Optional[int] = None) -> Runner:
+    """Run an exported ONNX model with onnxruntime on the CPU."""
+    try:
+        import onnxruntime as ort
+    except ImportError as e:
+        raise ImportError("ONNX inference needs onnxruntime: pip install -e .[export]") from e
+    options = ort.SessionOptions()
+    if num_threads:
+        options.intra_op_num_threads = num_threads
+    session = ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+
+    def run(x: torch.Tensor) -> torch.Tensor:
+        return torch.from_numpy(session.run(None, {"input": x.numpy()})[0])
+
+    return run
+
+
+def check_outputs(
+    reference: Runner,
+    candidate: Runner,
+    inputs: Sequence[torch.Tensor],
+    rtol: float = 1e-4,
+    atol: float = 1e-5,
+) -> float:
+    """Compare ``candidate`` against ``reference`` on every input.
+
+    Returns:
+        The largest absolute difference seen
+
+    Raises:
+        AssertionError: If any output differs beyond the tolerances
+    """
+    max_error = 0.0
+    for x in inputs:
+        expected, actual = reference(x), candidate(x)
+        torch.testing.assert_close(actual, expected, rtol=rtol, atol=atol)
+        max_error = max(max_error, (actual - expected).abs().max().item())
+    return max_error
+
+
+def benchmark(
+    runner: Runner,
+    make_input: Callable[[int], torch.Tensor],
+    batch_sizes: Sequence[int],
+    warmup: int = 10,
+    iters: int = 100,
+) -> List[Dict[str, float]]:
+    """Latency percentiles and throughput of ``runner`` per batch size.
+
+    Args:
+        runner: Inference callable
+        make_input: Builds an input batch of the given size
+        batch_sizes: Batch sizes to measure
+        warmup: Untimed calls per batch size
+        iters: Timed calls per batch size
+
+    Returns:
+        One dict per batch size: batch_size, p50_ms, p90_ms, p99_ms, mean_ms,
+        samples_per_s
+    """
+    results = []
+    for batch_size in batch_sizes:
+        x = make_input(batch_size)
+        for _ in range(warmup):
+            runner(x)
+        times = []
+        for _ in range(iters):
+            start = time.perf_counter()
+            runner(x)
+            times.append(time.perf_counter() - start)
+        p50, p90, p99 = np.percentile(times, [50, 90, 99]) * 1e3
+        mean = statistics.fmean(times)
+        results.append(
+            {
+                "batch_size": batch_size,
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "mean_ms": mean * 1e3,
+                "samples_per_s": batch_size / mean,
+            }
+        )
+    return results
@@ -0,0 +1,144 @@
+"""Optimizer and learning-rate schedule construction for {{cookiecutter.project_name}}.
+
+``build_optimizer`` creates AdamW with two parameter groups: weight decay
+applies to weight matrices and conv kernels, but not to biases, norm-layer
+scales or embeddings, where it only shrinks values the model needs. It also
+selects the AdamW implementation explicitly:
+
+- ``fused``: one kernel for all parameters (CUDA tensors only, fastest)
+- ``foreach``: multi-tensor ops, a few kernels per group (any device)
+- ``for-loop``: one set of ops per parameter (the reference implementation)
+- ``auto``: ``fused`` when every parameter is on CUDA, else ``foreach``
+
+``build_scheduler`` adds linear warmup followed by a constant, linear or
+cosine decay, stepped every optimizer step.
+"""
+
+import math
+from typing import Any, Dict, List
+
+import torch
+import torch.nn as nn
+
+OPTIMIZER_IMPLS = ("auto", "fused", "foreach", "for-loop")
+SCHEDULES = ("constant", "linear", "cosine")
+
+# Parameters of these modules are never decayed, whatever their shape
+NO_DECAY_MODULES = (nn.Embedding, nn.EmbeddingBag)
+
+
+def param_groups(module: nn.Module, weight_decay: float) -> List[Dict[str, Any]]:
+    """Split the trainable parameters of ``module`` into decay / no-decay groups.
+
+    Args:
+        module: Model whose parameters to optimize
+        weight_decay: Decay for the weight matrices
+
+    Returns:
+        Parameter groups for a torch optimizer (empty groups are omitted)
+    """
+    no_decay_ids = {
+        id(p)
+        for m in module.modules()
+        if isinstance(m, NO_DECAY_MODULES)
+        for p in m.parameters(recurse=False)
+    }
+    decay, no_decay = [], []
+    for param in module.parameters():
+        if not param.requires_grad:
+            continue
+        if param.ndim <= 1 or id(param) in no_decay_ids:
+            no_decay.append(param)
+        else:
+            decay.append(param)
+    groups = [
+        {"params": decay, "weight_decay": weight_decay},
+        {"params": no_decay, "weight_decay": 0.0},
+    ]
+    return [group for group in groups if group["params"]]
+
+
+def build_optimizer(
+    module: nn.Module,
+    lr: float,
+    weight_decay: float,
+    implementation: str = "auto",
+) -> torch.optim.AdamW:
+    """AdamW over ``param_groups(module)`` with an explicit implementation.
+
+    Args:
+        module: Model whose parameters to optimize
+        lr: Learning rate
+        weight_decay: Decay for the weight matrices
+        implementation: One of ``OPTIMIZER_IMPLS``
+
+    Returns:
+        The optimizer
+    """
+    if implementation not in OPTIMIZER_IMPLS:
+        raise ValueError(
+            f"Unknown optimizer implementation '{implementation}', "
+            f"expected one of {OPTIMIZER_IMPLS}"
+        )
+    groups = param_groups(module, weight_decay)
+    if implementation == "auto":
+        on_cuda = all(p.is_cuda for group in groups for p in group["params"])
+        implementation = "fused" if groups and on_cuda else "foreach"
+    return torch.optim.AdamW(
+        groups,
+        lr=lr,
+        fused=implementation == "fused",
+        foreach=implementation == "foreach",
+    )
+
+
+def build_scheduler(
+    optimizer: torch.optim.Optimizer,
+    total_steps: int,
+    name: str = "cosine",
+    warmup_steps: int = 0,
+    min_lr_ratio: float = 0.0,
+) -> torch.optim.lr_scheduler.LambdaLR:
+    """Linear warmup from 0, then ``name`` decay to ``min_lr_ratio`` × lr at ``total_steps``.
+
+    Args:
+        optimizer: Optimizer whose learning rates to schedule
+        total_steps: Optimizer steps in the whole run
+        name: Decay after warmup, one of ``SCHEDULES``
+        warmup_steps: Steps of linear warmup
+        min_lr_ratio: Final learning rate as a fraction of the initial one
+
+    Returns:
+        A scheduler to step after every optimizer step
+    """
+    if name not in SCHEDULES:
+        raise ValueError(f"Unknown schedule '{name}', expected one of {SCHEDULES}")
+
+    def factor(step: int) -> float:
+        if step < warmup_steps:
+            return (step + 1) / warmup_steps
+        if name == "constant":
+            return 1.0
+        progress = min(1.0, (step - warmup_steps) / max(1, total_steps - warmup_steps))
+        if name == "linear":
+            decay = 1.0 - progress
+        else:
+            decay = 0.5 * (1.0 + math.cos(math.pi * progress))
+        return min_lr_ratio + (1.0 - min_lr_ratio) * decay
+
+    return torch.optim.lr_scheduler.LambdaLR(optimizer, factor)
+
+
+def scheduler_config(
+    optimizer: torch.optim.Optimizer,
+    config: Dict[str, Any],
+    total_steps: int,
+) -> Dict[str, Any]:
+    """Lightning ``lr_scheduler`` entry for a YAML ``lr_scheduler`` config.
+
+    ``config`` holds ``build_scheduler`` arguments; ``total_steps`` in it
+    overrides the given one (e.g. when the trainer can't estimate it).
+    """
+    options = dict(config)
+    scheduler = build_scheduler(optimizer, options.pop("total_steps", total_steps), **options)
+    return {"scheduler": scheduler, "interval": "step", "frequency": 1}
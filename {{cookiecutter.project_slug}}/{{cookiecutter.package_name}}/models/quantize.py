@@ -0,0 +1,130 @@
+"""Post-training int8 quantization for {{cookiecutter.project_name}} CPU inference.
+
+Two modes, both leaving the original model untouched:
+
+- ``dynamic``: Linear/LSTM/GRU weights are stored as int8 and activations
+  are quantized on the fly per batch. No calibration data, works on any
+  model; the gain is largest for Linear-heavy models at small batch sizes.
+- ``static``: weights and activations are int8, with activation ranges
+  observed on calibration batches (FX graph mode). Faster than dynamic,
+  also covers convolutions, but needs a ``forward`` that ``torch.fx`` can
+  trace (no data-dependent Python control flow).
+
+``compare_outputs`` reports how far the quantized outputs drift from fp32
+and, for classification batches, the accuracy of both.
+
+Uses ``torch.ao.quantization``, which PyTorch has deprecated in favour of
+torchao; it's imported lazily so only quantization runs see its warnings.
+"""
+
+import copy
+import io
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import torch
+import torch.nn as nn
+
+QUANT_MODES = ("dynamic", "static")
+
+
+def split_batch(batch: Any) -> Tuple[torch.Tensor, Optional[torch.Tensor]]:
+    """(inputs, targets) of a dataloader batch; targets is None if there are none.
+
+    Handles a bare tensor and ``(inputs, targets, ...)`` tuples/lists. Adapt this
+    if your batches are structured differently.
+    """
+    if isinstance(batch, torch.Tensor):
+        return batch, None
+    if isinstance(batch, (tuple, list)):
+        return batch[0], batch[1] if len(batch) > 1 else None
+    raise TypeError(f"Don't know how to split a {type(batch).__name__} batch; adapt split_batch()")
+
+
+def quantize_dynamic(model: nn.Module) -> nn.Module:
+    """Copy of ``model`` with dynamically quantized int8 Linear/LSTM/GRU layers."""
+    from torch.ao.quantization import quantize_dynamic as ao_quantize_dynamic
+
+    layers = {nn.Linear, nn.LSTM, nn.GRU}
+    return ao_quantize_dynamic(copy.deepcopy(model).eval(), layers, dtype=torch.qint8)
+
+
+def quantize_static(
+    model: nn.Module,
+    calibration_inputs: Iterable[torch.Tensor],
+    backend: str = "x86",
+) -> nn.Module:
+    """Statically quantized copy of ``model``, calibrated on ``calibration_inputs``.
+
+    Args:
+        model: Float model
+        calibration_inputs: Input batches representative of inference traffic
+        backend: Quantized kernel backend, "x86" (or "fbgemm") on Intel/AMD,
+            "qnnpack" on ARM; also selected for inference
+
+    Returns:
+        The quantized model (a ``torch.fx.GraphModule``)
+    """
+    from torch.ao.quantization import get_default_qconfig_mapping
+    from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+    torch.backends.quantized.engine = backend
+    inputs = iter(calibration_inputs)
+    first = next(inputs)
+    float_model = copy.deepcopy(model).eval()
+    prepared = prepare_fx(float_model, get_default_qconfig_mapping(backend), (first,))
+    with torch.no_grad():
+        prepared(first)
+        for x in inputs:
+            prepared(x)
+    return convert_fx(prepared)
+
+
+def model_size_bytes(model: nn.Module) -> int:
+    """Serialized size of ``model``'s state dict."""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def compare_outputs(
+    reference: nn.Module,
+    candidate: nn.Module,
+    batches: Sequence[Any],
+) -> Dict[str, float]:
+    """Output drift of ``candidate`` from ``reference``, and accuracy when labeled.
+
+    Args:
+        reference: Float model
+        candidate: Quantized model
+        batches: Dataloader batches (see ``split_batch``)
+
+    Returns:
+        ``max_abs_error`` and ``mean_abs_error`` of the outputs, plus for
+        classification (integer targets, 2-D outputs) ``argmax_agreement``,
+        ``reference_accuracy``, ``candidate_accuracy`` and ``accuracy_delta``
+    """
+    max_error, error_sum, numel = 0.0, 0.0, 0
+    rows, agree, correct_ref, correct_cand, labeled = 0, 0, 0, 0, 0
+    with torch.no_grad():
+        for batch in batches:
+            x, y = split_batch(batch)
+            expected, actual = reference(x), candidate(x)
+            diff = (actual.float() - expected.float()).abs()
+            max_error = max(max_error, diff.max().item())
+            error_sum += diff.sum().item()
+            numel += diff.numel()
+            if expected.ndim == 2:
+                rows += len(expected)
+                agree += (expected.argmax(1) == actual.argmax(1)).sum().item()
+                if y is not None and not y.is_floating_point():
+                    correct_ref += (expected.argmax(1) == y).sum().item()
+                    correct_cand += (actual.argmax(1) == y).sum().item()
+                    labeled += len(y)
+    stats = {"max_abs_error": max_error, "mean_abs_error": error_sum / max(numel, 1)}
+    if rows:
+        stats["argmax_agreement"] = agree / rows
+    if labeled:
+        stats["reference_accuracy"] = correct_ref / labeled
+        stats["candidate_accuracy"] = correct_cand / labeled
+        stats["accuracy_delta"] = stats["candidate_accuracy"] - stats["reference_accuracy"]
+    return stats
@@ -2,6 +2,9 @@
 
 This module provides standardized paths for outputs, logs, and checkpoints.
 All paths can be overridden via the {{cookiecutter.package_name.upper()}}_OUTPUT_DIR environment variable.
+
+Importing it has no side effects: each directory is created by the code that
+writes to it, and entry points call ``setup_environment()`` before training.
 """
 
 import os
@@ -17,8 +20,25 @@ WANDB_DIR = OUTPUT_ROOT / "wandb"
 PAUSE_CHECKPOINTS = OUTPUT_ROOT / "pause_checkpoints"
 HPO_CHECKPOINTS = OUTPUT_ROOT / "hpo_checkpoints"
 LOGS = OUTPUT_ROOT / "logs"
+FEATURE_CACHE = OUTPUT_ROOT / "feature_cache"
+DATASET_INDEX = OUTPUT_ROOT / "dataset_index"
+COMPILE_CACHE = OUTPUT_ROOT / "compile_cache"
+BATCH_SIZE_CACHE = OUTPUT_ROOT / "batch_size_cache"
+EXPORTS = OUTPUT_ROOT / "exports"
 
-ALL_DIRS = [LIGHTNING_LOGS, WANDB_LOGS, WANDB_DIR, PAUSE_CHECKPOINTS, HPO_CHECKPOINTS, LOGS]
+ALL_DIRS = [
+    LIGHTNING_LOGS,
+    WANDB_LOGS,
+    WANDB_DIR,
+    PAUSE_CHECKPOINTS,
+    HPO_CHECKPOINTS,
+    LOGS,
+    FEATURE_CACHE,
+    DATASET_INDEX,
+    COMPILE_CACHE,
+    BATCH_SIZE_CACHE,
+    EXPORTS,
+]
 
 
 def ensure_dirs():
@@ -28,10 +48,21 @@ def ensure_dirs():
 
 
 def setup_environment():
-    """Setup environment variables for external libraries."""
-    ensure_dirs()
+    """Point external libraries at the output directories, unless already configured.
+
+    Call once at startup, before wandb or torch.compile are used.
+    """
+    # The only directories created up front: wandb expects its directories to exist
+    for d in (WANDB_DIR, WANDB_LOGS):
+        d.mkdir(parents=True, exist_ok=True)
     os.environ.setdefault("WANDB_DIR", str(WANDB_DIR))
+    setup_compile_cache()
+
 
+def setup_compile_cache():
+    """Point torch.compile's on-disk cache at COMPILE_CACHE, unless already configured.
 
-# Auto-setup on import
-setup_environment()
+    Must run before torch._inductor is imported (Lightning imports it), which sets
+    TORCHINDUCTOR_CACHE_DIR to Inductor's own default under /tmp. See models/compile.py.
+    """
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(COMPILE_CACHE.resolve()))
@@ -0,0 +1,20 @@
+"""Local inference serving for {{cookiecutter.project_name}}."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# Public name -> defining submodule; imported on first access (see _lazy.py)
+_EXPORTS = {
+    "DynamicBatcher": "batcher",
+    "InferenceClient": "client",
+    "InferenceServer": "server",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .batcher import DynamicBatcher
+    from .client import InferenceClient
+    from .server import InferenceServer
@@ -0,0 +1,173 @@
+"""Dynamic request batching for {{cookiecutter.project_name}} inference.
+
+Concurrent requests are queued and coalesced into micro-batches: a batch
+is dispatched once it holds ``max_batch_size`` samples or its oldest
+request has waited ``max_latency_ms``, whichever comes first. While a batch
+runs, new requests keep queueing, so under load batches fill up on their
+own and the deadline only matters when traffic is light.
+
+Inference runs in a single worker thread under ``torch.inference_mode``,
+leaving the event loop free to accept and parse requests.
+"""
+
+import asyncio
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import torch
+import torch.nn as nn
+
+
+@dataclass
+class _Request:
+    sample: torch.Tensor
+    future: asyncio.Future
+    arrival: float = field(default_factory=time.perf_counter)
+
+
+def _bucket(depth: int) -> str:
+    """Power-of-two histogram bucket label for a queue depth: 0, 1, 2-3, 4-7, ..."""
+    if depth < 2:
+        return str(depth)
+    low = 1 << (depth.bit_length() - 1)
+    return f"{low}-{2 * low - 1}"
+
+
+class DynamicBatcher:
+    """Coalesce single-sample requests into batched ``model`` calls.
+
+    Usage:
+        batcher = DynamicBatcher(model, max_batch_size=32, max_latency_ms=5)
+        await batcher.start()
+        output = await batcher.predict(torch.randn(128))  # one sample, no batch dim
+        print(batcher.stats())
+        await batcher.stop()
+    """
+
+    def __init__(
+        self,
+        model: nn.Module,
+        max_batch_size: int = 32,
+        max_latency_ms: float = 5.0,
+        device: Optional[torch.device] = None,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            model: Model in eval mode; called with a stacked ``(batch, ...)`` tensor
+            max_batch_size: Most samples per model call
+            max_latency_ms: Longest a request waits for its batch to fill
+            device: Device to run on (default: the model's parameters' device)
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1e3
+        params = next(model.parameters(), None)
+        self.device = device or (params.device if params is not None else torch.device("cpu"))
+        self.batch_sizes: Counter = Counter()
+        self.queue_depths: Counter = Counter()
+        self.requests = 0
+        self.errors = 0
+        self.inference_s = 0.0
+        self.queue_wait_s = 0.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=True)
+
+    async def predict(self, sample: torch.Tensor) -> torch.Tensor:
+        """Model output for one sample (no batch dimension)."""
+        if self._queue is None:
+            raise RuntimeError("DynamicBatcher.start() has not been awaited")
+        request = _Request(sample, asyncio.get_running_loop().create_future())
+        await self._queue.put(request)
+        return await request.future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = batch[0].arrival + self.max_latency
+            while len(batch) < self.max_batch_size:
+                # Take whatever is already queued, then wait out the deadline
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.queue_depths[_bucket(self._queue.qsize())] += 1
+            self.batch_sizes[len(batch)] += 1
+            self.requests += len(batch)
+            start = time.perf_counter()
+            self.queue_wait_s += sum(start - r.arrival for r in batch)
+            outputs = await loop.run_in_executor(
+                self._executor, self._infer, [r.sample for r in batch]
+            )
+            self.inference_s += time.perf_counter() - start
+            for request, output in zip(batch, outputs):
+                if request.future.done():  # the client went away
+                    continue
+                if isinstance(output, Exception):
+                    self.errors += 1
+                    request.future.set_exception(output)
+                else:
+                    request.future.set_result(output)
+
+    def _infer(self, samples: List[torch.Tensor]) -> List[Union[torch.Tensor, Exception]]:
+        """Output (or the error raised) per sample.
+
+        Samples of different shapes run as separate batches, so a malformed
+        request only fails the requests shaped like it.
+        """
+        groups: Dict[Tuple[int, ...], List[int]] = defaultdict(list)
+        for i, sample in enumerate(samples):
+            groups[tuple(sample.shape)].append(i)
+        outputs: List[Union[torch.Tensor, Exception]] = [None] * len(samples)
+        for indices in groups.values():
+            try:
+                x = torch.stack([samples[i] for i in indices]).to(self.device, non_blocking=True)
+                with torch.inference_mode():
+                    result = self.model(x).cpu()
+            except Exception as e:
+                result = [e] * len(indices)
+            for i, output in zip(indices, result):
+                outputs[i] = output
+        return outputs
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and histograms since start: batch sizes and queue depths at dispatch."""
+        batches = sum(self.batch_sizes.values())
+        return {
+            "requests": self.requests,
+            "batches": batches,
+            "errors": self.errors,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "mean_batch_size": self.requests / batches if batches else 0.0,
+            "mean_queue_wait_ms": self.queue_wait_s / self.requests * 1e3 if self.requests else 0.0,
+            "mean_inference_ms": self.inference_s / batches * 1e3 if batches else 0.0,
+            "batch_size_histogram": {str(k): v for k, v in sorted(self.batch_sizes.items())},
+            "queue_depth_histogram": dict(
+                sorted(self.queue_depths.items(), key=lambda kv: int(kv[0].split("-")[0]))
+            ),
+        }
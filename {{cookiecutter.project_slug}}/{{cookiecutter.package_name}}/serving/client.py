@@ -0,0 +1,60 @@
+"""Minimal asyncio HTTP client for the {{cookiecutter.project_name}} inference server."""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class InferenceClient:
+    """One keep-alive connection to an InferenceServer.
+
+    Usage:
+        client = await InferenceClient.connect(port=8000)  # or unix_socket="/tmp/model.sock"
+        status, body = await client.request("POST", "/predict", {"inputs": [0.1, 0.2]})
+        await client.close()
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(
+        cls, host: str = "127.0.0.1", port: int = 8000, unix_socket: Optional[str] = None
+    ) -> "InferenceClient":
+        if unix_socket:
+            return cls(*await asyncio.open_unix_connection(unix_socket))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(
+        self, method: str, path: str, payload: Optional[Union[Dict[str, Any], bytes]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Send a request and return ``(status, decoded JSON body)``.
+
+        ``payload`` may be already-encoded JSON bytes, to skip encoding when the
+        same body is sent many times.
+        """
+        if isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload).encode() if payload is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+        if body:
+            head += "Content-Type: application/json\r\n"
+        self.writer.write((head + "\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
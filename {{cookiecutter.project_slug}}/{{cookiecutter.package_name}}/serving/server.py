@@ -0,0 +1,128 @@
+"""Local HTTP inference endpoint for {{cookiecutter.project_name}}.
+
+A minimal HTTP/1.1 server on asyncio streams (no web framework), listening
+on TCP or a Unix socket, with keep-alive connections. Endpoints:
+
+- ``POST /predict`` with ``{"inputs": <one sample as nested lists>}``
+  returns ``{"outputs": <model output for the sample>}``
+- ``GET /stats`` returns the batcher's counters and histograms
+- ``GET /health`` returns ``{"status": "ok"}``
+
+Meant for local benchmarking and internal use, not as an internet-facing
+server: there's no TLS, auth or request size limit beyond ``MAX_BODY_BYTES``.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import torch
+
+from .batcher import DynamicBatcher
+
+MAX_BODY_BYTES = 64 * 2**20
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class InferenceServer:
+    """Serve a DynamicBatcher over HTTP.
+
+    Usage:
+        server = InferenceServer(batcher)
+        await server.start(port=8000)           # or unix_socket="/tmp/model.sock"
+        await server.serve_forever()
+    """
+
+    def __init__(self, batcher: DynamicBatcher, dtype: torch.dtype = torch.float32):
+        """Initialize the server.
+
+        Args:
+            batcher: Started batcher that runs the model
+            dtype: dtype of the input tensors built from request JSON
+        """
+        self.batcher = batcher
+        self.dtype = dtype
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 8000, unix_socket: Optional[str] = None
+    ) -> None:
+        if unix_socket:
+            self._server = await asyncio.start_unix_server(self._handle, path=unix_socket)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+
+    @property
+    def address(self) -> Any:
+        """Bound address: ``(host, port)`` for TCP, the socket path for Unix sockets."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "request body too large"})
+                    break
+                body = await reader.readexactly(length)
+                status, payload = await self._route(method, path, body)
+                await self._respond(writer, status, payload)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # client went away or sent something that isn't HTTP
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/stats":
+            return 200, self.batcher.stats()
+        if method != "POST" or path != "/predict":
+            return 404, {"error": f"no route for {method} {path}"}
+        try:
+            sample = torch.tensor(json.loads(body)["inputs"], dtype=self.dtype)
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {"error": f'expected a JSON object with an "inputs" list: {e}'}
+        try:
+            output = await self.batcher.predict(sample)
+        except Exception as e:  # report model errors (e.g. a wrong input shape) to the client
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+        return 200, {"outputs": output.tolist()}
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        await writer.drain()
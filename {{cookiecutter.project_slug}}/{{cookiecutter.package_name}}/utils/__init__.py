@@ -0,0 +1,18 @@
+"""Shared utilities for {{cookiecutter.project_name}}."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# Public name -> defining submodule; imported on first access (see _lazy.py)
+_EXPORTS = {
+    "instantiate": "config",
+    "load_config": "config",
+    "write_overrides": "config",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .config import instantiate, load_config, write_overrides
@@ -0,0 +1,332 @@
+"""Maximum batch size search for {{cookiecutter.project_name}}.
+
+Runs a few real training steps (forward, backward, optimizer step, with the
+trainer's precision) at growing batch sizes: doubling until a step runs out
+of memory, then binary search between the last batch that fit and the first
+that didn't. On CUDA a batch fits if it doesn't raise an out-of-memory error;
+on CPU, where running out of memory kills the process instead, it fits if the
+peak RSS stays within a RAM budget. Since peak RSS grows roughly linearly with
+batch size, CPU candidates whose peak, extrapolated from the batches measured so
+far, would exceed the budget count as too large without being run.
+
+Results are cached under ``paths.BATCH_SIZE_CACHE``, keyed by a fingerprint
+of the hardware and a hash of the model/data config, so repeated runs on the
+same machine skip the search.
+"""
+
+import gc
+import hashlib
+import json
+import logging
+import math
+import os
+import platform
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import lightning as L
+import torch
+
+from .. import paths
+from ..data.shared import LOADER_ARGS
+from .procfs import proc_bytes
+
+CACHE_VERSION = 1
+
+
+@dataclass
+class BatchSizeResult:
+    """Outcome of a batch size search."""
+
+    max_batch_size: int
+    batch_size: int
+    accumulate_grad_batches: int
+    device: str
+    peak_bytes: Optional[int]
+    trials: List[Tuple[int, Optional[int]]] = field(default_factory=list)
+
+    def settings(self) -> Dict[str, Any]:
+        """The result as dotted config overrides."""
+        return {
+            "data.init_args.batch_size": self.batch_size,
+            "trainer.accumulate_grad_batches": self.accumulate_grad_batches,
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def probe_device(trainer_kwargs: Optional[Dict[str, Any]] = None) -> torch.device:
+    """Device the probe runs on for these Trainer arguments."""
+    accelerator = (trainer_kwargs or {}).get("accelerator", "auto")
+    if accelerator in ("auto", "gpu", "cuda") and torch.cuda.is_available():
+        return torch.device("cuda")
+    return torch.device("cpu")
+
+
+def hardware_fingerprint(device: torch.device) -> Dict[str, Any]:
+    """What determines how large a batch fits: accelerator, memory and software versions."""
+    fingerprint: Dict[str, Any] = {
+        "torch": torch.__version__,
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+    }
+    if device.type == "cuda":
+        props = torch.cuda.get_device_properties(device)
+        fingerprint.update(gpu=props.name, gpu_memory=props.total_memory, cuda=torch.version.cuda)
+    else:
+        fingerprint["ram"] = _meminfo_bytes("MemTotal")
+    return fingerprint
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Hash of the config parts that change memory use per sample.
+
+    Loader-only data args (batch size, workers, ...) are left out, so e.g.
+    retuned workers still hit the cache.
+    """
+    data = config.get("data") or {}
+    data_args = {k: v for k, v in (data.get("init_args") or {}).items() if k not in LOADER_ARGS}
+    trainer = config.get("trainer") or {}
+    payload = {
+        "model": config.get("model"),
+        "data": {"class_path": data.get("class_path"), "init_args": data_args},
+        "precision": trainer.get("precision"),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def cache_path(config: Dict[str, Any], device: torch.device, **options: Any) -> Path:
+    """Cache file for ``config`` on this hardware with these search options."""
+    payload = json.dumps(
+        {"hardware": hardware_fingerprint(device), "options": options}, sort_keys=True
+    )
+    hardware = hashlib.sha256(payload.encode()).hexdigest()[:16]
+    return paths.BATCH_SIZE_CACHE / f"{config_hash(config)}-{hardware}.json"
+
+
+def load_cached(path: Path) -> Optional[BatchSizeResult]:
+    """The cached result at ``path``, or None if missing or unreadable."""
+    try:
+        data = json.loads(path.read_text())
+        if data.pop("version") != CACHE_VERSION:
+            return None
+        data["trials"] = [tuple(t) for t in data["trials"]]
+        return BatchSizeResult(**data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached(path: Path, result: BatchSizeResult) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"version": CACHE_VERSION, **result.as_dict()}, indent=2))
+
+
+def accumulation_for(max_batch_size: int, target_batch_size: int) -> Tuple[int, int]:
+    """(batch_size, accumulate_grad_batches) reaching ``target_batch_size`` per step.
+
+    Uses the fewest accumulation steps, then the smallest batch that still
+    reaches the target, so the effective batch overshoots as little as possible.
+    """
+    accumulate = max(1, math.ceil(target_batch_size / max_batch_size))
+    return math.ceil(target_batch_size / accumulate), accumulate
+
+
+def find_batch_size(
+    model: L.LightningModule,
+    datamodule: L.LightningDataModule,
+    trainer_kwargs: Optional[Dict[str, Any]] = None,
+    start: int = 1,
+    max_batch_size: Optional[int] = None,
+    ram_budget_bytes: Optional[int] = None,
+    margin: float = 0.1,
+    target_batch_size: Optional[int] = None,
+    steps: int = 2,
+    log: Optional[Callable[[str], None]] = None,
+) -> BatchSizeResult:
+    """Find the largest batch ``model`` can train on with ``datamodule``'s data.
+
+    Args:
+        model: Model to probe (its weights are updated by the probe steps)
+        datamodule: Datamodule whose ``batch_size`` is varied
+        trainer_kwargs: Trainer arguments for the probe (accelerator, precision, ...)
+        start: First batch size tried
+        max_batch_size: Upper bound (default: the train dataset size)
+        ram_budget_bytes: CPU only, peak RSS allowed (default: RSS now + 80% of
+            available memory)
+        margin: Fraction taken off the largest fitting batch, as headroom for
+            fragmentation and longer sequences later in training
+        target_batch_size: Effective batch to reach with gradient accumulation
+            (default: the recommended batch size, no accumulation)
+        steps: Training steps per probe
+        log: Progress callback (e.g. print), or None
+
+    Returns:
+        The search result
+    """
+    trainer_kwargs = dict(trainer_kwargs or {})
+    on_cuda = probe_device(trainer_kwargs).type == "cuda"
+    if not on_cuda:
+        trainer_kwargs["accelerator"] = "cpu"
+        if ram_budget_bytes is None:
+            ram_budget_bytes = (_status_bytes("VmRSS") or 0) + int(
+                0.8 * (_meminfo_bytes("MemAvailable") or 0)
+            )
+    trainer_kwargs.setdefault("devices", 1)
+
+    if max_batch_size is None:
+        dataset = getattr(datamodule, "train_dataset", None)
+        if dataset is None:
+            datamodule.setup("fit")
+            dataset = datamodule.train_dataset
+        max_batch_size = len(dataset)
+
+    saved = {k: getattr(datamodule, k) for k in ("batch_size", "num_workers", "persistent_workers")}
+    datamodule.num_workers, datamodule.persistent_workers = 0, False
+    # Each probe builds a Trainer; keep its setup messages out of the progress log
+    lightning_logger = logging.getLogger("lightning.pytorch")
+    saved_level = lightning_logger.level
+    lightning_logger.setLevel(logging.WARNING)
+    trials: List[Tuple[int, Optional[int]]] = []
+
+    def fits(batch_size: int) -> bool:
+        predicted = None if on_cuda else _predict_peak(trials, batch_size, ram_budget_bytes)
+        if predicted is not None and predicted > ram_budget_bytes:
+            # Running it could get the process OOM-killed before the budget is checked
+            if log is not None:
+                memory = f"predicted {predicted / 2**20:,.0f} MB"
+                log(f"  batch_size={batch_size:<6} {memory:>18}  too large (not run)")
+            return False
+
+        peak = _probe(model, datamodule, batch_size, trainer_kwargs, steps, on_cuda)
+        ok = peak is not None and (ram_budget_bytes is None or peak <= ram_budget_bytes)
+        trials.append((batch_size, peak))
+        if log is not None:
+            memory = "OOM" if peak is None else f"peak {peak / 2**20:,.0f} MB"
+            log(f"  batch_size={batch_size:<6} {memory:>18}  {'fits' if ok else 'too large'}")
+        return ok
+
+    try:
+        good, bad = 0, None
+        size = min(start, max_batch_size)
+        while fits(size):
+            good = size
+            if size >= max_batch_size:
+                break
+            size = min(size * 2, max_batch_size)
+        else:
+            bad = size
+        while bad is not None and bad - good > 1:
+            mid = (good + bad) // 2
+            if fits(mid):
+                good = mid
+            else:
+                bad = mid
+    finally:
+        for key, value in saved.items():
+            setattr(datamodule, key, value)
+        lightning_logger.setLevel(saved_level)
+
+    if good == 0:
+        raise RuntimeError(f"Even batch_size={min(start, max_batch_size)} does not fit")
+    recommended = max(1, int(good * (1.0 - margin)))
+    batch_size, accumulate = accumulation_for(recommended, target_batch_size or recommended)
+    return BatchSizeResult(
+        max_batch_size=good,
+        batch_size=batch_size,
+        accumulate_grad_batches=accumulate,
+        device="cuda" if on_cuda else "cpu",
+        peak_bytes=dict(trials).get(good),
+        trials=trials,
+    )
+
+
+def _probe(
+    model: L.LightningModule,
+    datamodule: L.LightningDataModule,
+    batch_size: int,
+    trainer_kwargs: Dict[str, Any],
+    steps: int,
+    on_cuda: bool,
+) -> Optional[int]:
+    """Peak memory of ``steps`` training steps at ``batch_size`` (None on OOM)."""
+    datamodule.batch_size = batch_size
+    trainer = L.Trainer(
+        max_steps=steps,
+        limit_val_batches=0,
+        num_sanity_val_steps=0,
+        logger=False,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        **trainer_kwargs,
+    )
+    if on_cuda:
+        torch.cuda.empty_cache()
+        torch.cuda.reset_peak_memory_stats()
+    else:
+        _reset_peak_rss()
+    try:
+        trainer.fit(model, datamodule=datamodule)
+    except torch.cuda.OutOfMemoryError:
+        return None
+    except RuntimeError as e:
+        if "out of memory" not in str(e):
+            raise
+        return None
+    finally:
+        del trainer
+        gc.collect()
+        if on_cuda:
+            torch.cuda.empty_cache()
+    return torch.cuda.max_memory_allocated() if on_cuda else _status_bytes("VmHWM")
+
+
+def _predict_peak(
+    trials: List[Tuple[int, Optional[int]]], batch_size: int, budget: Optional[int]
+) -> Optional[int]:
+    """Peak at ``batch_size``, extrapolated linearly from the two largest batches that fit.
+
+    None until two batches have fit. The slope is clamped at zero, so noise at
+    small batch sizes can only make the prediction optimistic (and the batch run).
+    """
+    if budget is None:
+        return None
+    fitted = sorted((size, peak) for size, peak in trials if peak is not None and peak <= budget)
+    if len(fitted) < 2:
+        return None
+    (small, small_peak), (large, large_peak) = fitted[-2:]
+    per_sample = max(0.0, (large_peak - small_peak) / (large - small))
+    return int(large_peak + per_sample * (batch_size - large))
+
+
+def _reset_peak_rss() -> None:
+    """Reset this process's peak RSS (VmHWM) so the next probe measures its own peak."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass  # not Linux or not permitted: the peak only over-estimates
+
+
+def _status_bytes(key: str) -> Optional[int]:
+    """A ``kB`` field of /proc/self/status, in bytes."""
+    return proc_bytes("/proc/self/status", key)
+
+
+def _meminfo_bytes(key: str) -> Optional[int]:
+    """A ``kB`` field of /proc/meminfo, in bytes."""
+    return proc_bytes("/proc/meminfo", key)
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or f"{os.cpu_count()} CPUs"
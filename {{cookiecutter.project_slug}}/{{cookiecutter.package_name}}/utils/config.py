@@ -0,0 +1,81 @@
+"""Config helpers for {{cookiecutter.project_name}} scripts.
+
+Tools that work outside the training CLI (benchmarks, tuners, exporters) use
+these to read the same YAML the train script uses and to write override YAML
+files that can be layered on top of it with a second ``--config``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import yaml
+
+
+def load_config(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a LightningCLI YAML config as a dict."""
+    with open(path) as f:
+        return yaml.safe_load(f) or {}
+
+
+def instantiate(section: Dict[str, Any], base_class: type, **init_overrides: Any) -> Any:
+    """Instantiate a ``class_path``/``init_args`` config section.
+
+    Values are parsed against the class signature with jsonargparse, exactly as
+    LightningCLI does, so e.g. ``learning_rate: 1e-4`` becomes a float.
+
+    Args:
+        section: Config section such as ``config["data"]``
+        base_class: Expected base class (e.g. BaseDataModule)
+        **init_overrides: Values that replace entries in ``init_args``
+
+    Returns:
+        The instantiated object
+    """
+    from jsonargparse import ArgumentParser
+
+    section = {
+        "class_path": section["class_path"],
+        "init_args": {**(section.get("init_args") or {}), **init_overrides},
+    }
+    parser = ArgumentParser(exit_on_error=False)
+    parser.add_subclass_arguments(base_class, "obj")
+    cfg = parser.parse_object({"obj": section})
+    return parser.instantiate_classes(cfg).obj
+
+
+def write_overrides(
+    path: Union[str, Path],
+    overrides: Dict[str, Any],
+    header: Optional[str] = None,
+) -> Path:
+    """Write dotted-key overrides as a nested YAML config.
+
+    ``{"data.init_args.num_workers": 8}`` is written as::
+
+        data:
+          init_args:
+            num_workers: 8
+
+    Args:
+        path: Output YAML path
+        overrides: Mapping from dotted config keys to values
+        header: Optional comment block written at the top of the file
+
+    Returns:
+        Path to the written file
+    """
+    nested: Dict[str, Any] = {}
+    for key, value in overrides.items():
+        node = nested
+        *parents, leaf = key.split(".")
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        if header:
+            f.writelines(f"# {line}\n".replace("# \n", "#\n") for line in header.splitlines())
+        yaml.safe_dump(nested, f, sort_keys=False)
+    return path
@@ -0,0 +1,30 @@
+"""Process memory readings from Linux ``/proc`` for {{cookiecutter.project_name}}.
+
+Every reader returns None when the file or field is missing (other
+platforms, or a process that has exited), so callers can skip the metric.
+"""
+
+import os
+from typing import Optional
+
+
+def proc_bytes(path: str, key: str) -> Optional[int]:
+    """A ``kB`` field of a /proc status-style file (``status``, ``meminfo``, ...), in bytes."""
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(f"{key}:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+def rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Resident set size of a process (default: this one)."""
+    return proc_bytes(f"/proc/{pid or os.getpid()}/status", "VmRSS")
+
+
+def pss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Proportional set size: resident pages, with shared ones split among their sharers."""
+    return proc_bytes(f"/proc/{pid or os.getpid()}/smaps_rollup", "Pss")